@@ -1,5 +1,6 @@
 # analysis_processor.py
 
+from engine.dominio import Caso
 from engine.pressio_engine import realizar_analise_completa
 
 def processar_analise_para_relatorio(dados_entrada):
@@ -18,17 +19,12 @@ def processar_analise_para_relatorio(dados_entrada):
     # --- 2. EXTRAI OS DADOS NECESSÁRIOS DO RESULTADO BRUTO E DOS DADOS DE ENTRADA ---
     try:
         # Recalcula as variáveis base para os cálculos do relatório
-        C = float(dados_entrada.get('c', 0).replace(',', '.'))
-        L_real = float(dados_entrada.get('l_real', 0).replace(',', '.'))
-        B = float(dados_entrada.get('b', 0).replace(',', '.'))
-        H = float(dados_entrada.get('d', 0).replace(',', '.'))
-        F = float(dados_entrada.get('p_tf', 0).replace(',', '.'))
-        qa_pascals = float(dados_entrada.get('qa', 0).replace(',', '.')) * 98100
-        
-        p_newtons = F * 9810
-        volume = L_real * B * H
-        rho = float(dados_entrada.get('densidade', 0).replace(',', '.'))
-        w_newtons = (volume * rho) * 9.81
+        caso = Caso.de_dados(dados_entrada)
+        C = caso.carga.c
+        L_real, B, H = caso.mat.l_real, caso.mat.b, caso.mat.d
+        qa_pascals = caso.solo.qa_pascals
+        p_newtons = caso.carga.p_newtons
+        w_newtons = caso.w_newtons
 
         # Extrai os dados da lista 'analises_leff' que o engine retorna
         analises = resultado_bruto.get('analises_leff', [])
@@ -83,6 +79,7 @@ def processar_analise_para_relatorio(dados_entrada):
         'pressao_total_kgf': f"{pressao_total_kgf:.2f}",
         'pressao_dispersa_kgf': f"{pressao_dispersa_kgf:.2f}",
         'pressao_final_kgf': f"{pressao_final_kgf:.2f}",
+        'status_geral': resultado_bruto['resumo_comparativo']['status_geral'],
         'sucesso': True
     }
     return relatorio_final
\ No newline at end of file
@@ -1,6 +1,7 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from engine.pressio_engine import realizar_analise_completa
+from engine.versao import versao_engine_hex, versao_material
 
 
 # --- VIEWS DO FLUXO DE INSERÇÃO DE DADOS ---
@@ -69,6 +70,11 @@ def calcular_view(request):
         # 2. Envia os dados para o nosso motor de cálculo para fazer a análise completa.
         resultados = realizar_analise_completa(dados_para_engine)
 
+        # Registra qual versão do engine e do material produziu o resultado salvo.
+        resultados['versao_engine'] = versao_engine_hex()
+        if resultados.get('sucesso'):
+            resultados['versao_material'] = f"{int(versao_material(dados_para_engine)[0]):016x}"
+
         # 3. Guarda os resultados na sessão para serem exibidos na página seguinte.
         #    Isso evita que os dados se percam se o usuário atualizar a página de resultados.
         request.session['resultados_finais'] = resultados
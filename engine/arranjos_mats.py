@@ -0,0 +1,209 @@
+# engine/arranjos_mats.py
+
+"""
+Enumeração de arranjos de mats sob uma patola.
+
+O engine verifica um único mat de largura B. Em campo são usados de 2 a 5
+mats lado a lado, ou duas camadas cruzadas. Para cada arranjo a geometria
+efetiva é levada de volta ao método 3:
+
+- camada única com n mats lado a lado: vão L, largura n·B (ou, com o mat
+  girado, vão B e largura n·L);
+- duas camadas cruzadas: a camada superior (n_s mats) é verificada com a
+  largura C da sapata e vão limitado à largura total da camada inferior;
+  a camada inferior (n_i mats) recebe a carga mais o peso da superior numa
+  largura C_eff = n_s·B_s (limitada ao seu vão).
+
+Por segurança, a camada superior é verificada contra o qa do solo (o apoio
+real, sobre a camada inferior, é mais rígido).
+
+Hipótese da camada equivalente: n mats lado a lado trabalham como um único
+mat de largura somada, o que exige que a sapata cubra todos eles (largura
+da sapata >= largura da camada) e os carregue por igual. É o caso de mats
+iguais sob uma sapata rígida centrada, em que a partilha de
+engine/winkler_multimat.py dá 1/n a cada mat. Com sapata estreita,
+excêntrica ou flexível, ou mats diferentes, a partilha é desigual e a
+camada equivalente é contra a segurança: use `MultiMat.load_share` nesses
+casos.
+
+Todos os arranjos são avaliados de forma vetorizada sobre as patolas do
+plano. Como são ordenados pelo peso, a avaliação em blocos encerra cada
+patola no primeiro arranjo aprovado e descarta os mais pesados sem avaliá-los.
+"""
+
+from itertools import product
+
+import numpy as np
+
+from engine.catalogo import buscar_madeira
+from engine.cenarios import especializar
+from engine.dominio import GRAVIDADE, TF_PARA_N, converter_decimal
+
+MAX_MATS_POR_CAMADA = 5
+TAMANHO_BLOCO = 64
+
+LONGITUDINAL = 'longitudinal'
+TRANSVERSAL = 'transversal'
+CRUZADO = 'cruzado'
+
+_COLUNAS_CAMADA = ('l_real', 'b', 'd', 'densidade', 'fb', 'fv', 'e_gpa')
+
+
+# --- ESTOQUE ---
+def _item_estoque(item):
+    """
+    Normaliza um item do estoque: nome, l_real, b, d (m), quantidade e
+    material, dado pelo nome do catálogo ou por um dicionário com fb, fv,
+    e_gpa e densidade.
+    """
+    material = item['material']
+    if isinstance(material, str):
+        encontrado = buscar_madeira(material)
+        if encontrado is None:
+            raise ValueError(f"Classe de madeira desconhecida: {material}")
+        material = encontrado
+    normalizado = {campo: converter_decimal(item[campo]) for campo in ('l_real', 'b', 'd')}
+    normalizado.update({campo: converter_decimal(material[campo]) for campo in ('densidade', 'fb', 'fv', 'e_gpa')})
+    normalizado['nome'] = item.get('nome', '')
+    normalizado['quantidade'] = int(converter_decimal(item.get('quantidade', MAX_MATS_POR_CAMADA)))
+    return normalizado
+
+
+def _camada(item, n, orientacao, vao_maximo=np.inf):
+    """
+    Geometria equivalente de n mats lado a lado (um mat de largura somada,
+    ver a hipótese da camada equivalente no início do módulo).
+    """
+    vao, largura = (item['l_real'], item['b']) if orientacao == LONGITUDINAL else (item['b'], item['l_real'])
+    camada = {campo: item[campo] for campo in _COLUNAS_CAMADA}
+    camada['l_real'] = min(vao, vao_maximo)
+    camada['b'] = n * largura
+    return camada
+
+
+# --- ENUMERAÇÃO ---
+def enumerar_arranjos(estoque, max_mats=MAX_MATS_POR_CAMADA, camadas=(1, 2)):
+    """
+    Enumera os arranjos possíveis com o estoque e devolve colunas (arrays)
+    ordenadas pelo peso total: geometria da camada superior (`sup_*`), da
+    inferior (`inf_*`, com `inf_presente` e `inf_c`), `peso_kg` e `descricao`.
+    """
+    itens = [_item_estoque(item) for item in estoque]
+    linhas = []  # (descrição, camada superior, camada inferior, C efetivo, massa)
+
+    def limite(item):
+        return min(max_mats, item['quantidade'])
+
+    def massa(item, n):
+        return n * item['l_real'] * item['b'] * item['d'] * item['densidade']
+
+    if 1 in camadas:
+        for item, orientacao in product(itens, (LONGITUDINAL, TRANSVERSAL)):
+            if orientacao == TRANSVERSAL and item['b'] == item['l_real']:
+                continue
+            for n in range(1, limite(item) + 1):
+                linhas.append((f"{n}× {item['nome']} ({orientacao})", _camada(item, n, orientacao),
+                               None, np.nan, massa(item, n)))
+
+    if 2 in camadas:
+        for (i_sup, sup), (i_inf, inf) in product(enumerate(itens), repeat=2):
+            for n_sup, n_inf in product(range(1, limite(sup) + 1), range(1, limite(inf) + 1)):
+                if i_sup == i_inf and n_sup + n_inf > sup['quantidade']:
+                    continue
+                linhas.append((
+                    f"{n_sup}× {sup['nome']} sobre {n_inf}× {inf['nome']} ({CRUZADO})",
+                    _camada(sup, n_sup, LONGITUDINAL, vao_maximo=n_inf * inf['b']),
+                    _camada(inf, n_inf, LONGITUDINAL),
+                    min(n_sup * sup['b'], inf['l_real']),
+                    massa(sup, n_sup) + massa(inf, n_inf),
+                ))
+
+    vazia = dict.fromkeys(_COLUNAS_CAMADA, np.nan)
+    arranjos = {'descricao': np.array([linha[0] for linha in linhas], dtype=object)}
+    for campo in _COLUNAS_CAMADA:
+        arranjos[f'sup_{campo}'] = np.array([linha[1][campo] for linha in linhas])
+        arranjos[f'inf_{campo}'] = np.array([(linha[2] or vazia)[campo] for linha in linhas])
+    arranjos['inf_presente'] = np.array([linha[2] is not None for linha in linhas])
+    arranjos['inf_c'] = np.array([linha[3] for linha in linhas])
+    arranjos['peso_kg'] = np.array([linha[4] for linha in linhas])
+
+    ordem = np.argsort(arranjos['peso_kg'], kind='stable')
+    return {nome: coluna[ordem] for nome, coluna in arranjos.items()}
+
+
+# --- AVALIAÇÃO VETORIZADA ---
+def _patolas_em_colunas(patolas):
+    return {campo: np.array([converter_decimal(patola[campo]) for patola in patolas]) for campo in ('c', 'p_tf', 'qa')}
+
+
+def avaliar_arranjos(arranjos, patolas):
+    """
+    Verifica todos os arranjos (linhas) contra todas as patolas (colunas) de
+    uma vez. `patolas` é uma lista de dicionários com c, p_tf e qa (ou as
+    colunas já convertidas). Devolve as saídas do método 3 das duas camadas
+    com forma (n_arranjos, n_patolas) e o `aprovado` combinado.
+    """
+    if not isinstance(patolas, dict):
+        patolas = _patolas_em_colunas(patolas)
+    kernel = especializar()
+    c, p_tf, qa = (patolas[campo][np.newaxis, :] for campo in ('c', 'p_tf', 'qa'))
+
+    def coluna(prefixo, campo):
+        return arranjos[f'{prefixo}_{campo}'][:, np.newaxis]
+
+    superior = kernel(c=c, p_tf=p_tf, qa=qa, **{campo: coluna('sup', campo) for campo in _COLUNAS_CAMADA})
+
+    # Camada inferior: carga da patola mais o peso da camada superior, numa largura C_eff
+    peso_sup_tf = (coluna('sup', 'l_real') * coluna('sup', 'b') * coluna('sup', 'd')
+                   * coluna('sup', 'densidade') * GRAVIDADE / TF_PARA_N)
+    presente = arranjos['inf_presente'][:, np.newaxis]
+    geometria_inf = {campo: np.where(presente, coluna('inf', campo), coluna('sup', campo)) for campo in _COLUNAS_CAMADA}
+    inferior = kernel(c=np.where(presente, arranjos['inf_c'][:, np.newaxis], c),
+                      p_tf=p_tf + np.where(presente, peso_sup_tf, 0.0), qa=qa, **geometria_inf)
+
+    return {
+        'superior': superior,
+        'inferior': inferior,
+        'aprovado': superior['aprovado'] & (inferior['aprovado'] | ~presente),
+    }
+
+
+def melhor_arranjo(estoque, patolas, max_mats=MAX_MATS_POR_CAMADA, camadas=(1, 2), tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Arranjo aprovado mais leve para cada patola do plano (None quando nenhum
+    passa). Os arranjos são avaliados em blocos, do mais leve ao mais pesado,
+    só para as patolas ainda sem solução.
+    """
+    arranjos = enumerar_arranjos(estoque, max_mats=max_mats, camadas=camadas)
+    colunas = _patolas_em_colunas(patolas)
+    n_arranjos = len(arranjos['peso_kg'])
+    escolhido = np.full(len(patolas), -1)
+    pendentes = np.arange(len(patolas))
+    for inicio in range(0, n_arranjos, tamanho_bloco):
+        if pendentes.size == 0:
+            break
+        bloco = {nome: coluna[inicio:inicio + tamanho_bloco] for nome, coluna in arranjos.items()}
+        aprovado = avaliar_arranjos(bloco, {campo: valores[pendentes] for campo, valores in colunas.items()})['aprovado']
+        resolvidas = aprovado.any(axis=0)
+        escolhido[pendentes[resolvidas]] = inicio + np.argmax(aprovado[:, resolvidas], axis=0)
+        pendentes = pendentes[~resolvidas]
+
+    resultado = []
+    for j, indice in enumerate(escolhido):
+        if indice < 0:
+            resultado.append(None)
+            continue
+        linha = {nome: coluna[indice:indice + 1] for nome, coluna in arranjos.items()}
+        verificacao = avaliar_arranjos(linha, {campo: valores[j:j + 1] for campo, valores in colunas.items()})
+        camadas_verificadas = {'superior': verificacao['superior']}
+        if linha['inf_presente'][0]:
+            camadas_verificadas['inferior'] = verificacao['inferior']
+        resultado.append({
+            'descricao': linha['descricao'][0],
+            'peso_kg': float(linha['peso_kg'][0]),
+            'camadas': {
+                nome: {saida: valores[0, 0].item() for saida, valores in saidas.items()}
+                for nome, saidas in camadas_verificadas.items()
+            },
+        })
+    return resultado
@@ -0,0 +1,41 @@
+# engine/catalogo.py
+
+# --- CATÁLOGO DE CLASSES DE MADEIRA ---
+# Propriedades no mesmo formato de texto aceito por `realizar_analise_completa`:
+# fb e fv em MPa, e_gpa em GPa e densidade em kg/m³.
+CLASSES_DE_MADEIRA = [
+    {'nome': 'C14', 'fb': '14', 'fv': '3.0', 'e_gpa': '7', 'densidade': '290'},
+    {'nome': 'C16', 'fb': '16', 'fv': '3.2', 'e_gpa': '8', 'densidade': '310'},
+    {'nome': 'C18', 'fb': '18', 'fv': '3.4', 'e_gpa': '9', 'densidade': '320'},
+    {'nome': 'C20', 'fb': '20', 'fv': '3.6', 'e_gpa': '9.5', 'densidade': '330'},
+    {'nome': 'C22', 'fb': '22', 'fv': '3.8', 'e_gpa': '10', 'densidade': '340'},
+    {'nome': 'C24', 'fb': '24', 'fv': '4.0', 'e_gpa': '11', 'densidade': '350'},
+    {'nome': 'C27', 'fb': '27', 'fv': '4.0', 'e_gpa': '12', 'densidade': '370'},
+    {'nome': 'C30', 'fb': '30', 'fv': '4.0', 'e_gpa': '12', 'densidade': '380'},
+    {'nome': 'C35', 'fb': '35', 'fv': '4.0', 'e_gpa': '13', 'densidade': '400'},
+    {'nome': 'C40', 'fb': '40', 'fv': '4.0', 'e_gpa': '14', 'densidade': '420'},
+    {'nome': 'C45', 'fb': '45', 'fv': '4.0', 'e_gpa': '15', 'densidade': '440'},
+    {'nome': 'C50', 'fb': '50', 'fv': '4.0', 'e_gpa': '16', 'densidade': '460'},
+    {'nome': 'D18', 'fb': '18', 'fv': '3.4', 'e_gpa': '9.5', 'densidade': '475'},
+    {'nome': 'D24', 'fb': '24', 'fv': '4.0', 'e_gpa': '10', 'densidade': '485'},
+    {'nome': 'D30', 'fb': '30', 'fv': '4.0', 'e_gpa': '11', 'densidade': '530'},
+    {'nome': 'D35', 'fb': '35', 'fv': '4.0', 'e_gpa': '12', 'densidade': '540'},
+    {'nome': 'D40', 'fb': '40', 'fv': '4.0', 'e_gpa': '13', 'densidade': '560'},
+    {'nome': 'D50', 'fb': '50', 'fv': '4.0', 'e_gpa': '14', 'densidade': '620'},
+    {'nome': 'D60', 'fb': '60', 'fv': '4.5', 'e_gpa': '17', 'densidade': '700'},
+    {'nome': 'D70', 'fb': '70', 'fv': '5.0', 'e_gpa': '20', 'densidade': '900'},
+    {'nome': 'Pinus (Classe 1)', 'fb': '35', 'fv': '6.0', 'e_gpa': '11.0', 'densidade': '500'},
+    {'nome': 'Pinus (Classe 2)', 'fb': '27', 'fv': '3.5', 'e_gpa': '8.0', 'densidade': '400'},
+    {'nome': 'Pinus (Classe 3)', 'fb': '14', 'fv': '2.5', 'e_gpa': '5.0', 'densidade': '350'},
+    {'nome': 'Eucalyptus (Classe 1)', 'fb': '50', 'fv': '4', 'e_gpa': '14.0', 'densidade': '700'},
+    {'nome': 'Eucalyptus (Classe 2)', 'fb': '40', 'fv': '4', 'e_gpa': '13.0', 'densidade': '600'},
+    {'nome': 'Eucalyptus (Classe 3)', 'fb': '30', 'fv': '4', 'e_gpa': '11.0', 'densidade': '500'},
+]
+
+
+def buscar_madeira(nome):
+    """Devolve a classe de madeira pelo nome, ou None se não existir no catálogo."""
+    for madeira in CLASSES_DE_MADEIRA:
+        if madeira['nome'] == nome:
+            return madeira
+    return None
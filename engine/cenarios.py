@@ -0,0 +1,169 @@
+# engine/cenarios.py
+
+"""
+Avaliadores especializados (avaliação parcial) do método 3 para cenários fixos.
+
+As consultas mais comuns mantêm guindaste, sapata e mat fixos e variam só o
+solo, ou mantêm o solo fixo e variam só a carga. `especializar` recebe o
+subconjunto fixo das entradas, calcula uma única vez todos os termos que só
+dependem dele (modulo_de_seccao, momento_de_inercia, mn, vn, constante da
+deformação, w_newtons e, quando possível, os próprios Leff) e devolve um
+kernel vetorizado que avalia apenas o que depende das entradas variáveis.
+
+As fórmulas de Leff abaixo são a forma vetorizada das de
+`calcular_metodo_leff_efetivo`, que continua sendo a referência certificada
+(os testes comparam as duas). O veredito aplica o mesmo arredondamento a uma
+casa que o engine usa na verificação do solo.
+
+Os kernels ficam em cache pela chave do cenário, para reaproveitamento entre
+requisições repetidas da aplicação web.
+
+Exemplo:
+    kernel = especializar(c='0,6', p_tf='100', l_real='4.216', b='2.372', d='0.3',
+                          densidade='350', fb='24', fv='4', e_gpa='11')
+    resultado = kernel(qa=np.linspace(0.4, 5.0, 1000))
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from engine.dominio import CAMPOS_ENTRADA, GRAVIDADE, KGFCM2_PARA_PA, TF_PARA_N, converter_decimal
+
+TAMANHO_CACHE = 256
+
+
+# --- FÓRMULAS VETORIZADAS DO MÉTODO 3 ---
+def _maior_raiz(a, b, c):
+    """Maior raiz de a·x² + b·x + c; infinito sem raiz real ou com a = 0 (como no engine)."""
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (a, b, c)))
+    disc = b ** 2 - 4 * a * c
+    valida = (disc >= 0) & (a != 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        raiz = (-b + np.sqrt(np.where(valida, disc, 0.0))) / (2 * a)
+    return np.where(valida, raiz, np.inf)
+
+
+def leff_flexao(a, c, w_newtons, mn):
+    return _maior_raiz(a, (-2 * a * c) - w_newtons, (a * c ** 2) + (2 * c * w_newtons) - (8 * mn))
+
+
+def leff_cisalhamento(a, c, h, w_newtons, vn):
+    return _maior_raiz(a, (-2 * vn) - (a * c) - (2 * a * h) - w_newtons, (w_newtons * c) + (2 * w_newtons * h))
+
+
+def leff_deflexao(rigidez_deflexao, a, c):
+    denominador = 0.9 * a
+    with np.errstate(divide='ignore', invalid='ignore'):
+        termo_interno = np.where(denominador > 0, rigidez_deflexao / denominador, 0.0)
+    return (2 * termo_interno ** (1 / 3.0)) + c
+
+
+def _perc_capacidade_solo(p_newtons, w_newtons, leff_operacional, b, qa_pascals):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        qt = np.where(leff_operacional * b > 0, (p_newtons + w_newtons) / (leff_operacional * b), 0.0)
+        return np.where(qa_pascals > 0, (qt / qa_pascals) * 100, 0.0)
+
+
+def _limite_perc_solo():
+    """Menor valor que o engine, ao formatar com uma casa ('.1f'), lê como acima de 100%."""
+    valor = 100.05
+    while f"{valor:.1f}" != '100.0':
+        valor = np.nextafter(valor, 0.0)
+    while f"{valor:.1f}" == '100.0':
+        valor = np.nextafter(valor, np.inf)
+    return float(valor)
+
+
+# O engine arredonda o percentual a uma casa antes de compará-lo com 100%
+LIMITE_PERC_SOLO = _limite_perc_solo()
+
+
+def _aprovado(leff_minimo, l_real, perc_solo):
+    return (leff_minimo <= l_real) & ~(perc_solo >= LIMITE_PERC_SOLO)
+
+
+def _perc_comprimento_ativo(leff_minimo, l_real):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(l_real > 0, (leff_minimo / l_real) * 100, 0.0)
+
+
+# --- GRAFO DE DEPENDÊNCIAS ---
+# (nome, dependências, função); a ordem é topológica.
+NOS = (
+    ('p_newtons', ('p_tf',), lambda p_tf: p_tf * TF_PARA_N),
+    ('qa_pascals', ('qa',), lambda qa: qa * KGFCM2_PARA_PA),
+    ('w_newtons', ('l_real', 'b', 'd', 'densidade'), lambda l_real, b, d, densidade: (l_real * b * d * densidade) * GRAVIDADE),
+    ('mn', ('fb', 'b', 'd'), lambda fb, b, d: (fb * 1e6) * ((b * d ** 2) / 6)),
+    ('vn', ('fv', 'b', 'd'), lambda fv, b, d: ((fv * 1e6) * b * d) / 1.5),
+    ('rigidez_deflexao', ('e_gpa', 'b', 'd'), lambda e_gpa, b, d: 0.06 * (e_gpa * 1e9) * ((b * d ** 3) / 12)),
+    ('a', ('qa_pascals', 'b'), lambda qa_pascals, b: qa_pascals * b),
+    ('leff_flexao', ('a', 'c', 'w_newtons', 'mn'), leff_flexao),
+    ('leff_cisalhamento', ('a', 'c', 'd', 'w_newtons', 'vn'), leff_cisalhamento),
+    ('leff_deflexao', ('rigidez_deflexao', 'a', 'c'), leff_deflexao),
+    ('leff_minimo_calculado', ('leff_flexao', 'leff_cisalhamento', 'leff_deflexao'),
+     lambda f, v, d: np.minimum(np.minimum(f, v), d)),
+    ('leff_operacional', ('leff_minimo_calculado', 'l_real'), np.minimum),
+    ('perc_comprimento_ativo', ('leff_minimo_calculado', 'l_real'), _perc_comprimento_ativo),
+    ('perc_capacidade_solo', ('p_newtons', 'w_newtons', 'leff_operacional', 'b', 'qa_pascals'), _perc_capacidade_solo),
+    ('aprovado', ('leff_minimo_calculado', 'l_real', 'perc_capacidade_solo'), _aprovado),
+)
+
+SAIDAS = ('leff_flexao', 'leff_cisalhamento', 'leff_deflexao', 'leff_minimo_calculado',
+          'perc_comprimento_ativo', 'perc_capacidade_solo', 'aprovado')
+
+
+class Kernel:
+    """
+    Avaliador especializado: `constantes` guarda os nós dobrados a partir das
+    entradas fixas e `passos` os nós que ainda dependem das entradas variáveis.
+    """
+
+    def __init__(self, fixos):
+        self.fixos = dict(fixos)
+        self.variaveis = tuple(campo for campo in CAMPOS_ENTRADA if campo not in self.fixos)
+        self.constantes = dict(self.fixos)
+        self.passos = []
+        for nome, dependencias, funcao in NOS:
+            if all(dep in self.constantes for dep in dependencias):
+                self.constantes[nome] = funcao(*(self.constantes[dep] for dep in dependencias))
+            else:
+                self.passos.append((nome, dependencias, funcao))
+
+    def __repr__(self):
+        return f"Kernel(variaveis={self.variaveis}, passos={[nome for nome, _, _ in self.passos]})"
+
+    def __call__(self, **variaveis):
+        faltantes = set(self.variaveis) - set(variaveis)
+        if faltantes:
+            raise KeyError(f"Entradas variáveis ausentes: {', '.join(sorted(faltantes))}")
+        valores = dict(self.constantes)
+        for campo in self.variaveis:
+            valores[campo] = np.asarray(variaveis[campo], dtype=np.float64)
+        for nome, dependencias, funcao in self.passos:
+            valores[nome] = funcao(*(valores[dep] for dep in dependencias))
+        forma = np.broadcast_shapes(*(np.shape(valores[campo]) for campo in self.variaveis)) if self.variaveis else ()
+        return {nome: np.broadcast_to(valores[nome], forma) for nome in SAIDAS}
+
+
+# --- CACHE POR CENÁRIO ---
+def chave_cenario(fixos):
+    """Chave canônica (ordenada e numérica) de um conjunto de entradas fixas."""
+    desconhecidos = set(fixos) - set(CAMPOS_ENTRADA)
+    if desconhecidos:
+        raise KeyError(f"Entradas desconhecidas: {', '.join(sorted(desconhecidos))}")
+    return tuple(sorted((campo, converter_decimal(valor)) for campo, valor in fixos.items()))
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def _kernel_em_cache(chave):
+    return Kernel(dict(chave))
+
+
+def especializar(**fixos):
+    """Devolve (do cache, quando possível) o kernel para as entradas fixas informadas."""
+    return _kernel_em_cache(chave_cenario(fixos))
+
+
+def informacoes_cache():
+    return _kernel_em_cache.cache_info()
@@ -0,0 +1,242 @@
+# engine/dominio.py
+
+"""
+Objetos de valor das entradas do engine (carga na patola, mat, material e solo).
+
+As entradas chegam da web e dos scripts como textos no formato pt-BR
+('0,6', '1.234,5'); aqui elas são convertidas uma única vez para objetos
+imutáveis com __slots__. As grandezas derivadas (módulo de seção, inércia,
+peso próprio, conversões para o SI) são calculadas no primeiro acesso e
+guardadas no próprio objeto.
+
+Para lotes, `casos_para_array` copia os objetos uma única vez para um array
+estruturado NumPy (DTYPE_CASO); a partir daí as colunas são visões sem cópia
+(`arr['qa']`). `casos_de_buffer` interpreta um buffer já existente (bytes,
+memória compartilhada) como DTYPE_CASO sem copiar, e `Caso.de_registro`
+lê uma linha desse array.
+"""
+
+import numpy as np
+
+# --- CONSTANTES DE CONVERSÃO (as mesmas usadas no engine) ---
+TF_PARA_N = 9810
+KGFCM2_PARA_PA = 98100
+GRAVIDADE = 9.81
+
+# Chaves do dicionário de entrada, na ordem das colunas de DTYPE_CASO
+CAMPOS_ENTRADA = ('c', 'p_tf', 'qa', 'l_real', 'b', 'd', 'densidade', 'fb', 'fv', 'e_gpa')
+
+DTYPE_CASO = np.dtype([(campo, np.float64) for campo in CAMPOS_ENTRADA])
+
+
+# --- CONVERSÃO DE DECIMAIS ---
+def converter_decimal(valor, padrao=None):
+    """
+    Converte um valor de entrada em float, aceitando vírgula decimal.
+    Com vírgula presente, pontos são tratados como separador de milhar
+    ('1.234,5' -> 1234.5); sem vírgula o ponto é decimal ('4.216' -> 4.216).
+    Valor ausente (None) vira `padrao` quando informado; sem padrão, assim
+    como texto vazio ou inválido, gera ValueError.
+    """
+    if valor is None:
+        if padrao is None:
+            raise ValueError("Valor ausente.")
+        return padrao
+    if isinstance(valor, (int, float)):
+        return float(valor)
+    try:
+        return float(valor)
+    except ValueError:
+        pass
+    texto = valor.strip().replace('\xa0', '').replace(' ', '')
+    if ',' in texto:
+        texto = texto.replace('.', '').replace(',', '.')
+    return float(texto)
+
+
+# --- INFRAESTRUTURA DOS OBJETOS DE VALOR ---
+class _cacheado:
+    """Propriedade calculada uma vez e guardada no slot '_<nome>' do objeto."""
+
+    def __init__(self, funcao):
+        self.funcao = funcao
+        self.slot = '_' + funcao.__name__
+        self.__doc__ = funcao.__doc__
+
+    def __get__(self, instancia, dono=None):
+        if instancia is None:
+            return self
+        try:
+            return object.__getattribute__(instancia, self.slot)
+        except AttributeError:
+            valor = self.funcao(instancia)
+            object.__setattr__(instancia, self.slot, valor)
+            return valor
+
+
+class _ValorImutavel:
+    __slots__ = ()
+    _campos = ()
+
+    def __init__(self, *args, **kwargs):
+        valores = dict(zip(self._campos, args))
+        valores.update(kwargs)
+        for campo in self._campos:
+            object.__setattr__(self, campo, valores[campo])
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def __delattr__(self, nome):
+        raise AttributeError(f"{type(self).__name__} é imutável")
+
+    def _valores(self):
+        return tuple(getattr(self, campo) for campo in self._campos)
+
+    def __eq__(self, outro):
+        return type(self) is type(outro) and self._valores() == outro._valores()
+
+    def __hash__(self):
+        return hash((type(self).__name__,) + self._valores())
+
+    def __repr__(self):
+        argumentos = ', '.join(f"{campo}={getattr(self, campo)!r}" for campo in self._campos)
+        return f"{type(self).__name__}({argumentos})"
+
+
+# --- OBJETOS DE DOMÍNIO ---
+class CargaPatola(_ValorImutavel):
+    """Carga do guindaste na patola: largura da sapata C (m) e carga (tf)."""
+    __slots__ = ('c', 'p_tf', '_p_newtons')
+    _campos = ('c', 'p_tf')
+
+    @_cacheado
+    def p_newtons(self):
+        return self.p_tf * TF_PARA_N
+
+
+class Mat(_ValorImutavel):
+    """Geometria do mat: comprimento real, largura B e espessura H (m)."""
+    __slots__ = ('l_real', 'b', 'd', '_volume', '_modulo_de_seccao', '_momento_de_inercia')
+    _campos = ('l_real', 'b', 'd')
+
+    @_cacheado
+    def volume(self):
+        return self.l_real * self.b * self.d
+
+    @_cacheado
+    def modulo_de_seccao(self):
+        return (self.b * self.d ** 2) / 6
+
+    @_cacheado
+    def momento_de_inercia(self):
+        return (self.b * self.d ** 3) / 12
+
+
+class Material(_ValorImutavel):
+    """Madeira: fb e fv em MPa, E em GPa e densidade em kg/m³."""
+    __slots__ = ('fb', 'fv', 'e_gpa', 'densidade', 'nome', '_fb_pascals', '_fv_pascals', '_e_pascals')
+    _campos = ('fb', 'fv', 'e_gpa', 'densidade', 'nome')
+
+    def __init__(self, fb, fv, e_gpa, densidade, nome=''):
+        super().__init__(fb=fb, fv=fv, e_gpa=e_gpa, densidade=densidade, nome=nome)
+
+    @_cacheado
+    def fb_pascals(self):
+        return self.fb * 1e6
+
+    @_cacheado
+    def fv_pascals(self):
+        return self.fv * 1e6
+
+    @_cacheado
+    def e_pascals(self):
+        return self.e_gpa * 1e9
+
+
+class Solo(_ValorImutavel):
+    """Solo: capacidade admissível qa (kgf/cm²)."""
+    __slots__ = ('qa', '_qa_pascals')
+    _campos = ('qa',)
+
+    @_cacheado
+    def qa_pascals(self):
+        return self.qa * KGFCM2_PARA_PA
+
+
+class Caso(_ValorImutavel):
+    """Um caso completo de análise: carga, mat, material e solo."""
+    __slots__ = ('carga', 'mat', 'material', 'solo', '_w_newtons')
+    _campos = ('carga', 'mat', 'material', 'solo')
+
+    @_cacheado
+    def w_newtons(self):
+        """Peso próprio do mat (N)."""
+        return (self.mat.volume * self.material.densidade) * GRAVIDADE
+
+    @classmethod
+    def de_dados(cls, dados_entrada):
+        """
+        Monta o caso a partir do dicionário de textos usado pelo engine e pela
+        web. Todos os campos de CAMPOS_ENTRADA são obrigatórios (ValueError).
+        """
+        faltantes = [campo for campo in CAMPOS_ENTRADA if dados_entrada.get(campo) is None]
+        if faltantes:
+            raise ValueError(f"Campos obrigatórios ausentes: {', '.join(faltantes)}")
+        v = {campo: converter_decimal(dados_entrada[campo]) for campo in CAMPOS_ENTRADA}
+        return cls(
+            carga=CargaPatola(v['c'], v['p_tf']),
+            mat=Mat(v['l_real'], v['b'], v['d']),
+            material=Material(v['fb'], v['fv'], v['e_gpa'], v['densidade'], dados_entrada.get('nome', '')),
+            solo=Solo(v['qa']),
+        )
+
+    @classmethod
+    def de_registro(cls, registro, nome=''):
+        """Monta o caso a partir de uma linha de um array com dtype DTYPE_CASO."""
+        v = {campo: float(registro[campo]) for campo in CAMPOS_ENTRADA}
+        return cls(
+            carga=CargaPatola(v['c'], v['p_tf']),
+            mat=Mat(v['l_real'], v['b'], v['d']),
+            material=Material(v['fb'], v['fv'], v['e_gpa'], v['densidade'], nome),
+            solo=Solo(v['qa']),
+        )
+
+    def para_registro(self):
+        return (self.carga.c, self.carga.p_tf, self.solo.qa, self.mat.l_real, self.mat.b, self.mat.d,
+                self.material.densidade, self.material.fb, self.material.fv, self.material.e_gpa)
+
+
+# --- PONTE PARA LOTES NUMPY ---
+def casos_para_array(casos):
+    """
+    Converte objetos Caso (ou dicionários de entrada) em um array DTYPE_CASO,
+    preenchido diretamente (uma cópia, sem lista intermediária).
+    """
+    return np.fromiter(
+        ((caso if isinstance(caso, Caso) else Caso.de_dados(caso)).para_registro() for caso in casos),
+        dtype=DTYPE_CASO,
+    )
+
+
+def casos_de_buffer(buffer):
+    """Visão DTYPE_CASO (sem cópia) sobre um buffer com registros contíguos."""
+    return np.frombuffer(buffer, dtype=DTYPE_CASO)
+
+
+def grandezas_si(casos):
+    """
+    Grandezas derivadas, em unidades SI, para um array DTYPE_CASO. As colunas
+    de entrada são lidas como visões do array (sem cópia).
+    """
+    volume = casos['l_real'] * casos['b'] * casos['d']
+    return {
+        'p_newtons': casos['p_tf'] * TF_PARA_N,
+        'w_newtons': (volume * casos['densidade']) * GRAVIDADE,
+        'qa_pascals': casos['qa'] * KGFCM2_PARA_PA,
+        'fb_pascals': casos['fb'] * 1e6,
+        'fv_pascals': casos['fv'] * 1e6,
+        'e_pascals': casos['e_gpa'] * 1e9,
+        'modulo_de_seccao': (casos['b'] * casos['d'] ** 2) / 6,
+        'momento_de_inercia': (casos['b'] * casos['d'] ** 3) / 12,
+    }
@@ -0,0 +1,121 @@
+# engine/esteiras.py
+
+"""
+Pressão sob as esteiras de guindastes sobre esteiras, com varredura de giro.
+
+O engine modela apenas sapatas de patola (largura C). Guindastes de esteira
+apoiam-se em duas esteiras com pressão trapezoidal ou triangular, que depende
+do ângulo de giro e da excentricidade da carga. Aqui a estática é vetorizada
+sobre uma grade densa de ângulos:
+
+- o momento líquido (carga × raio − superestrutura × raio do CG) gira com a
+  lança e é decomposto nas direções longitudinal (x, ao longo das esteiras) e
+  transversal (y);
+- a força vertical se divide entre as esteiras pelo momento transversal;
+- ao longo de cada esteira a pressão é trapezoidal se |ex| <= Le/6 e
+  triangular (comprimento de contato 3·(Le/2 − |ex|)) caso contrário.
+
+Os mats colocados transversalmente sob as esteiras são verificados pelo
+método 3 (flexão, cisalhamento, deformação) tratando a largura da sapata da
+esteira como a largura C e a força no trecho de largura B do mat como a
+carga de patola, com o kernel especializado de engine/cenarios.py.
+"""
+
+import numpy as np
+
+from engine.cenarios import especializar
+from engine.dominio import KGFCM2_PARA_PA, TF_PARA_N
+
+TRAPEZOIDAL = 'trapezoidal'
+TRIANGULAR = 'triangular'
+TOMBAMENTO = 'tombamento'
+
+
+def pressao_esteiras(angulos_graus, carga_tf, raio_m, peso_superior_tf, raio_cg_superior_m,
+                     peso_inferior_tf, bitola_m, comprimento_esteira_m, largura_sapata_m):
+    """
+    Distribuição de pressão nas duas esteiras para cada ângulo de giro
+    (0° = lança alinhada às esteiras, para frente). O raio do CG da
+    superestrutura é medido a partir do centro de giro, no sentido oposto
+    à lança (contrapeso). Os arrays de saída têm forma (2, n_angulos): a
+    linha 0 é a esteira em y = +bitola/2 e a linha 1 a esteira em y = −bitola/2.
+    """
+    theta = np.radians(np.asarray(angulos_graus, dtype=np.float64))
+    vertical = (carga_tf + peso_superior_tf + peso_inferior_tf) * TF_PARA_N
+    momento = (carga_tf * raio_m - peso_superior_tf * raio_cg_superior_m) * TF_PARA_N
+    ex = momento * np.cos(theta) / vertical
+    ey = momento * np.sin(theta) / vertical
+
+    lado = np.array([[1.0], [-1.0]])
+    forca = vertical / 2 + lado * vertical * ey / bitola_m
+
+    le, bt = comprimento_esteira_m, largura_sapata_m
+    ex_abs = np.abs(ex)
+    trapezoidal = ex_abs <= le / 6
+    tombamento = (ex_abs >= le / 2) | np.any(forca <= 0, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        contato = np.where(trapezoidal, le, 3 * (le / 2 - ex_abs))
+        p_max = np.where(trapezoidal, forca / (bt * le) * (1 + 6 * ex_abs / le), 2 * forca / (bt * contato))
+        p_min = np.where(trapezoidal, forca / (bt * le) * (1 - 6 * ex_abs / le), 0.0)
+    p_max = np.where(tombamento, np.inf, p_max)
+    p_min = np.where(tombamento, 0.0, p_min)
+    tipo = np.where(tombamento, TOMBAMENTO, np.where(trapezoidal, TRAPEZOIDAL, TRIANGULAR))
+
+    return {
+        'angulos_graus': np.degrees(theta),
+        'ex': ex,
+        'ey': ey,
+        'forca_esteira_n': forca,
+        'comprimento_contato': np.broadcast_to(np.where(tombamento, 0.0, contato), forca.shape),
+        'p_max_pa': p_max,
+        'p_min_pa': p_min,
+        'p_max_kgf_cm2': p_max / KGFCM2_PARA_PA,
+        'tipo': tipo,
+        'tombamento': tombamento,
+    }
+
+
+def verificar_mats_esteiras(esteiras, largura_sapata_m, mat, material, solo):
+    """
+    Verifica os mats sob as esteiras para todos os ângulos de uma vez.
+    `mat` traz l_real, b e d; `material` traz densidade, fb, fv e e_gpa;
+    `solo` traz qa (mesmas chaves e unidades do engine). O mat sob o pico de
+    pressão recebe p_max × largura da sapata × B, aplicada numa largura C
+    igual à da sapata da esteira.
+    """
+    kernel = especializar(c=largura_sapata_m, qa=solo['qa'], l_real=mat['l_real'], b=mat['b'], d=mat['d'],
+                          densidade=material['densidade'], fb=material['fb'], fv=material['fv'],
+                          e_gpa=material['e_gpa'])
+    largura_mat = kernel.constantes['b']
+    carga_mat_tf = esteiras['p_max_pa'] * largura_sapata_m * largura_mat / TF_PARA_N
+    resultado = kernel(p_tf=carga_mat_tf)
+    resultado['carga_mat_tf'] = carga_mat_tf
+    resultado['aprovado'] = resultado['aprovado'] & ~esteiras['tombamento']
+    return resultado
+
+
+def envelope_giro(angulos_graus, guindaste, esteira, mat, material, solo):
+    """
+    Pressões e verificação dos mats sobre toda a grade de ângulos em uma
+    chamada. `guindaste` traz carga_tf, raio_m, peso_superior_tf,
+    raio_cg_superior_m e peso_inferior_tf; `esteira` traz bitola_m,
+    comprimento_esteira_m e largura_sapata_m.
+    """
+    esteiras = pressao_esteiras(angulos_graus, **guindaste, **esteira)
+    verificacao = verificar_mats_esteiras(esteiras, esteira['largura_sapata_m'], mat, material, solo)
+
+    p_max = esteiras['p_max_pa']
+    pico = np.unravel_index(np.argmax(p_max), p_max.shape)
+    utilizacao = verificacao['perc_capacidade_solo']
+    critico = np.unravel_index(np.argmax(utilizacao), utilizacao.shape)
+    return {
+        'esteiras': esteiras,
+        'mats': verificacao,
+        'p_max_kgf_cm2': float(p_max[pico] / KGFCM2_PARA_PA),
+        'esteira_pico': int(pico[0]),
+        'angulo_pico_graus': float(esteiras['angulos_graus'][pico[1]]),
+        'perc_capacidade_solo_max': float(utilizacao[critico]),
+        'angulo_critico_graus': float(esteiras['angulos_graus'][critico[1]]),
+        'tombamento': bool(esteiras['tombamento'].any()),
+        'aprovado': bool(verificacao['aprovado'].all()),
+    }
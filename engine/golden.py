@@ -0,0 +1,448 @@
+# engine/golden.py
+
+"""
+Repositório de resultados de referência ("golden") das varreduras do engine.
+
+Cada execução é gravada em um arquivo .npz colunar (uma coluna por entrada,
+saída e veredito) e cada linha é identificada por um hash canônico das
+entradas. O comando `diff` faz a junção por hash entre duas execuções e
+reporta células alteradas, histogramas de magnitude e vereditos invertidos.
+
+Uso:
+    python -m engine.golden importar resultados.csv base.npz --fixo c=0.6 --fixo p_tf=100 ...
+    python -m engine.golden diff base.npz nova.npz
+    python -m engine.golden recomputar base.npz --saida atualizada.npz
+
+Cada linha carrega também a versão do engine e do material que a produziram
+(ver engine/versao.py); `recomputar` refaz apenas as linhas desatualizadas.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine.catalogo import CLASSES_DE_MADEIRA
+from engine.dominio import converter_decimal
+from engine.versao import COLUNAS_MATERIAL, hash_colunas, versao_engine, versao_material, versoes_catalogo
+
+# --- ESQUEMA DAS COLUNAS ---
+# Entradas canônicas do engine (mesmas chaves de `realizar_analise_completa`)
+COLUNAS_ENTRADA = ('c', 'p_tf', 'qa', 'l_real', 'b', 'd', 'densidade', 'fb', 'fv', 'e_gpa')
+
+# Saídas numéricas de `processar_analise_para_relatorio`
+COLUNAS_SAIDA = (
+    'leff_final', 'leff_flexao', 'leff_cisalhamento', 'leff_deformacao',
+    'perc_comprimento_ativo', 'perc_capacidade_solo',
+    'pressao_total_kgf', 'pressao_dispersa_kgf', 'pressao_final_kgf',
+)
+
+# Cabeçalhos do CSV de sensibilidade (run_analysis) -> chaves canônicas
+ALIASES_CSV = {
+    'Madeira': 'rotulo',
+    'Resistencia_Solo_kgf/cm2': 'qa', 'Res. Solo': 'qa',
+    'Fb_MPa': 'fb', 'Fb': 'fb',
+    'Fv_MPa': 'fv', 'Fv': 'fv',
+    'E_GPa': 'e_gpa', 'E': 'e_gpa',
+    'Densidade_kg/m3': 'densidade', 'Densid.': 'densidade',
+    'Leff_Final_m': 'leff_final',
+    'Leff_Flexao_m': 'leff_flexao',
+    'Leff_Cisalhamento_m': 'leff_cisalhamento',
+    'Leff_Deformacao_m': 'leff_deformacao',
+    'Comprimento_Ativo_%': 'perc_comprimento_ativo',
+    'Capacidade_Solo_Utilizada_%': 'perc_capacidade_solo',
+    'Pressao_Area_Total_kgf/cm2': 'pressao_total_kgf',
+    'Pressao_Dispersao_45_kgf/cm2': 'pressao_dispersa_kgf',
+}
+
+# Faixas (log10 da variação relativa) do histograma de magnitude
+FAIXAS_MAGNITUDE = np.arange(-9, 4)
+
+# Tamanho padrão dos lotes enviados a cada processo no recálculo
+LOTE_RECALCULO = 256
+
+_SEMENTE_HASH = np.uint64(0xcbf29ce484222325)
+
+
+# --- HASH CANÔNICO DAS ENTRADAS ---
+def hash_entradas(entradas):
+    """
+    Calcula, de forma vetorizada, um hash de 64 bits por linha a partir das
+    colunas de entrada. Os valores são arredondados a 9 casas decimais para
+    que '0.6' e 0.6000000000001 gerem a mesma chave.
+    """
+    return hash_colunas(entradas, COLUNAS_ENTRADA, _SEMENTE_HASH)
+
+
+# --- CONVERSÃO DE VALORES ---
+def _para_float(valor):
+    """`converter_decimal` para as células dos registros: unidade ' m' opcional e vazio = NaN."""
+    if isinstance(valor, str):
+        valor = valor.strip().removesuffix(' m').strip()
+        if not valor:
+            return float('nan')
+    return converter_decimal(valor)
+
+
+def _colunas_de_registros(registros, nomes):
+    return {
+        nome: np.array([_para_float(registro.get(nome, 'nan')) for registro in registros], dtype=np.float64)
+        for nome in nomes
+    }
+
+
+# --- LEITURA E ESCRITA ---
+def salvar_colunas(caminho, entradas, saidas, aprovado, rotulos=None, metadados=None, comprimir=False,
+                   versoes_engine=None):
+    """
+    Grava uma execução já em formato colunar. Sem compressão a leitura é
+    praticamente uma cópia de memória; `comprimir=True` troca velocidade por
+    espaço em disco.
+
+    Se `versoes_engine` não for informado, todas as linhas são marcadas com a
+    versão atual do engine; a versão do material é sempre derivada das
+    próprias entradas.
+    """
+    n = len(entradas[COLUNAS_ENTRADA[0]])
+    if versoes_engine is None:
+        versoes_engine = np.full(n, versao_engine(), dtype=np.uint64)
+    colunas = {
+        'hash': hash_entradas(entradas),
+        'aprovado': np.asarray(aprovado, dtype=bool),
+        'versao_engine': np.asarray(versoes_engine, dtype=np.uint64),
+        'versao_material': versao_material(entradas),
+    }
+    for nome in COLUNAS_ENTRADA:
+        colunas[f'entrada__{nome}'] = np.asarray(entradas[nome], dtype=np.float64)
+    for nome, valores in saidas.items():
+        colunas[f'saida__{nome}'] = np.asarray(valores, dtype=np.float64)
+    if rotulos is not None:
+        colunas['rotulo'] = np.asarray(rotulos, dtype=str)
+    colunas['metadados'] = np.array(json.dumps(metadados or {}, ensure_ascii=False))
+    (np.savez_compressed if comprimir else np.savez)(caminho, **colunas)
+
+
+def salvar_execucao(caminho, casos, resultados, metadados=None):
+    """
+    Grava uma varredura a partir das listas usadas pelo run_analysis:
+    `casos` são os dicionários de entrada do engine e `resultados` os
+    dicionários devolvidos por `processar_analise_para_relatorio`.
+    """
+    entradas = _colunas_de_registros(casos, COLUNAS_ENTRADA)
+    saidas = _colunas_de_registros(resultados, COLUNAS_SAIDA)
+    aprovado = [resultado.get('status_geral') == 'APROVADO' for resultado in resultados]
+    rotulos = [caso.get('nome', '') for caso in casos]
+    salvar_colunas(caminho, entradas, saidas, aprovado, rotulos, metadados)
+
+
+def carregar_execucao(caminho):
+    """Lê uma execução gravada e devolve um dicionário de colunas."""
+    with np.load(caminho, allow_pickle=False) as arquivo:
+        n = len(arquivo['hash'])
+        # Arquivos anteriores ao versionamento ficam com versão 0 (sempre desatualizados)
+        sem_versao = np.zeros(n, dtype=np.uint64)
+        execucao = {
+            'hash': arquivo['hash'],
+            'aprovado': arquivo['aprovado'],
+            'versao_engine': arquivo['versao_engine'] if 'versao_engine' in arquivo.files else sem_versao,
+            'versao_material': arquivo['versao_material'] if 'versao_material' in arquivo.files else sem_versao,
+            'entradas': {},
+            'saidas': {},
+            'rotulo': arquivo['rotulo'] if 'rotulo' in arquivo.files else None,
+            'metadados': json.loads(str(arquivo['metadados'])),
+        }
+        for chave in arquivo.files:
+            if chave.startswith('entrada__'):
+                execucao['entradas'][chave[len('entrada__'):]] = arquivo[chave]
+            elif chave.startswith('saida__'):
+                execucao['saidas'][chave[len('saida__'):]] = arquivo[chave]
+    return execucao
+
+
+def importar_csv(caminho_csv, fixos, caminho_saida, metadados=None):
+    """
+    Converte um CSV de sensibilidade (separador ';') para o formato golden.
+    `fixos` completa as entradas que o CSV não traz (ex.: c, p_tf, l_real, b, d).
+    Linhas sem valor numérico na coluna de solo (cabeçalhos extras) são ignoradas.
+    """
+    with open(caminho_csv, newline='', encoding='utf-8', errors='replace') as f:
+        leitor = csv.DictReader(f, delimiter=';')
+        registros = []
+        for linha in leitor:
+            registro = {ALIASES_CSV.get(chave, chave): valor for chave, valor in linha.items()}
+            solo = (registro.get('qa') or '').strip()
+            if not solo:
+                continue
+            try:
+                _para_float(solo)
+            except ValueError:
+                continue
+            registros.append({**fixos, **registro})
+
+    entradas = _colunas_de_registros(registros, COLUNAS_ENTRADA)
+    saidas = _colunas_de_registros(registros, COLUNAS_SAIDA)
+    with np.errstate(invalid='ignore'):
+        aprovado = (saidas['leff_final'] <= entradas['l_real']) & (saidas['perc_capacidade_solo'] <= 100.0)
+    rotulos = [registro.get('rotulo', '') for registro in registros]
+    # A versão do engine que gerou um CSV é desconhecida: as linhas entram como desatualizadas
+    salvar_colunas(caminho_saida, entradas, saidas, aprovado, rotulos, metadados,
+                   versoes_engine=np.zeros(len(registros), dtype=np.uint64))
+    return len(registros)
+
+
+# --- COMPARAÇÃO ---
+def juntar_por_hash(hash_base, hash_nova):
+    """
+    Junção por hash entre duas execuções. Devolve os índices pareados
+    (base, nova) e as máscaras das linhas sem par em cada lado.
+    """
+    ordem = np.argsort(hash_nova, kind='stable')
+    ordenados = hash_nova[ordem]
+    if len(ordenados) == 0:
+        return (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp),
+                np.ones(len(hash_base), dtype=bool), np.zeros(0, dtype=bool))
+    posicao = np.minimum(np.searchsorted(ordenados, hash_base), len(ordenados) - 1)
+    encontrado = ordenados[posicao] == hash_base
+    idx_base = np.flatnonzero(encontrado)
+    idx_nova = ordem[posicao[encontrado]]
+    pareado_nova = np.zeros(len(hash_nova), dtype=bool)
+    pareado_nova[idx_nova] = True
+    return idx_base, idx_nova, ~encontrado, ~pareado_nova
+
+
+def _histograma_magnitude(anterior, atual):
+    escala = np.maximum(np.abs(anterior), np.finfo(np.float64).tiny)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        expoente = np.log10(np.abs(atual - anterior) / escala)
+    expoente = np.clip(expoente[np.isfinite(expoente)], FAIXAS_MAGNITUDE[0], FAIXAS_MAGNITUDE[-1] - 1e-9)
+    contagens, _ = np.histogram(expoente, bins=FAIXAS_MAGNITUDE)
+    return {f"1e{inicio}..1e{inicio + 1}": int(n) for inicio, n in zip(FAIXAS_MAGNITUDE[:-1], contagens) if n}
+
+
+def comparar_execucoes(base, nova, rtol=1e-9, atol=0.0, max_exemplos=20):
+    """
+    Compara duas execuções carregadas com `carregar_execucao`. Para cada saída
+    reporta quantas células mudaram, a maior diferença absoluta e o histograma
+    da variação relativa; reporta também os vereditos invertidos.
+    """
+    idx_base, idx_nova, so_base, so_nova = juntar_por_hash(base['hash'], nova['hash'])
+    relatorio = {
+        'linhas_base': int(len(base['hash'])),
+        'linhas_nova': int(len(nova['hash'])),
+        'pareadas': int(len(idx_base)),
+        'somente_base': int(so_base.sum()),
+        'somente_nova': int(so_nova.sum()),
+        'colunas': {},
+    }
+
+    for nome in sorted(set(base['saidas']) & set(nova['saidas'])):
+        anterior = base['saidas'][nome][idx_base]
+        atual = nova['saidas'][nome][idx_nova]
+        mudou = ~np.isclose(atual, anterior, rtol=rtol, atol=atol, equal_nan=True)
+        if not mudou.any():
+            relatorio['colunas'][nome] = {'alteradas': 0}
+            continue
+        with np.errstate(invalid='ignore'):
+            diferenca = np.abs(atual[mudou] - anterior[mudou])
+        relatorio['colunas'][nome] = {
+            'alteradas': int(mudou.sum()),
+            'max_diferenca': float(np.nanmax(diferenca)) if np.isfinite(diferenca).any() else float('nan'),
+            'histograma': _histograma_magnitude(anterior[mudou], atual[mudou]),
+        }
+
+    veredito_base = base['aprovado'][idx_base]
+    veredito_nova = nova['aprovado'][idx_nova]
+    invertidos = np.flatnonzero(veredito_base != veredito_nova)
+    exemplos = []
+    for i in invertidos[:max_exemplos]:
+        linha = idx_base[i]
+        exemplo = {nome: float(base['entradas'][nome][linha]) for nome in COLUNAS_ENTRADA}
+        if base['rotulo'] is not None:
+            exemplo['rotulo'] = str(base['rotulo'][linha])
+        exemplo['antes'] = 'APROVADO' if veredito_base[i] else 'REPROVADO'
+        exemplo['depois'] = 'APROVADO' if veredito_nova[i] else 'REPROVADO'
+        exemplos.append(exemplo)
+    relatorio['vereditos_invertidos'] = {
+        'total': int(len(invertidos)),
+        'aprovado_para_reprovado': int((veredito_base & ~veredito_nova).sum()),
+        'reprovado_para_aprovado': int((~veredito_base & veredito_nova).sum()),
+        'exemplos': exemplos,
+    }
+    return relatorio
+
+
+# --- RECÁLCULO SELETIVO ---
+def linhas_desatualizadas(execucao, catalogo=CLASSES_DE_MADEIRA):
+    """
+    Máscaras das linhas desatualizadas: `por_engine` quando o código do engine
+    mudou e `por_material` quando a classe de madeira da linha (pelo rótulo)
+    tem hoje propriedades diferentes das usadas no cálculo. Linhas cujo rótulo
+    não está no catálogo só ficam desatualizadas por mudança de engine.
+    """
+    por_engine = execucao['versao_engine'] != np.uint64(versao_engine())
+    por_material = np.zeros(len(execucao['hash']), dtype=bool)
+    if execucao['rotulo'] is not None:
+        atuais = versoes_catalogo(catalogo)
+        for nome in np.unique(execucao['rotulo']):
+            if str(nome) not in atuais:
+                continue
+            linhas = execucao['rotulo'] == nome
+            por_material |= linhas & (execucao['versao_material'] != np.uint64(atuais[str(nome)]))
+    return {'por_engine': por_engine, 'por_material': por_material, 'total': por_engine | por_material}
+
+
+def _calcular_lote(casos):
+    from analysis_processor import processar_analise_para_relatorio
+    return [processar_analise_para_relatorio(caso) for caso in casos]
+
+
+def recomputar_desatualizadas(execucao, catalogo=CLASSES_DE_MADEIRA, processos=None, lote=LOTE_RECALCULO):
+    """
+    Recalcula só as linhas desatualizadas, em lotes paralelos, usando as
+    propriedades atuais do catálogo para as linhas cujo material mudou.
+    Devolve a execução atualizada (as demais linhas são preservadas) e o
+    número de linhas recalculadas.
+    """
+    mascaras = linhas_desatualizadas(execucao, catalogo)
+    indices = np.flatnonzero(mascaras['total'])
+    if len(indices) == 0:
+        return execucao, 0
+
+    por_nome = {madeira['nome']: madeira for madeira in catalogo}
+    casos = []
+    for i in indices:
+        caso = {nome: repr(float(execucao['entradas'][nome][i])) for nome in COLUNAS_ENTRADA}
+        if execucao['rotulo'] is not None:
+            caso['nome'] = str(execucao['rotulo'][i])
+            if caso['nome'] in por_nome:
+                caso.update({nome: por_nome[caso['nome']][nome] for nome in COLUNAS_MATERIAL})
+        casos.append(caso)
+
+    lotes = [casos[inicio:inicio + lote] for inicio in range(0, len(casos), lote)]
+    if processos == 1 or len(lotes) == 1:
+        resultados = [r for resultado_lote in map(_calcular_lote, lotes) for r in resultado_lote]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            resultados = [r for resultado_lote in executor.map(_calcular_lote, lotes) for r in resultado_lote]
+
+    entradas = {nome: valores.copy() for nome, valores in execucao['entradas'].items()}
+    saidas = {nome: valores.copy() for nome, valores in execucao['saidas'].items()}
+    novos_casos = _colunas_de_registros(casos, COLUNAS_ENTRADA)
+    sucesso = np.array([bool(resultado.get('sucesso', False)) for resultado in resultados], dtype=bool)
+    novas_saidas = _colunas_de_registros([r if r.get('sucesso') else {} for r in resultados], COLUNAS_SAIDA)
+    for nome in COLUNAS_ENTRADA:
+        entradas[nome][indices] = novos_casos[nome]
+    for nome in saidas:
+        if nome in novas_saidas:
+            saidas[nome][indices] = novas_saidas[nome]
+    aprovado = execucao['aprovado'].copy()
+    aprovado[indices] = [r.get('status_geral') == 'APROVADO' for r in resultados]
+
+    # Linhas cujo recálculo falhou mantêm a versão antiga e continuam desatualizadas
+    versoes = execucao['versao_engine'].copy()
+    versoes[indices[sucesso]] = versao_engine()
+    atualizada = {
+        **execucao,
+        'hash': hash_entradas(entradas),
+        'aprovado': aprovado,
+        'versao_engine': versoes,
+        'versao_material': versao_material(entradas),
+        'entradas': entradas,
+        'saidas': saidas,
+        'metadados': {**execucao['metadados'], 'recalculadas': int(len(indices)),
+                      'falhas_recalculo': int((~sucesso).sum())},
+    }
+    return atualizada, len(indices)
+
+
+def salvar_execucao_carregada(caminho, execucao):
+    """Grava de volta uma execução no formato devolvido por `carregar_execucao`."""
+    salvar_colunas(caminho, execucao['entradas'], execucao['saidas'], execucao['aprovado'],
+                   execucao['rotulo'], execucao['metadados'], versoes_engine=execucao['versao_engine'])
+
+
+def imprimir_relatorio(relatorio):
+    print(f"Linhas: base={relatorio['linhas_base']} nova={relatorio['linhas_nova']} "
+          f"pareadas={relatorio['pareadas']} somente_base={relatorio['somente_base']} "
+          f"somente_nova={relatorio['somente_nova']}")
+    for nome, coluna in relatorio['colunas'].items():
+        if not coluna['alteradas']:
+            print(f"  {nome}: sem alterações")
+            continue
+        print(f"  {nome}: {coluna['alteradas']} alteradas, máx |Δ| = {coluna['max_diferenca']:.6g}")
+        for faixa, n in coluna['histograma'].items():
+            print(f"      |Δ|/|base| em {faixa}: {n}")
+    invertidos = relatorio['vereditos_invertidos']
+    print(f"Vereditos invertidos: {invertidos['total']} "
+          f"(APROVADO->REPROVADO: {invertidos['aprovado_para_reprovado']}, "
+          f"REPROVADO->APROVADO: {invertidos['reprovado_para_aprovado']})")
+    for exemplo in invertidos['exemplos']:
+        print(f"    {exemplo}")
+
+
+# --- EXECUÇÃO VIA TERMINAL ---
+def _ler_fixos(pares):
+    fixos = {}
+    for par in pares or []:
+        chave, _, valor = par.partition('=')
+        fixos[chave.strip()] = valor.strip()
+    return fixos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resultados de referência (golden) do engine.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+
+    p_importar = sub.add_parser('importar', help="Converte um CSV de sensibilidade para .npz")
+    p_importar.add_argument('csv')
+    p_importar.add_argument('saida')
+    p_importar.add_argument('--fixo', action='append', help="Entrada fixa no formato chave=valor")
+
+    p_diff = sub.add_parser('diff', help="Compara duas execuções gravadas")
+    p_diff.add_argument('base')
+    p_diff.add_argument('nova')
+    p_diff.add_argument('--rtol', type=float, default=1e-9)
+    p_diff.add_argument('--atol', type=float, default=0.0)
+    p_diff.add_argument('--json', action='store_true', help="Imprime o relatório em JSON")
+
+    p_recomputar = sub.add_parser('recomputar', help="Recalcula as linhas produzidas por versões antigas")
+    p_recomputar.add_argument('execucao')
+    p_recomputar.add_argument('--saida', help="Arquivo de saída (padrão: sobrescreve a execução)")
+    p_recomputar.add_argument('--processos', type=int, default=os.cpu_count())
+    p_recomputar.add_argument('--lote', type=int, default=LOTE_RECALCULO)
+    p_recomputar.add_argument('--listar', action='store_true', help="Só lista as linhas desatualizadas")
+
+    args = parser.parse_args(argv)
+    if args.comando == 'recomputar':
+        execucao = carregar_execucao(args.execucao)
+        mascaras = linhas_desatualizadas(execucao)
+        print(f"Desatualizadas: {int(mascaras['total'].sum())} de {len(execucao['hash'])} "
+              f"(engine: {int(mascaras['por_engine'].sum())}, material: {int(mascaras['por_material'].sum())})")
+        if args.listar:
+            return 0
+        atualizada, n = recomputar_desatualizadas(execucao, processos=args.processos, lote=args.lote)
+        if n:
+            salvar_execucao_carregada(args.saida or args.execucao, atualizada)
+        print(f"{n} linhas recalculadas.")
+        return 0
+
+    if args.comando == 'importar':
+        n = importar_csv(args.csv, _ler_fixos(args.fixo), args.saida, {'origem': args.csv})
+        print(f"{n} linhas gravadas em '{args.saida}'.")
+        return 0
+
+    relatorio = comparar_execucoes(carregar_execucao(args.base), carregar_execucao(args.nova),
+                                   rtol=args.rtol, atol=args.atol)
+    if args.json:
+        print(json.dumps(relatorio, ensure_ascii=False, indent=2))
+    else:
+        imprimir_relatorio(relatorio)
+    return 1 if relatorio['vereditos_invertidos']['total'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
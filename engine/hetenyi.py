@@ -0,0 +1,254 @@
+# engine/hetenyi.py
+
+"""
+Solução fechada de Hetényi para a viga finita livre-livre sobre base de
+Winkler, sob carga pontual ou em faixa.
+
+A viga finita [0, L] é obtida da viga infinita pela superposição da carga
+real com quatro cargas de condicionamento nas extremidades (forças P_e, P_d
+e momentos M_e, M_d), escolhidas para anular momento e cortante nas pontas.
+Com as combinações simétrica e antissimétrica, as quatro condições se
+separam em dois sistemas 2 × 2 resolvidos de forma explícita, sem nenhuma
+matriz. As respostas usam as funções da viga infinita (u = λ·|s|):
+
+    A = e^{-u}(cos u + sen u)   B = e^{-u} sen u
+    C = e^{-u}(cos u - sen u)   D = e^{-u} cos u
+
+e a carga em faixa, as suas primitivas. Tudo é vetorizado: as entradas são
+broadcast entre si e milhões de casos são avaliados de uma vez; o Leff é a
+zona com p ≥ p_lim que contém o pico, com os cruzamentos achados por Newton
+protegido por bisseção.
+
+A convenção de rigidez é a de `winkler_leff` (ks·w como carga por metro,
+p = ks·w), de modo que o resultado serve de verificação do solver numérico
+com extremidades livres (`assemble_free_bands`), desde que as molas nodais
+sigam a regra dos trapézios (meio dx nas pontas, como em `MultiMat`): com
+ks·dx em todos os nós o solo fica com L + dx e, em mats curtos, o p_max cai
+cerca de dx/L. Para λ·L ≲ 0,1 (mat praticamente rígido) a superposição
+perde precisão por cancelamento.
+"""
+
+import numpy as np
+
+from engine.winkler import TON_TO_N, inertia_rectangular
+
+BLOCK = 65536
+SAMPLES = 12
+NEWTON_ITERATIONS = 8
+PEAK_ITERATIONS = 6
+PEAK_SAMPLES = 17
+TOL_X_M = 1e-9
+
+
+# --- FUNÇÕES DA VIGA INFINITA ---
+def kernels(u):
+    """A, B, C e D de Hetényi para u ≥ 0."""
+    e = np.exp(-u)
+    cos, sen = e * np.cos(u), e * np.sin(u)
+    return cos + sen, sen, cos - sen, cos
+
+
+def _primitives(a, b, d):
+    """Primitivas em u de A, C e D (menos o valor em u = 0), dados A, B e D em u."""
+    return 1.0 - d, b, (b - d) / 2 + 0.5
+
+
+def characteristic(width, thickness, young_gpa, ks_kn_m3):
+    """λ = (k / 4EI)^¼ (1/m), com k = ks na convenção de `winkler_leff`."""
+    ei = np.asarray(young_gpa, dtype=np.float64) * 1e9 * inertia_rectangular(width, thickness)
+    return (np.asarray(ks_kn_m3, dtype=np.float64) * 1000 / (4 * ei)) ** 0.25
+
+
+class _Beam:
+    """Casos (arrays broadcast) em coordenadas centradas, x ∈ [-c, c]."""
+
+    def __init__(self, force_ton, length, width, thickness, young_gpa, ks_kn_m3, patch_width, load_x):
+        self.force = np.asarray(force_ton, dtype=np.float64) * TON_TO_N
+        self.c = np.asarray(length, dtype=np.float64) / 2
+        self.ei = np.asarray(young_gpa, dtype=np.float64) * 1e9 * inertia_rectangular(width, thickness)
+        self.k = np.asarray(ks_kn_m3, dtype=np.float64) * 1000
+        self.lam = (self.k / (4 * self.ei)) ** 0.25
+        self.half = np.asarray(0.0 if patch_width is None else patch_width, dtype=np.float64) / 2
+        self.a = np.zeros_like(self.c) if load_x is None else np.asarray(load_x, dtype=np.float64) - self.c
+
+        # Valores de M e V da carga real nas extremidades (viga infinita)
+        m_e, v_e, _, _ = self._load(-self.c)
+        m_d, v_d, _, _ = self._load(self.c)
+
+        # Sistemas simétrico (P_e + P_d, M_e - M_d) e antissimétrico (P_e - P_d, M_e + M_d)
+        a, _, c, d = kernels(2 * self.c * self.lam)
+        lam = self.lam
+        s_p, s_m = _cramer((1 + c) / (4 * lam), (1 + d) / 2, -(1 - d) / 2, -lam * (1 - a) / 2,
+                           -(m_e + m_d), -(v_e - v_d))
+        d_p, d_m = _cramer((1 - c) / (4 * lam), (1 - d) / 2, -(1 + d) / 2, -lam * (1 + a) / 2,
+                           -(m_e - m_d), -(v_e + v_d))
+        self.p_left, self.p_right = (s_p + d_p) / 2, (s_p - d_p) / 2
+        self.m_left, self.m_right = (s_m + d_m) / 2, (d_m - s_m) / 2
+
+    def _load(self, x):
+        """Momento, cortante, deflexão e rotação da carga real na viga infinita."""
+        lam, k = self.lam, self.k
+        s = x - self.a
+        faixa = np.greater(self.half, 0)
+        pontual = distribuida = None
+        if not np.all(faixa):
+            a, b, c, d = kernels(lam * np.abs(s))
+            sinal = np.sign(s)
+            pontual = (self.force / (4 * lam) * c, -self.force / 2 * sinal * d,
+                       self.force * lam / (2 * k) * a, -self.force * lam**2 / k * sinal * b)
+        if np.any(faixa):
+            # faixa [a - h, a + h] pelas primitivas, t = x - extremidade da faixa
+            h = np.where(faixa, self.half, 1.0)
+            q = self.force / (2 * h)
+            t1, t2 = s + h, s - h
+            a1, b1, _, d1 = kernels(lam * np.abs(t1))
+            a2, b2, _, d2 = kernels(lam * np.abs(t2))
+            i1, i2 = _primitives(a1, b1, d1), _primitives(a2, b2, d2)
+            s1, s2 = np.sign(t1), np.sign(t2)
+            distribuida = (q / (4 * lam**2) * (s1 * i1[1] - s2 * i2[1]),
+                           -q / (2 * lam) * (i1[2] - i2[2]),
+                           q / (2 * k) * (s1 * i1[0] - s2 * i2[0]),
+                           q * lam / (2 * k) * (a1 - a2))
+        if pontual is None:
+            return distribuida
+        if distribuida is None:
+            return pontual
+        return tuple(np.where(faixa, f, p) for f, p in zip(distribuida, pontual))
+
+    def evaluate(self, x):
+        """Momento, cortante, deflexão e rotação da viga finita em x (centrado)."""
+        lam, k = self.lam, self.k
+        momento, cortante, w, theta = self._load(x)
+        # forças e momentos de condicionamento; nas pontas, o lado interno
+        for origem, forca, binario, lado in ((-self.c, self.p_left, self.m_left, 1.0),
+                                             (self.c, self.p_right, self.m_right, -1.0)):
+            s = x - origem
+            sinal = np.where(s == 0, lado, np.sign(s))
+            a, b, c, d = kernels(lam * np.abs(s))
+            momento = momento + forca / (4 * lam) * c + binario / 2 * sinal * d
+            cortante = cortante - forca / 2 * sinal * d - binario * lam / 2 * a
+            w = w + forca * lam / (2 * k) * a + binario * lam**2 / k * sinal * b
+            theta = theta - forca * lam**2 / k * sinal * b + binario * lam**3 / k * c
+        return momento, cortante, w, theta
+
+
+def _cramer(a11, a12, a21, a22, b1, b2):
+    det = a11 * a22 - a12 * a21
+    return (b1 * a22 - a12 * b2) / det, (a11 * b2 - a21 * b1) / det
+
+
+# --- RESPOSTA AO LONGO DO MAT ---
+def hetenyi_response(x, force_ton, length, width, thickness, young_gpa, ks_kn_m3, patch_width=None,
+                     load_x=None) -> dict:
+    """
+    Deflexão, pressão, momento e cortante em x (m, a partir da extremidade,
+    como em `winkler_leff`). Todas as entradas são broadcast; `load_x` é o
+    centro da carga (padrão: meio do mat) e `patch_width` a largura da faixa.
+    """
+    viga = _Beam(force_ton, length, width, thickness, young_gpa, ks_kn_m3, patch_width, load_x)
+    xc = np.asarray(x, dtype=np.float64) - viga.c
+    momento, cortante, w, theta = viga.evaluate(xc)
+    fora = np.abs(xc) > viga.c
+    w, momento, cortante, theta = (np.where(fora, np.nan, v) for v in (w, momento, cortante, theta))
+    return {'w': w, 'p': viga.k * w, 'moment': momento, 'shear': cortante, 'rotation': theta}
+
+
+# --- COMPRIMENTO EFETIVO ---
+def _crossing(viga, origem, fim, p_lim):
+    """Primeiro x entre origem e fim com p = p_lim (fim quando não há cruzamento)."""
+    def f(x):
+        _, _, w, theta = viga.evaluate(x)
+        return viga.k * w - p_lim, viga.k * theta
+
+    # Amostragem até ~π/λ após a faixa para isolar o primeiro cruzamento
+    sentido = np.sign(fim - origem)
+    janela = np.minimum(np.abs(fim - origem), viga.half + np.pi / viga.lam)
+    fracoes = (np.arange(1, SAMPLES + 1) / SAMPLES).reshape((SAMPLES,) + (1,) * np.ndim(origem))
+    amostras = origem + sentido * janela * fracoes
+    abaixo = f(amostras)[0] < 0
+    primeiro = np.argmax(abaixo, axis=0)
+    achou = abaixo.any(axis=0)
+    x_hi = np.take_along_axis(amostras, primeiro[np.newaxis], axis=0)[0]
+    x_lo = np.where(primeiro > 0, np.take_along_axis(amostras, np.maximum(primeiro - 1, 0)[np.newaxis], axis=0)[0],
+                    origem)
+    # Sem cruzamento na janela: o trecho restante até a extremidade
+    abaixo_fim = f(fim)[0] < 0
+    restante = ~achou & abaixo_fim
+    x_lo = np.where(restante, origem + sentido * janela, x_lo)
+    x_hi = np.where(restante, fim, x_hi)
+    sem_cruzamento = ~achou & ~abaixo_fim
+
+    # Newton protegido: f(x_lo) ≥ 0 > f(x_hi)
+    x = (x_lo + x_hi) / 2
+    for _ in range(NEWTON_ITERATIONS):
+        if np.all(np.abs(x_hi - x_lo) <= TOL_X_M):
+            break
+        valor, derivada = f(x)
+        acima = valor >= 0
+        x_lo, x_hi = np.where(acima, x, x_lo), np.where(acima, x_hi, x)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            novo = x - valor / derivada
+        dentro = np.isfinite(novo) & ((novo - x_lo) * (novo - x_hi) < 0)
+        x = np.where(dentro, novo, (x_lo + x_hi) / 2)
+    return np.where(sem_cruzamento, fim, x)
+
+
+def _leff_block(force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim, patch_width, load_x):
+    viga = _Beam(force_ton, length, width, thickness, young_gpa, ks_kn_m3, patch_width, load_x)
+    # Carga centrada: pico no meio e zona simétrica
+    simetrico = np.all(viga.a == 0)
+    x = viga.a.copy()
+    if not simetrico:
+        # Pico: a melhor amostra (centro da carga incluído) na janela em torno
+        # da faixa e, a partir dela, dw/dx = 0 por Newton (w'' = -M/EI) sem
+        # sair do passo de amostragem; perto de uma ponta livre o pico pode
+        # ser a própria extremidade, onde dw/dx ≠ 0
+        lo = np.maximum(-viga.c, viga.a - viga.half - 1 / viga.lam)
+        hi = np.minimum(viga.c, viga.a + viga.half + 1 / viga.lam)
+        fracoes = np.linspace(0.0, 1.0, PEAK_SAMPLES).reshape((PEAK_SAMPLES,) + (1,) * np.ndim(lo))
+        amostras = np.concatenate([lo + (hi - lo) * fracoes, viga.a[np.newaxis]])
+        melhor = np.argmax(viga.evaluate(amostras)[2], axis=0)[np.newaxis]
+        x = np.take_along_axis(amostras, melhor, axis=0)[0]
+        passo = (hi - lo) / (PEAK_SAMPLES - 1)
+        x_lo, x_hi = np.maximum(lo, x - passo), np.minimum(hi, x + passo)
+        w = viga.evaluate(x)[2]
+        y = x
+        for _ in range(PEAK_ITERATIONS):
+            momento, _, _, theta = viga.evaluate(y)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                y = np.clip(y + np.where(momento != 0, theta * viga.ei / momento, 0.0), x_lo, x_hi)
+        x = np.where(viga.evaluate(y)[2] > w, y, x)
+    p_max = viga.k * viga.evaluate(x)[2]
+    fim = _crossing(viga, x, viga.c, p_lim)
+    inicio = -fim if simetrico else _crossing(viga, x, -viga.c, p_lim)
+    contato = p_max >= p_lim
+    return {
+        'leff_total': np.where(contato, fim - inicio, 0.0),
+        'start': np.where(contato, inicio + viga.c, np.nan),
+        'end': np.where(contato, fim + viga.c, np.nan),
+        'p_max': p_max,
+        'x_peak': x + viga.c,
+    }
+
+
+def hetenyi_leff(force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width=None,
+                 load_x=None, block=BLOCK) -> dict:
+    """
+    Leff, Leff total, p_max e p_lim (mesmas saídas de `winkler_leff`), mais
+    os limites da zona e a posição do pico, para todas as combinações
+    (broadcast) das entradas, em blocos de `block` casos.
+    """
+    entradas = np.broadcast_arrays(*(np.asarray(v if v is not None else np.nan, dtype=np.float64) for v in (
+        force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width, load_x)))
+    forma = entradas[0].shape
+    planos = [v.ravel() for v in entradas]
+    partes = []
+    for inicio in range(0, max(planos[0].size, 1), block):
+        bloco = [v[inicio:inicio + block] for v in planos]
+        largura, posicao = bloco[7], bloco[8]
+        partes.append(_leff_block(*bloco[:7], np.nan_to_num(largura, nan=0.0),
+                                  np.where(np.isnan(posicao), bloco[1] / 2, posicao)))
+    resultado = {chave: np.concatenate([parte[chave] for parte in partes]).reshape(forma) for chave in partes[0]}
+    resultado['leff'] = resultado['leff_total'] / 2
+    resultado['p_lim'] = entradas[6]
+    return resultado
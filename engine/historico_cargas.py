@@ -0,0 +1,268 @@
+# engine/historico_cargas.py
+
+"""
+Agregação de históricos de içamento para efeitos de duração da carga nos mats.
+
+A resistência da madeira depende da duração da carga (kmod da NBR 7190 /
+EC5), mas o engine verifica uma única carga instantânea. Este módulo lê logs
+de içamento (CSV ou JSONL) em blocos, com memória constante, e para cada mat:
+
+- classifica cada içamento pela sua própria duração;
+- monta a curva carga-duração acumulada (histograma de carga ponderado pelo
+  tempo), da qual sai a carga sustentada por tempo suficiente para cair em
+  cada classe de duração;
+- aplica o kmod da classe e reporta a utilização acumulada.
+
+Cada linha do log tem o identificador do mat, a carga na patola (tf) e a
+duração do içamento (h).
+
+Uso:
+    python -m engine.historico_cargas icamentos.csv --capacidade 120
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+
+import numpy as np
+
+from engine.dominio import converter_decimal
+
+# --- CLASSES DE DURAÇÃO (NBR 7190, kmod1 para madeira serrada) ---
+# (nome, duração acumulada mínima em horas, kmod)
+CLASSES_DURACAO = (
+    ('curta', 0.0, 0.90),              # até 1 semana
+    ('media', 168.0, 0.80),            # 1 semana a 6 meses
+    ('longa', 4380.0, 0.70),           # 6 meses a 10 anos
+    ('permanente', 87600.0, 0.60),     # mais de 10 anos
+)
+
+# A capacidade informada é a verificada pelo engine para um içamento (curta duração)
+KMOD_REFERENCIA = CLASSES_DURACAO[0][2]
+
+TAMANHO_BLOCO = 100_000
+PASSO_CARGA_TF = 0.5
+
+
+# --- LEITURA EM BLOCOS ---
+def _verificar_colunas(presentes, colunas, onde=''):
+    faltantes = [coluna for coluna in colunas if coluna not in presentes]
+    if faltantes:
+        raise ValueError(f"Colunas ausentes no histórico{onde}: {', '.join(faltantes)}")
+
+
+def _para_array(valores):
+    try:
+        return np.asarray(valores, dtype=np.float64)
+    except ValueError:
+        pass
+    try:
+        # vírgula decimal sem separador de milhar: troca vetorizada
+        return np.char.replace(np.asarray(valores, dtype=str), ',', '.').astype(np.float64)
+    except ValueError:
+        return np.fromiter((converter_decimal(v) for v in valores), dtype=np.float64, count=len(valores))
+
+
+def ler_csv_em_blocos(caminho, coluna_mat='mat', coluna_carga='carga_tf', coluna_duracao='duracao_h',
+                      delimitador=None, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê um CSV e produz blocos (mats, cargas, durações). Sem `delimitador`
+    explícito, usa ';' se ele aparecer no cabeçalho e ',' caso contrário.
+    """
+    # utf-8-sig: CSVs exportados pelo Excel começam com BOM
+    with open(caminho, newline='', encoding='utf-8-sig') as f:
+        cabecalho = f.readline()
+        if delimitador is None:
+            delimitador = ';' if ';' in cabecalho else ','
+        nomes = next(csv.reader([cabecalho], delimiter=delimitador))
+        _verificar_colunas(nomes, (coluna_mat, coluna_carga, coluna_duracao))
+        i_mat, i_carga, i_duracao = (nomes.index(coluna) for coluna in (coluna_mat, coluna_carga, coluna_duracao))
+        mats, cargas, duracoes = [], [], []
+        for linha in csv.reader(f, delimiter=delimitador):
+            if not linha:
+                continue
+            mats.append(linha[i_mat])
+            cargas.append(linha[i_carga])
+            duracoes.append(linha[i_duracao])
+            if len(mats) == tamanho_bloco:
+                yield mats, _para_array(cargas), _para_array(duracoes)
+                mats, cargas, duracoes = [], [], []
+        if mats:
+            yield mats, _para_array(cargas), _para_array(duracoes)
+
+
+def ler_jsonl_em_blocos(caminho, coluna_mat='mat', coluna_carga='carga_tf', coluna_duracao='duracao_h',
+                        tamanho_bloco=TAMANHO_BLOCO):
+    """Lê um arquivo JSON Lines (um objeto por linha) em blocos."""
+    with open(caminho, encoding='utf-8-sig') as f:
+        mats, cargas, duracoes = [], [], []
+        for numero, linha in enumerate(f, 1):
+            if not linha.strip():
+                continue
+            registro = json.loads(linha)
+            _verificar_colunas(registro, (coluna_mat, coluna_carga, coluna_duracao), f" (linha {numero})")
+            mats.append(str(registro[coluna_mat]))
+            cargas.append(registro[coluna_carga])
+            duracoes.append(registro[coluna_duracao])
+            if len(mats) == tamanho_bloco:
+                yield mats, _para_array(cargas), _para_array(duracoes)
+                mats, cargas, duracoes = [], [], []
+        if mats:
+            yield mats, _para_array(cargas), _para_array(duracoes)
+
+
+# --- AGREGAÇÃO ---
+class AgregadorHistorico:
+    """
+    Acumula blocos de içamentos. A memória depende só do número de mats e de
+    faixas de carga (passo_tf), nunca do número de linhas do log.
+    """
+
+    def __init__(self, passo_tf=PASSO_CARGA_TF, classes=CLASSES_DURACAO):
+        self.passo_tf = passo_tf
+        self.classes = classes
+        self.limites_h = np.array([classe[1] for classe in classes])
+        self.indices_mat = {}
+        self.linhas_descartadas = 0
+        n_classes = len(classes)
+        # Tempo acumulado por (mat, faixa de carga); a faixa i cobre (i-1, i]·passo
+        self.horas_por_faixa = np.zeros((0, 1))
+        self.icamentos = np.zeros((0, n_classes), dtype=np.int64)
+        self.horas = np.zeros((0, n_classes))
+        self.carga_max = np.zeros((0, n_classes))
+
+    def _indices(self, mats):
+        unicos, inverso = np.unique(np.asarray(mats, dtype=str), return_inverse=True)
+        mapa = self.indices_mat
+        for mat in unicos.tolist():
+            if mat not in mapa:
+                mapa[mat] = len(mapa)
+        indices = np.array([mapa[mat] for mat in unicos.tolist()], dtype=np.intp)[inverso]
+        novos = len(mapa) - self.icamentos.shape[0]
+        if novos > 0:
+            self.horas_por_faixa = np.pad(self.horas_por_faixa, ((0, novos), (0, 0)))
+            self.icamentos = np.pad(self.icamentos, ((0, novos), (0, 0)))
+            self.horas = np.pad(self.horas, ((0, novos), (0, 0)))
+            self.carga_max = np.pad(self.carga_max, ((0, novos), (0, 0)))
+        return indices
+
+    def adicionar_bloco(self, mats, cargas_tf, duracoes_h):
+        """Acumula um bloco; linhas com carga ou duração não finita são descartadas e contadas."""
+        cargas_tf = np.asarray(cargas_tf, dtype=np.float64)
+        duracoes_h = np.asarray(duracoes_h, dtype=np.float64)
+        validas = np.isfinite(cargas_tf) & np.isfinite(duracoes_h)
+        if not validas.all():
+            self.linhas_descartadas += int((~validas).sum())
+            mats = np.asarray(mats, dtype=str)[validas]
+            cargas_tf, duracoes_h = cargas_tf[validas], duracoes_h[validas]
+        if len(cargas_tf) == 0:
+            return
+        # valida antes de registrar mats novos: um bloco rejeitado não altera o agregador
+        if np.any(cargas_tf < 0) or np.any(duracoes_h < 0):
+            raise ValueError("Cargas e durações do histórico devem ser não negativas.")
+        indices = self._indices(mats)
+
+        # Classe de cada içamento pela sua própria duração
+        classe = np.searchsorted(self.limites_h, duracoes_h, side='right') - 1
+        n_mats, n_classes = self.icamentos.shape
+        celula = indices * n_classes + classe
+        self.icamentos += np.bincount(celula, minlength=n_mats * n_classes).reshape(n_mats, n_classes)
+        self.horas += np.bincount(celula, weights=duracoes_h, minlength=n_mats * n_classes).reshape(n_mats, n_classes)
+        np.maximum.at(self.carga_max, (indices, classe), cargas_tf)
+
+        # Curva carga-duração: faixa arredondada para cima (a favor da segurança)
+        faixa = np.ceil(cargas_tf / self.passo_tf).astype(np.intp)
+        n_faixas = max(self.horas_por_faixa.shape[1], int(faixa.max()) + 1)
+        if n_faixas > self.horas_por_faixa.shape[1]:
+            self.horas_por_faixa = np.pad(self.horas_por_faixa, ((0, 0), (0, n_faixas - self.horas_por_faixa.shape[1])))
+        self.horas_por_faixa += np.bincount(indices * n_faixas + faixa, weights=duracoes_h,
+                                            minlength=n_mats * n_faixas).reshape(n_mats, n_faixas)
+
+    def cargas_sustentadas(self):
+        """
+        Para cada mat e classe, a maior carga mantida (em um ou vários
+        içamentos) por um tempo acumulado que atinge o mínimo da classe.
+        """
+        # horas com carga >= faixa i, acumulando do topo para baixo
+        horas_acima = np.cumsum(self.horas_por_faixa[:, ::-1], axis=1)[:, ::-1]
+        n_faixas = horas_acima.shape[1]
+        sustentadas = np.zeros((horas_acima.shape[0], len(self.classes)))
+        for j, (_, minimo_h, _) in enumerate(self.classes):
+            if minimo_h <= 0:
+                # qualquer içamento conta, mesmo de duração desprezível
+                sustentadas[:, j] = self.carga_max.max(axis=1)
+                continue
+            atinge = (horas_acima >= minimo_h) & (horas_acima > 0)
+            # última faixa que ainda atinge o tempo mínimo
+            ultima = n_faixas - 1 - np.argmax(atinge[:, ::-1], axis=1)
+            sustentadas[:, j] = np.where(atinge.any(axis=1), ultima * self.passo_tf, 0.0)
+        return sustentadas
+
+    def resultado(self, capacidade_tf):
+        """
+        Relatório por mat. `capacidade_tf` é a carga de patola admissível do
+        mat para um içamento (curta duração), um número ou um dicionário por mat.
+        """
+        sustentadas = self.cargas_sustentadas()
+        relatorio = {}
+        for mat, i in self.indices_mat.items():
+            capacidade = capacidade_tf[mat] if isinstance(capacidade_tf, dict) else capacidade_tf
+            por_classe = {}
+            for j, (nome, _, kmod) in enumerate(self.classes):
+                resistente = capacidade * kmod / KMOD_REFERENCIA
+                por_classe[nome] = {
+                    'icamentos': int(self.icamentos[i, j]),
+                    'horas': float(self.horas[i, j]),
+                    'carga_max_tf': float(self.carga_max[i, j]),
+                    'carga_sustentada_tf': float(sustentadas[i, j]),
+                    'kmod': kmod,
+                    'capacidade_tf': resistente,
+                    'utilizacao': float(sustentadas[i, j] / resistente) if resistente > 0 else math.inf,
+                }
+            governante = max(por_classe, key=lambda nome: por_classe[nome]['utilizacao'])
+            relatorio[mat] = {
+                'icamentos': int(self.icamentos[i].sum()),
+                'horas_total': float(self.horas[i].sum()),
+                'carga_max_tf': float(self.carga_max[i].max()),
+                'por_classe': por_classe,
+                'utilizacao': por_classe[governante]['utilizacao'],
+                'classe_governante': governante,
+            }
+        return relatorio
+
+
+def agregar_arquivo(caminho, capacidade_tf, passo_tf=PASSO_CARGA_TF, tamanho_bloco=TAMANHO_BLOCO, **colunas):
+    """Agrega um log CSV ou JSONL (pela extensão) e devolve o relatório por mat."""
+    leitor = ler_jsonl_em_blocos if caminho.lower().endswith(('.jsonl', '.ndjson')) else ler_csv_em_blocos
+    agregador = AgregadorHistorico(passo_tf=passo_tf)
+    for mats, cargas, duracoes in leitor(caminho, tamanho_bloco=tamanho_bloco, **colunas):
+        agregador.adicionar_bloco(mats, cargas, duracoes)
+    return agregador.resultado(capacidade_tf)
+
+
+# --- EXECUÇÃO VIA TERMINAL ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Utilização acumulada dos mats por duração de carga.")
+    parser.add_argument('log', help="Arquivo CSV ou JSONL com colunas mat, carga_tf e duracao_h")
+    parser.add_argument('--capacidade', type=float, required=True, help="Carga de patola admissível (tf)")
+    parser.add_argument('--passo', type=float, default=PASSO_CARGA_TF, help="Passo das faixas de carga (tf)")
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args(argv)
+
+    relatorio = agregar_arquivo(args.log, args.capacidade, passo_tf=args.passo)
+    if args.json:
+        print(json.dumps(relatorio, ensure_ascii=False, indent=2))
+        return 0
+    for mat, dados in relatorio.items():
+        print(f"Mat {mat}: {dados['icamentos']} içamentos, {dados['horas_total']:.1f} h, "
+              f"utilização {dados['utilizacao'] * 100:.1f}% ({dados['classe_governante']})")
+        for nome, classe in dados['por_classe'].items():
+            print(f"    {nome:<10} sustentada {classe['carga_sustentada_tf']:.1f} tf / "
+                  f"{classe['capacidade_tf']:.1f} tf (kmod {classe['kmod']:.2f})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# engine/intervalo.py
+
+"""
+Modo de avaliação por intervalos do método 3 (Leff efetivo).
+
+Os dados de campo chegam como faixas (qa entre 1,0 e 1,6; E entre 9 e 12 GPa).
+Em vez de amostrar a faixa com centenas de chamadas ao engine, as fórmulas de
+`calcular_metodo_leff_efetivo` são avaliadas em aritmética intervalar com
+arredondamento para fora, o que garante limites inferior/superior para cada
+Leff, para a utilização do solo e para o veredito.
+
+As raízes das quadráticas de flexão e cisalhamento são apertadas usando a
+monotonicidade: o sinal de dLeff/dθ = -(∂f/∂θ)/(∂f/∂L) é verificado em todo o
+intervalo e, quando é fixo, o parâmetro θ é levado ao extremo que minimiza
+(ou maximiza) a raiz antes da avaliação intervalar.
+
+Todas as operações são vetorizadas: cada entrada pode ser um array de casos.
+"""
+
+import numpy as np
+
+from engine.cenarios import LIMITE_PERC_SOLO
+from engine.dominio import CAMPOS_ENTRADA, GRAVIDADE, KGFCM2_PARA_PA, TF_PARA_N, converter_decimal
+
+APROVADO = 'APROVADO'
+REPROVADO = 'REPROVADO'
+INDETERMINADO = 'INDETERMINADO'
+
+
+# --- ARITMÉTICA INTERVALAR ---
+def _para_baixo(x):
+    return np.nextafter(x, -np.inf)
+
+
+def _para_cima(x):
+    return np.nextafter(x, np.inf)
+
+
+class Intervalo:
+    """Intervalo fechado [lo, hi] com arredondamento para fora; lo e hi são arrays."""
+    __slots__ = ('lo', 'hi')
+
+    def __init__(self, lo, hi=None):
+        lo = np.asarray(lo, dtype=np.float64)
+        hi = lo if hi is None else np.asarray(hi, dtype=np.float64)
+        if np.any(lo > hi):
+            raise ValueError("Intervalo com limite inferior maior que o superior.")
+        self.lo, self.hi = np.broadcast_arrays(lo, hi)
+
+    @classmethod
+    def _arredondado(cls, lo, hi):
+        return cls(_para_baixo(lo), _para_cima(hi))
+
+    @staticmethod
+    def de(valor):
+        return valor if isinstance(valor, Intervalo) else Intervalo(valor)
+
+    def __repr__(self):
+        return f"Intervalo({self.lo!r}, {self.hi!r})"
+
+    @property
+    def largura(self):
+        return self.hi - self.lo
+
+    def contem(self, valor):
+        return (self.lo <= valor) & (valor <= self.hi)
+
+    def __neg__(self):
+        return Intervalo(-self.hi, -self.lo)
+
+    def __add__(self, outro):
+        outro = Intervalo.de(outro)
+        return Intervalo._arredondado(self.lo + outro.lo, self.hi + outro.hi)
+
+    __radd__ = __add__
+
+    def __sub__(self, outro):
+        outro = Intervalo.de(outro)
+        return Intervalo._arredondado(self.lo - outro.hi, self.hi - outro.lo)
+
+    def __rsub__(self, outro):
+        return Intervalo.de(outro) - self
+
+    def __mul__(self, outro):
+        outro = Intervalo.de(outro)
+        produtos = np.stack([self.lo * outro.lo, self.lo * outro.hi, self.hi * outro.lo, self.hi * outro.hi])
+        return Intervalo._arredondado(produtos.min(axis=0), produtos.max(axis=0))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, outro):
+        outro = Intervalo.de(outro)
+        contem_zero = (outro.lo <= 0) & (outro.hi >= 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverso = Intervalo._arredondado(1.0 / outro.hi, 1.0 / outro.lo)
+        inverso.lo = np.where(contem_zero, -np.inf, inverso.lo)
+        inverso.hi = np.where(contem_zero, np.inf, inverso.hi)
+        return self * inverso
+
+    def __rtruediv__(self, outro):
+        return Intervalo.de(outro) / self
+
+    def quadrado(self):
+        lo2, hi2 = self.lo * self.lo, self.hi * self.hi
+        contem_zero = (self.lo <= 0) & (self.hi >= 0)
+        lo = np.where(contem_zero, 0.0, np.minimum(lo2, hi2))
+        return Intervalo(np.where(contem_zero, 0.0, _para_baixo(lo)), _para_cima(np.maximum(lo2, hi2)))
+
+    def cubo(self):
+        return Intervalo._arredondado(self.lo ** 3, self.hi ** 3)
+
+    def raiz(self):
+        """Raiz quadrada da parte não negativa do intervalo."""
+        return Intervalo(np.maximum(_para_baixo(np.sqrt(np.maximum(self.lo, 0.0))), 0.0),
+                         _para_cima(np.sqrt(np.maximum(self.hi, 0.0))))
+
+    def raiz_cubica(self):
+        return Intervalo._arredondado(np.cbrt(self.lo), np.cbrt(self.hi))
+
+    def sinal(self):
+        """+1 se o intervalo é todo positivo, -1 se todo negativo, 0 se indefinido."""
+        return np.where(self.lo > 0, 1, np.where(self.hi < 0, -1, 0))
+
+
+def minimo(*intervalos):
+    return Intervalo(np.minimum.reduce([i.lo for i in intervalos]),
+                     np.minimum.reduce([i.hi for i in intervalos]))
+
+
+def _extremo(intervalo, direcao):
+    """
+    Para cada caso, fixa o parâmetro no extremo indicado por `direcao`
+    (-1: inferior, +1: superior, 0: mantém o intervalo inteiro).
+    """
+    lo = np.where(direcao > 0, intervalo.hi, intervalo.lo)
+    hi = np.where(direcao < 0, intervalo.lo, intervalo.hi)
+    return Intervalo(lo, hi)
+
+
+def converter_intervalo(valor):
+    """
+    Aceita um Intervalo, um par (lo, hi), um número ou um texto como
+    '1,0..1,6', '1,0 a 1,6' ou '1,3' (intervalo degenerado).
+    """
+    if isinstance(valor, Intervalo):
+        return valor
+    if isinstance(valor, (tuple, list)) and len(valor) == 2:
+        lo, hi = (converter_decimal(v) if isinstance(v, str) else v for v in valor)
+        return Intervalo(lo, hi)
+    if isinstance(valor, str):
+        for separador in ('..', ' a ', ';'):
+            if separador in valor:
+                lo, hi = valor.split(separador, 1)
+                return Intervalo(converter_decimal(lo), converter_decimal(hi))
+        return Intervalo(converter_decimal(valor))
+    return Intervalo(valor)
+
+
+# --- RAÍZES DAS QUADRÁTICAS COM APERTO POR MONOTONICIDADE ---
+def _raiz_flexao(a, w, mn, C):
+    """
+    Maior raiz de f(L) = a(L-C)² - w(L-2C) - 8mn, a mesma quadrática do
+    método 3: L = C + w/(2a) + sqrt(w² - 4aCw + 32a·mn)/(2a).
+    """
+    disc = w.quadrado() - 4 * a * C * w + 32 * a * mn
+    raiz = C + w / (2 * a) + disc.raiz() / (2 * a)
+    # Sem raiz real o engine devolve Leff infinito
+    raiz.hi = np.where(disc.lo < 0, np.inf, raiz.hi)
+    raiz.lo = np.where(disc.hi < 0, np.inf, raiz.lo)
+    return raiz
+
+
+def _leff_flexao(a, w, mn, C):
+    bruto = _raiz_flexao(a, w, mn, C)
+    # dL/dθ tem o sinal de -∂f/∂θ (∂f/∂L > 0 na maior raiz)
+    sinal_w = (bruto - 2 * C).sinal()             # ∂f/∂w = -(L - 2C)
+    sinal_c = (a * (bruto - C) - w).sinal()       # ∂f/∂C = -2[a(L - C) - w]
+    inferior = _raiz_flexao(_extremo(a, +1), _extremo(w, -sinal_w), _extremo(mn, -1), _extremo(C, -sinal_c))
+    superior = _raiz_flexao(_extremo(a, -1), _extremo(w, sinal_w), _extremo(mn, +1), _extremo(C, sinal_c))
+    return Intervalo(np.maximum(inferior.lo, bruto.lo), np.minimum(superior.hi, bruto.hi))
+
+
+def _raiz_cisalhamento(a, w, vn, D):
+    """
+    Maior raiz de f(L) = aL² - (2vn + aD + w)L + wD, com D = C + 2H
+    (quadrática de cisalhamento do método 3).
+    """
+    soma = 2 * vn + a * D + w
+    disc = soma.quadrado() - 4 * a * w * D
+    raiz = (soma + disc.raiz()) / (2 * a)
+    raiz.hi = np.where(disc.lo < 0, np.inf, raiz.hi)
+    raiz.lo = np.where(disc.hi < 0, np.inf, raiz.lo)
+    return raiz
+
+
+def _leff_cisalhamento(a, w, vn, D):
+    bruto = _raiz_cisalhamento(a, w, vn, D)
+    sinal_l = (bruto - D).sinal()                 # ∂f/∂a = L(L - D), ∂f/∂w = -(L - D)
+    sinal_d = (a * bruto - w).sinal()             # ∂f/∂D = -(aL - w)
+    inferior = _raiz_cisalhamento(_extremo(a, sinal_l), _extremo(w, -sinal_l), _extremo(vn, -1),
+                                  _extremo(D, -sinal_d))
+    superior = _raiz_cisalhamento(_extremo(a, -sinal_l), _extremo(w, sinal_l), _extremo(vn, +1),
+                                  _extremo(D, sinal_d))
+    return Intervalo(np.maximum(inferior.lo, bruto.lo), np.minimum(superior.hi, bruto.hi))
+
+
+# --- MÉTODO 3 EM INTERVALOS ---
+def calcular_metodo_leff_intervalar(entradas):
+    """
+    Avalia o método 3 com entradas intervalares. `entradas` usa as mesmas
+    chaves do engine ('c', 'p_tf', 'qa', 'l_real', 'b', 'd', 'densidade',
+    'fb', 'fv', 'e_gpa'); cada valor é aceito por `converter_intervalo` e pode
+    ser vetorizado (arrays de limites).
+
+    Devolve Intervalos garantidos para cada Leff, Leff mínimo, percentual de
+    comprimento ativo e de capacidade do solo, e o veredito por caso
+    (APROVADO, REPROVADO ou INDETERMINADO).
+    """
+    x = {campo: converter_intervalo(entradas[campo]) for campo in CAMPOS_ENTRADA}
+    C, L, B, H = x['c'], x['l_real'], x['b'], x['d']
+
+    w_newtons = L * B * H * x['densidade'] * GRAVIDADE
+    p_newtons = x['p_tf'] * TF_PARA_N
+    qa_pascals = x['qa'] * KGFCM2_PARA_PA
+    mn = x['fb'] * 1e6 * (B * H.quadrado()) / 6
+    vn = (x['fv'] * 1e6 * B * H) / 1.5
+    a = qa_pascals * B
+
+    leff_flexao = _leff_flexao(a, w_newtons, mn, C)
+    leff_cisalhamento = _leff_cisalhamento(a, w_newtons, vn, C + 2 * H)
+    # 0.06·E·I/(0.9·qa·B) com I = B·H³/12: B se cancela e cada variável aparece uma só vez
+    termo_interno = (0.06 * x['e_gpa'] * 1e9 * H.cubo() / 12) / (0.9 * qa_pascals)
+    leff_deflexao = 2 * termo_interno.raiz_cubica() + C
+
+    leff_minimo = minimo(leff_flexao, leff_cisalhamento, leff_deflexao)
+    leff_operacional = minimo(leff_minimo, L)
+    perc_comprimento_ativo = leff_minimo / L * 100
+    qt_operacao = (p_newtons + w_newtons) / (leff_operacional * B)
+    perc_capacidade_solo = qt_operacao / qa_pascals * 100
+
+    # mesmo corte do engine, que arredonda o percentual do solo a uma casa
+    aprovado = (leff_minimo.hi <= L.lo) & (perc_capacidade_solo.hi < LIMITE_PERC_SOLO)
+    reprovado = (leff_minimo.lo > L.hi) | (perc_capacidade_solo.lo >= LIMITE_PERC_SOLO)
+    veredito = np.where(aprovado, APROVADO, np.where(reprovado, REPROVADO, INDETERMINADO))
+
+    return {
+        'leff_flexao': leff_flexao,
+        'leff_cisalhamento': leff_cisalhamento,
+        'leff_deflexao': leff_deflexao,
+        'leff_minimo_calculado': leff_minimo,
+        'perc_comprimento_ativo': perc_comprimento_ativo,
+        'perc_capacidade_solo': perc_capacidade_solo,
+        'veredito': veredito,
+    }
@@ -1,5 +1,7 @@
 import math
 
+from engine.dominio import Caso
+
 # --- FUNÇÕES DE CÁLCULO INDIVIDUAIS (SEM ALTERAÇÃO) ---
 def calcular_metodo_capacidade_solo(p_newtons, w_newtons, qa_pascals, B, C, H, Fb_pascals, Fv_pascals, modulo_de_seccao):
     a_reqd = (p_newtons + w_newtons) / qa_pascals if qa_pascals > 0 else float('inf')
@@ -105,26 +107,18 @@ def calcular_comparativos_pressao(p_newtons, w_newtons, L_real, B, C, H):
 def realizar_analise_completa(dados_entrada):
     try:
         # --- Coleta e conversão de dados ---
-        C = float(dados_entrada.get('c', 0).replace(',', '.'))
-        F = float(dados_entrada.get('p_tf', 0).replace(',', '.'))
-        S_soil = float(dados_entrada.get('qa', 0).replace(',', '.'))
-        L = float(dados_entrada.get('l_real', 0).replace(',', '.'))
-        B = float(dados_entrada.get('b', 0).replace(',', '.'))
-        H = float(dados_entrada.get('d', 0).replace(',', '.'))
-        rho = float(dados_entrada.get('densidade', 0).replace(',', '.'))
-        Fb = float(dados_entrada.get('fb', 0).replace(',', '.'))
-        Fv = float(dados_entrada.get('fv', 0).replace(',', '.'))
-        E_gpa = float(dados_entrada.get('e_gpa', 0).replace(',', '.'))
-        
-        volume = L * B * H
-        w_newtons = (volume * rho) * 9.81
-        p_newtons = F * 9810
-        qa_pascals = S_soil * 98100
-        Fb_pascals = Fb * 1e6
-        Fv_pascals = Fv * 1e6
-        E_pascals = E_gpa * 1e9
-        modulo_de_seccao = (B * H ** 2) / 6
-        momento_de_inercia = (B * H ** 3) / 12
+        caso = Caso.de_dados(dados_entrada)
+        C = caso.carga.c
+        L, B, H = caso.mat.l_real, caso.mat.b, caso.mat.d
+
+        w_newtons = caso.w_newtons
+        p_newtons = caso.carga.p_newtons
+        qa_pascals = caso.solo.qa_pascals
+        Fb_pascals = caso.material.fb_pascals
+        Fv_pascals = caso.material.fv_pascals
+        E_pascals = caso.material.e_pascals
+        modulo_de_seccao = caso.mat.modulo_de_seccao
+        momento_de_inercia = caso.mat.momento_de_inercia
 
         # --- Cálculos dos métodos ---
         resultados_m3 = calcular_metodo_leff_efetivo(qa_pascals, w_newtons, L, B, H, C, Fb_pascals, Fv_pascals, E_pascals, modulo_de_seccao, momento_de_inercia)
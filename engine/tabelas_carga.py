@@ -0,0 +1,224 @@
+# engine/tabelas_carga.py
+
+"""
+Importação de tabelas de carga de guindastes e interpolação 2-D vetorizada.
+
+A tabela do fabricante (raio × comprimento de lança × contrapeso) é lida de
+CSV ou XLSX no formato longo, uma linha por ponto:
+
+    lanca_m;raio_m;contrapeso_t;capacidade_t
+
+e guardada em um array denso (contrapeso, lança, raio) com NaN onde o ponto
+não é tabelado. A capacidade é interpolada de forma bilinear em lança e raio
+(ou pelo menor canto da célula, no modo conservador), usando sempre o maior
+contrapeso tabelado que não excede o real, e arredondada para baixo.
+
+A capacidade alimenta diretamente o cálculo da carga na patola mais
+solicitada, e daí o kernel do método 3 (engine/cenarios.py).
+"""
+
+import csv
+import zipfile
+from xml.etree import ElementTree
+
+import numpy as np
+
+from engine.cenarios import especializar
+from engine.dominio import converter_decimal
+
+COLUNAS = ('lanca_m', 'raio_m', 'contrapeso_t', 'capacidade_t')
+
+BILINEAR = 'bilinear'
+CONSERVADOR = 'conservador'
+
+PASSO_ARREDONDAMENTO_T = 0.1
+
+_NS_XLSX = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_RELACOES = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PACOTE = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+# --- LEITURA DOS ARQUIVOS ---
+def _indice_coluna(referencia):
+    indice = 0
+    for letra in referencia:
+        if not letra.isalpha():
+            break
+        indice = indice * 26 + (ord(letra.upper()) - ord('A') + 1)
+    return indice - 1
+
+
+def _primeira_planilha(arquivo):
+    """
+    Caminho da primeira planilha na ordem do workbook (xl/workbook.xml e
+    suas relações), que não é a ordem dos nomes: sheet10 vem antes de sheet2.
+    """
+    nomes = arquivo.namelist()
+    if 'xl/workbook.xml' in nomes and 'xl/_rels/workbook.xml.rels' in nomes:
+        planilha = ElementTree.fromstring(arquivo.read('xl/workbook.xml')).find(f'{_NS_XLSX}sheets/{_NS_XLSX}sheet')
+        relacoes = ElementTree.fromstring(arquivo.read('xl/_rels/workbook.xml.rels'))
+        if planilha is not None:
+            alvos = {rel.get('Id'): rel.get('Target') for rel in relacoes.iter(f'{_NS_PACOTE}Relationship')}
+            alvo = alvos.get(planilha.get(f'{_NS_RELACOES}id'))
+            if alvo:
+                return alvo.lstrip('/') if alvo.startswith('/') else f'xl/{alvo}'
+    planilhas = [nome for nome in nomes if nome.startswith('xl/worksheets/sheet') and nome.endswith('.xml')]
+    if not planilhas:
+        raise ValueError("Arquivo XLSX sem planilhas.")
+    return min(planilhas, key=lambda nome: int(''.join(filter(str.isdigit, nome)) or 0))
+
+
+def _ler_linhas_xlsx(caminho):
+    """Lê a primeira planilha de um .xlsx com a biblioteca padrão."""
+    with zipfile.ZipFile(caminho) as arquivo:
+        compartilhadas = []
+        if 'xl/sharedStrings.xml' in arquivo.namelist():
+            raiz = ElementTree.fromstring(arquivo.read('xl/sharedStrings.xml'))
+            for item in raiz.iter(f'{_NS_XLSX}si'):
+                compartilhadas.append(''.join(t.text or '' for t in item.iter(f'{_NS_XLSX}t')))
+        raiz = ElementTree.fromstring(arquivo.read(_primeira_planilha(arquivo)))
+
+    linhas = []
+    for linha in raiz.iter(f'{_NS_XLSX}row'):
+        valores = {}
+        coluna = 0
+        for celula in linha.iter(f'{_NS_XLSX}c'):
+            tipo = celula.get('t')
+            if tipo == 'inlineStr':
+                texto = ''.join(t.text or '' for t in celula.iter(f'{_NS_XLSX}t'))
+            else:
+                valor = celula.find(f'{_NS_XLSX}v')
+                texto = '' if valor is None else valor.text or ''
+                if tipo == 's' and texto:
+                    texto = compartilhadas[int(texto)]
+            # 'r' é opcional: sem ele a célula ocupa a coluna seguinte à anterior
+            referencia = celula.get('r')
+            if referencia:
+                coluna = _indice_coluna(referencia)
+            valores[coluna] = texto
+            coluna += 1
+        if valores:
+            linhas.append([valores.get(i, '') for i in range(max(valores) + 1)])
+    return linhas
+
+
+def _ler_linhas_csv(caminho):
+    with open(caminho, newline='', encoding='utf-8') as f:
+        cabecalho = f.readline()
+        delimitador = ';' if ';' in cabecalho else ','
+        return [next(csv.reader([cabecalho], delimiter=delimitador))] + list(csv.reader(f, delimiter=delimitador))
+
+
+# --- TABELA ---
+class TabelaCarga:
+    """
+    Tabela de carga indexada: `lancas`, `raios` e `contrapesos` são os eixos
+    ordenados e `capacidades[k, i, j]` a capacidade (t) para o contrapeso k,
+    a lança i e o raio j (NaN quando não tabelada).
+    """
+
+    def __init__(self, lanca_m, raio_m, contrapeso_t, capacidade_t):
+        lanca_m, raio_m, contrapeso_t, capacidade_t = (
+            np.asarray(v, dtype=np.float64) for v in (lanca_m, raio_m, contrapeso_t, capacidade_t)
+        )
+        self.lancas, i = np.unique(lanca_m, return_inverse=True)
+        self.raios, j = np.unique(raio_m, return_inverse=True)
+        self.contrapesos, k = np.unique(contrapeso_t, return_inverse=True)
+        self.capacidades = np.full((len(self.contrapesos), len(self.lancas), len(self.raios)), np.nan)
+        self.capacidades[k, i, j] = capacidade_t
+
+    @classmethod
+    def de_arquivo(cls, caminho):
+        """Importa um CSV (';' ou ',') ou XLSX no formato longo (ver COLUNAS)."""
+        linhas = _ler_linhas_xlsx(caminho) if caminho.lower().endswith('.xlsx') else _ler_linhas_csv(caminho)
+        cabecalho = [nome.strip().lower() for nome in linhas[0]]
+        faltantes = [coluna for coluna in COLUNAS if coluna not in cabecalho]
+        if faltantes:
+            raise ValueError(f"Colunas ausentes na tabela de carga: {', '.join(faltantes)}")
+        posicoes = [cabecalho.index(coluna) for coluna in COLUNAS]
+        dados = [
+            [converter_decimal(linha[p]) for p in posicoes]
+            for linha in linhas[1:]
+            if len(linha) > max(posicoes) and all(str(linha[p]).strip() for p in posicoes)
+        ]
+        return cls(*np.array(dados, dtype=np.float64).T)
+
+    def _celula(self, eixo, valores):
+        """Índice inferior e fração dentro da célula; NaN fora do eixo."""
+        i = np.clip(np.searchsorted(eixo, valores, side='right') - 1, 0, max(len(eixo) - 2, 0))
+        if len(eixo) == 1:
+            fracao = np.where(valores == eixo[0], 0.0, np.nan)
+            return i, np.zeros_like(i), fracao
+        fracao = (valores - eixo[i]) / (eixo[i + 1] - eixo[i])
+        fracao = np.where((valores < eixo[0]) | (valores > eixo[-1]), np.nan, fracao)
+        return i, i + 1, fracao
+
+    def capacidade(self, lanca_m, raio_m, contrapeso_t, modo=BILINEAR, passo_t=PASSO_ARREDONDAMENTO_T):
+        """
+        Capacidade (t) vetorizada. Pontos fora da tabela, abaixo do menor
+        contrapeso ou em células com canto não tabelado resultam em NaN.
+        """
+        lanca_m, raio_m, contrapeso_t = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (lanca_m, raio_m, contrapeso_t)))
+        # Maior contrapeso tabelado que não excede o real
+        k = np.searchsorted(self.contrapesos, contrapeso_t, side='right') - 1
+        sem_contrapeso = k < 0
+        k = np.maximum(k, 0)
+
+        i0, i1, fi = self._celula(self.lancas, lanca_m)
+        j0, j1, fj = self._celula(self.raios, raio_m)
+        cantos = np.stack([self.capacidades[k, i0, j0], self.capacidades[k, i0, j1],
+                           self.capacidades[k, i1, j0], self.capacidades[k, i1, j1]])
+        pesos = np.stack([(1 - fi) * (1 - fj), (1 - fi) * fj, fi * (1 - fj), fi * fj])
+        # Cantos de peso nulo (ponto sobre a borda da célula) não contam
+        ativos = pesos > 0
+        if modo == CONSERVADOR:
+            valor = np.where(ativos, cantos, np.inf).min(axis=0)
+        elif modo == BILINEAR:
+            valor = np.where(ativos, cantos * pesos, 0.0).sum(axis=0)
+        else:
+            raise ValueError(f"Modo de interpolação desconhecido: {modo}")
+        invalido = sem_contrapeso | np.isnan(fi) | np.isnan(fj) | np.any(ativos & np.isnan(cantos), axis=0)
+        valor = np.where(invalido, np.nan, valor)
+        if passo_t:
+            valor = np.floor(valor / passo_t + 1e-9) * passo_t
+        return valor
+
+
+# --- CARGA NA PATOLA ---
+def carga_patola_tf(carga_t, raio_m, peso_guindaste_t, contrapeso_t, raio_contrapeso_m,
+                    base_longitudinal_m, base_transversal_m, angulos_graus=None):
+    """
+    Reação na patola mais solicitada (tf), supondo chassi rígido sobre quatro
+    patolas. Sem `angulos_graus`, usa o ângulo de giro mais desfavorável
+    (máximo de |cos θ|/Lx + |sen θ|/Ly = sqrt(1/Lx² + 1/Ly²)).
+    """
+    vertical = carga_t + peso_guindaste_t + contrapeso_t
+    momento = np.abs(carga_t * raio_m - contrapeso_t * raio_contrapeso_m)
+    if angulos_graus is None:
+        fator = np.sqrt(1 / base_longitudinal_m ** 2 + 1 / base_transversal_m ** 2)
+    else:
+        theta = np.radians(np.asarray(angulos_graus, dtype=np.float64))
+        fator = np.abs(np.cos(theta)) / base_longitudinal_m + np.abs(np.sin(theta)) / base_transversal_m
+    return vertical / 4 + momento * fator / 2
+
+
+def avaliar_configuracoes(tabela, lanca_m, raio_m, contrapeso_t, guindaste, cenario, fracao_capacidade=1.0,
+                          modo=BILINEAR):
+    """
+    Avalia milhares de configurações de içamento de uma vez: capacidade pela
+    tabela, carga içada (fração da capacidade), carga na patola e verificação
+    do método 3. `guindaste` traz peso_guindaste_t, raio_contrapeso_m,
+    base_longitudinal_m e base_transversal_m; `cenario` traz as entradas fixas
+    do engine (c, qa, l_real, b, d, densidade, fb, fv, e_gpa).
+    """
+    capacidade = tabela.capacidade(lanca_m, raio_m, contrapeso_t, modo=modo)
+    carga = capacidade * fracao_capacidade
+    p_tf = carga_patola_tf(carga, raio_m, guindaste['peso_guindaste_t'], np.asarray(contrapeso_t, dtype=np.float64),
+                           guindaste['raio_contrapeso_m'], guindaste['base_longitudinal_m'],
+                           guindaste['base_transversal_m'])
+    resultado = especializar(**cenario)(p_tf=np.nan_to_num(p_tf, nan=0.0))
+    resultado['capacidade_t'] = capacidade
+    resultado['p_tf'] = p_tf
+    resultado['aprovado'] = resultado['aprovado'] & ~np.isnan(capacidade)
+    return resultado
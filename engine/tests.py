@@ -1,3 +1,819 @@
-from django.test import TestCase
+import os
+import tempfile
+import zipfile
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from django.test import SimpleTestCase
+
+from engine import arranjos_mats, cenarios, esteiras, golden, winkler_random_field, winkler_sweep
+from engine.hetenyi import hetenyi_leff, hetenyi_response
+from engine.historico_cargas import AgregadorHistorico, agregar_arquivo
+from engine.intervalo import APROVADO, INDETERMINADO, REPROVADO, calcular_metodo_leff_intervalar
+from engine.tabelas_carga import BILINEAR, CONSERVADOR, TabelaCarga
+from engine.pressio_engine import calcular_metodo_leff_efetivo, realizar_analise_completa
+from engine.dominio import (
+    CAMPOS_ENTRADA, DTYPE_CASO, KGFCM2_PARA_PA, TF_PARA_N, Caso, casos_de_buffer, casos_para_array, converter_decimal,
+)
+from engine.winkler import (
+    CUBIC, KGFCM2_TO_PA, LINEAR, NODE, TON_TO_N, WinklerModel, assemble_free_bands, boundary_rows, contact_zones,
+    downsample_minmax, effective_length, factor_pentadiagonal, inertia_rectangular, load_vector, piecewise,
+    solve_pentadiagonal, winkler_leff, winkler_leff_adaptive, winkler_leff_batch,
+)
+from engine.winkler_crossed import CrossedMats
+from engine.winkler_influence import InfluenceLines
+from engine.winkler_multimat import MultiMat
+from engine.winkler_nonlinear import CAPPED, ELASTIC, LIFTED, NonlinearWinkler
+from engine.winkler_plate import WinklerPlate
+from engine.winkler_timoshenko import TimoshenkoWinkler, winkler_leff_timoshenko
+from engine.versao import ARQUIVOS_ENGINE, versao_engine, versao_material
+
+
+def _execucao(hashes, valores, aprovado=None):
+    n = len(hashes)
+    return {
+        'hash': np.asarray(hashes, dtype=np.uint64),
+        'aprovado': np.ones(n, dtype=bool) if aprovado is None else np.asarray(aprovado, dtype=bool),
+        'versao_engine': np.zeros(n, dtype=np.uint64),
+        'versao_material': np.zeros(n, dtype=np.uint64),
+        'entradas': {nome: np.arange(n, dtype=np.float64) + 1 for nome in golden.COLUNAS_ENTRADA},
+        'saidas': {'leff_final': np.asarray(valores, dtype=np.float64)},
+        'rotulo': None,
+        'metadados': {},
+    }
+
+
+class GoldenDiffTests(SimpleTestCase):
+    def test_juntar_por_hash_pareia_fora_de_ordem(self):
+        idx_base, idx_nova, so_base, so_nova = golden.juntar_por_hash(
+            np.array([10, 20, 30], dtype=np.uint64), np.array([30, 40, 10], dtype=np.uint64))
+        self.assertEqual(idx_base.tolist(), [0, 2])
+        self.assertEqual(idx_nova.tolist(), [2, 0])
+        self.assertEqual(so_base.tolist(), [False, True, False])
+        self.assertEqual(so_nova.tolist(), [False, True, False])
+
+    def test_juntar_por_hash_com_nova_vazia(self):
+        idx_base, idx_nova, so_base, so_nova = golden.juntar_por_hash(
+            np.array([1, 2], dtype=np.uint64), np.array([], dtype=np.uint64))
+        self.assertEqual(len(idx_base), 0)
+        self.assertTrue(so_base.all())
+        self.assertEqual(len(so_nova), 0)
+
+    def test_comparar_execucoes_conta_alteracoes_e_vereditos(self):
+        base = _execucao([1, 2, 3], [1.0, 2.0, 3.0], [True, True, False])
+        nova = _execucao([3, 2, 4], [3.0, 2.5, 9.0], [True, True, True])
+        relatorio = golden.comparar_execucoes(base, nova)
+        self.assertEqual(relatorio['pareadas'], 2)
+        self.assertEqual(relatorio['somente_base'], 1)
+        self.assertEqual(relatorio['somente_nova'], 1)
+        self.assertEqual(relatorio['colunas']['leff_final']['alteradas'], 1)
+        self.assertAlmostEqual(relatorio['colunas']['leff_final']['max_diferenca'], 0.5)
+        self.assertEqual(relatorio['vereditos_invertidos']['reprovado_para_aprovado'], 1)
+        self.assertEqual(relatorio['vereditos_invertidos']['aprovado_para_reprovado'], 0)
+
+    def test_hash_entradas_ignora_ruido_de_arredondamento(self):
+        entradas = {nome: np.array([0.6, 0.6 + 1e-13]) for nome in golden.COLUNAS_ENTRADA}
+        h = golden.hash_entradas(entradas)
+        self.assertEqual(h[0], h[1])
+
+    def test_recalculo_com_falha_mantem_linha_desatualizada(self):
+        execucao = _execucao([1, 2], [1.0, 2.0])
+        resultados = [{'sucesso': True, 'leff_final': '1,5', 'status_geral': 'APROVADO'},
+                      {'sucesso': False, 'erro': 'falhou'}]
+        with mock.patch.object(golden, '_calcular_lote', return_value=resultados):
+            atualizada, recalculadas = golden.recomputar_desatualizadas(execucao, catalogo=[], processos=1)
+        self.assertEqual(recalculadas, 2)
+        self.assertEqual(atualizada['versao_engine'][0], np.uint64(versao_engine()))
+        self.assertEqual(atualizada['versao_engine'][1], 0)
+        self.assertEqual(golden.linhas_desatualizadas(atualizada, [])['total'].tolist(), [False, True])
+        self.assertEqual(atualizada['metadados']['falhas_recalculo'], 1)
+
+
+CASO_TEXTO = {
+    'c': '0,6', 'p_tf': '30', 'qa': '1,5', 'l_real': '4', 'b': '1,2', 'd': '0,3',
+    'densidade': '1.050,5', 'fb': '14', 'fv': '3.0', 'e_gpa': '7',
+}
+
+
+class ConverterDecimalTests(SimpleTestCase):
+    def test_formatos_pt_br(self):
+        self.assertEqual(converter_decimal('0,6'), 0.6)
+        self.assertEqual(converter_decimal('1.234,5'), 1234.5)
+        self.assertEqual(converter_decimal('4.216'), 4.216)
+        self.assertEqual(converter_decimal(' 1\xa0234,5 '), 1234.5)
+        self.assertEqual(converter_decimal(7), 7.0)
+
+    def test_ausente_e_invalido(self):
+        with self.assertRaises(ValueError):
+            converter_decimal(None)
+        self.assertEqual(converter_decimal(None, padrao=2.0), 2.0)
+        for texto in ('', '   ', 'abc', '1,2,3'):
+            with self.assertRaises(ValueError):
+                converter_decimal(texto)
+
+    def test_caso_exige_todos_os_campos(self):
+        with self.assertRaisesRegex(ValueError, 'd'):
+            Caso.de_dados({campo: valor for campo, valor in CASO_TEXTO.items() if campo != 'd'})
+        caso = Caso.de_dados(CASO_TEXTO)
+        self.assertEqual(caso.material.densidade, 1050.5)
+
+    def test_versao_material_aceita_milhar(self):
+        numerico = {'densidade': [1050.5], 'fb': [14.0], 'fv': [3.0], 'e_gpa': [7.0]}
+        self.assertEqual(versao_material(CASO_TEXTO)[0], versao_material(numerico)[0])
+
+    def test_golden_usa_o_mesmo_conversor(self):
+        self.assertEqual(golden._para_float('1.050,5'), 1050.5)
+        self.assertEqual(golden._para_float('2,35 m'), 2.35)
+        self.assertTrue(np.isnan(golden._para_float('')))
+
+    def test_hash_do_engine_cobre_dominio(self):
+        self.assertIn('dominio.py', [arquivo.name for arquivo in ARQUIVOS_ENGINE])
+
+    def test_ponte_de_lotes(self):
+        arr = casos_para_array([CASO_TEXTO, Caso.de_dados(CASO_TEXTO)])
+        self.assertEqual(arr.dtype, DTYPE_CASO)
+        self.assertEqual(arr['densidade'].tolist(), [1050.5, 1050.5])
+        visao = casos_de_buffer(arr)
+        self.assertTrue(np.shares_memory(visao, arr))
+        self.assertEqual(Caso.de_registro(visao[1]).para_registro(), arr[1].item())
+        self.assertEqual(len(CAMPOS_ENTRADA), len(arr.dtype.names))
+
+
+class HistoricoCargasTests(SimpleTestCase):
+    def test_csv_do_excel_com_bom(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'log.csv')
+            with open(caminho, 'w', encoding='utf-8-sig', newline='') as f:
+                f.write('mat;carga_tf;duracao_h\nM1;10,5;2\nM1;4;1\n')
+            relatorio = agregar_arquivo(caminho, capacidade_tf=50)
+        self.assertEqual(relatorio['M1']['icamentos'], 2)
+        self.assertEqual(relatorio['M1']['carga_max_tf'], 10.5)
+
+    def test_cargas_nao_finitas_sao_descartadas(self):
+        agregador = AgregadorHistorico()
+        agregador.adicionar_bloco(['M1', 'M1', 'M2'], [10.0, np.nan, np.inf], [1.0, 1.0, 1.0])
+        self.assertEqual(agregador.linhas_descartadas, 2)
+        self.assertEqual(list(agregador.indices_mat), ['M1'])
+        self.assertEqual(agregador.resultado(50)['M1']['icamentos'], 1)
+
+    def test_bloco_rejeitado_nao_registra_mats(self):
+        agregador = AgregadorHistorico()
+        agregador.adicionar_bloco(['M1'], [10.0], [1.0])
+        with self.assertRaises(ValueError):
+            agregador.adicionar_bloco(['M2', 'M3'], [5.0, -1.0], [1.0, 1.0])
+        self.assertEqual(list(agregador.indices_mat), ['M1'])
+        self.assertEqual(agregador.icamentos.shape[0], 1)
+        self.assertEqual(list(agregador.resultado(50)), ['M1'])
+
+    def test_coluna_ausente(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            for nome, conteudo in (('log.csv', 'mat;carga;duracao_h\nM1;10;2\n'),
+                                   ('log.jsonl', '{"mat": "M1", "carga_tf": 10}\n')):
+                caminho = os.path.join(pasta, nome)
+                with open(caminho, 'w', encoding='utf-8') as f:
+                    f.write(conteudo)
+                with self.assertRaisesRegex(ValueError, 'Colunas ausentes no histórico'):
+                    agregar_arquivo(caminho, capacidade_tf=50)
+
+
+def _metodo3(dados):
+    """Leffs do método 3 pelo engine certificado, sem a formatação do resumo."""
+    caso = Caso.de_dados(dados)
+    return calcular_metodo_leff_efetivo(
+        caso.solo.qa_pascals, caso.w_newtons, caso.mat.l_real, caso.mat.b, caso.mat.d, caso.carga.c,
+        caso.material.fb_pascals, caso.material.fv_pascals, caso.material.e_pascals, caso.mat.modulo_de_seccao,
+        caso.mat.momento_de_inercia)
+
+
+class CenariosTests(SimpleTestCase):
+    def test_kernel_concorda_com_o_engine(self):
+        fixos = {campo: valor for campo, valor in CASO_TEXTO.items() if campo != 'qa'}
+        kernel = cenarios.especializar(**fixos)
+        qa = np.linspace(0.3, 3.0, 60)
+        resultado = kernel(qa=qa)
+        for i, valor in enumerate(qa):
+            engine = realizar_analise_completa({**CASO_TEXTO, 'qa': repr(float(valor))})
+            self.assertEqual(resultado['aprovado'][i], engine['resumo_comparativo']['status_geral'] == 'APROVADO')
+            leffs = _metodo3({**CASO_TEXTO, 'qa': repr(float(valor))})
+            for nome in ('leff_flexao', 'leff_cisalhamento', 'leff_deflexao', 'leff_minimo_calculado'):
+                self.assertAlmostEqual(resultado[nome][i] / leffs[nome], 1.0, places=12)
+
+    def test_veredito_usa_o_arredondamento_do_engine(self):
+        perc = np.array([100.04, 100.049, 100.06, np.nan, np.inf])
+        aprovado = cenarios._aprovado(np.zeros(5), np.ones(5), perc)
+        self.assertEqual(aprovado.tolist(), [True, True, False, True, False])
+        self.assertEqual(f"{np.nextafter(cenarios.LIMITE_PERC_SOLO, 0):.1f}", '100.0')
+        self.assertEqual(f"{cenarios.LIMITE_PERC_SOLO:.1f}", '100.1')
+
+
+CASO_BORDA_SOLO = {'c': 0.6, 'qa': 1.3, 'l_real': 8, 'b': 2.372, 'd': 0.3, 'densidade': 350, 'fb': 24, 'fv': 4,
+                   'e_gpa': 11, 'p_tf': 161.2903035}
+
+
+class IntervaloTests(SimpleTestCase):
+    NOMES_LEFF = ('leff_flexao', 'leff_cisalhamento', 'leff_deflexao', 'leff_minimo_calculado')
+
+    def test_intervalos_contem_todas_as_amostras(self):
+        faixas = {'qa': (1.0, 1.6), 'e_gpa': (9.0, 12.0), 'd': (0.28, 0.32), 'p_tf': (60.0, 120.0)}
+        fixos = {campo: converter_decimal(valor) for campo, valor in CASO_TEXTO.items() if campo not in faixas}
+        resultado = calcular_metodo_leff_intervalar({**fixos, **faixas})
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            amostra = {campo: rng.uniform(lo, hi) for campo, (lo, hi) in faixas.items()}
+            engine = _metodo3({campo: repr(float(v)) for campo, v in {**fixos, **amostra}.items()})
+            for nome in self.NOMES_LEFF:
+                self.assertLessEqual(resultado[nome].lo, engine[nome])
+                self.assertGreaterEqual(resultado[nome].hi, engine[nome])
+
+    def test_caixa_degenerada_reproduz_o_engine(self):
+        dados = {campo: converter_decimal(valor) for campo, valor in CASO_TEXTO.items()}
+        resultado = calcular_metodo_leff_intervalar(dados)
+        engine = _metodo3(CASO_TEXTO)
+        for nome in self.NOMES_LEFF:
+            self.assertLessEqual(resultado[nome].lo, engine[nome])
+            self.assertGreaterEqual(resultado[nome].hi, engine[nome])
+            self.assertAlmostEqual(float(resultado[nome].hi / resultado[nome].lo), 1.0, places=12)
+        status = realizar_analise_completa(CASO_TEXTO)['resumo_comparativo']['status_geral']
+        self.assertEqual(str(resultado['veredito']), status)
+
+    def test_veredito_usa_o_arredondamento_do_engine(self):
+        resultado = calcular_metodo_leff_intervalar(CASO_BORDA_SOLO)
+        self.assertGreater(float(resultado['perc_capacidade_solo'].lo), 100.0)
+        engine = realizar_analise_completa({campo: repr(valor) for campo, valor in CASO_BORDA_SOLO.items()})
+        self.assertEqual(engine['resumo_comparativo']['status_geral'], APROVADO)
+        self.assertEqual(str(resultado['veredito']), APROVADO)
+        acima = calcular_metodo_leff_intervalar({**CASO_BORDA_SOLO, 'qa': (1.29, 1.3)})
+        self.assertEqual(str(acima['veredito']), INDETERMINADO)
+        self.assertEqual(str(calcular_metodo_leff_intervalar({**CASO_BORDA_SOLO, 'qa': 1.25})['veredito']), REPROVADO)
+
+
+GUINDASTE_ESTEIRA = {'carga_tf': 20, 'raio_m': 10, 'peso_superior_tf': 40, 'raio_cg_superior_m': 1.5,
+                     'peso_inferior_tf': 50}
+ESTEIRA = {'bitola_m': 4.0, 'comprimento_esteira_m': 6.0, 'largura_sapata_m': 0.9}
+
+
+class EsteirasTests(SimpleTestCase):
+    def test_simetria_do_giro(self):
+        angulos = np.arange(-180.0, 180.5, 0.5)
+        resultado = esteiras.pressao_esteiras(angulos, **GUINDASTE_ESTEIRA, **ESTEIRA)
+        # giro de -θ espelha as esteiras
+        np.testing.assert_allclose(resultado['p_max_pa'][0], resultado['p_max_pa'][1][::-1], rtol=1e-12)
+        np.testing.assert_allclose(resultado['ex'], resultado['ex'][::-1], rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(resultado['p_max_kgf_cm2'] * KGFCM2_PARA_PA, resultado['p_max_pa'], rtol=1e-12)
+
+    def test_pressoes_analiticas(self):
+        vertical = 110 * TF_PARA_N
+        momento = (20 * 10 - 40 * 1.5) * TF_PARA_N
+        resultado = esteiras.pressao_esteiras([0.0, 90.0], **GUINDASTE_ESTEIRA, **ESTEIRA)
+        # 0°: ex = M/V > Le/6, pressão triangular com contato 3·(Le/2 - ex)
+        contato = 3 * (3.0 - momento / vertical)
+        self.assertAlmostEqual(resultado['p_max_pa'][0, 0] / (vertical / (0.9 * contato)), 1.0, places=12)
+        self.assertEqual(resultado['tipo'][0], esteiras.TRIANGULAR)
+        # 90°: ex = 0, pressão uniforme com a força transversal da esteira do lado da lança
+        self.assertAlmostEqual(resultado['p_max_pa'][0, 1] / ((vertical / 2 + momento / 4.0) / (0.9 * 6.0)), 1.0,
+                               places=12)
+        self.assertEqual(resultado['tipo'][1], esteiras.TRAPEZOIDAL)
+
+    def test_angulo_de_pico(self):
+        angulos = np.arange(0.0, 360.0, 0.25)
+        envelope = esteiras.envelope_giro(angulos, GUINDASTE_ESTEIRA, ESTEIRA,
+                                          {'l_real': 4.0, 'b': 1.2, 'd': 0.3},
+                                          {'densidade': 350, 'fb': 24, 'fv': 4, 'e_gpa': 11}, {'qa': 2.0})
+        picos = []
+        for angulo in angulos:
+            p = esteiras.pressao_esteiras(angulo, **GUINDASTE_ESTEIRA, **ESTEIRA)['p_max_pa']
+            picos.append(p.max())
+        self.assertEqual(envelope['angulo_pico_graus'], angulos[int(np.argmax(picos))])
+        self.assertAlmostEqual(envelope['p_max_kgf_cm2'] * KGFCM2_PARA_PA / max(picos), 1.0, places=12)
+        # com momento positivo o pico fica entre a frente e o lado da lança
+        self.assertGreater(envelope['angulo_pico_graus'] % 180, 0.0)
+        self.assertLess(envelope['angulo_pico_graus'] % 180, 90.0)
+
+
+PONTOS_TABELA = (
+    # lança, raio, contrapeso, capacidade
+    (20, 5, 10, 50), (20, 10, 10, 30), (30, 5, 10, 40), (30, 10, 10, 20),
+    (20, 5, 20, 60), (20, 10, 20, 36), (30, 5, 20, 48), (30, 10, 20, 24),
+)
+
+
+def _planilha_xml(linhas):
+    """Planilha SpreadsheetML com células sem o atributo 'r' (opcional no formato)."""
+    celulas = lambda linha: ''.join(
+        f'<c t="inlineStr"><is><t>{v}</t></is></c>' if isinstance(v, str) else f'<c><v>{v}</v></c>' for v in linha)
+    corpo = ''.join(f'<row>{celulas(linha)}</row>' for linha in linhas)
+    return ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<sheetData>{corpo}</sheetData></worksheet>')
+
+
+def _escrever_xlsx(caminho, linhas):
+    """XLSX mínimo cuja primeira planilha do workbook é sheet10.xml; sheet2.xml é um chamariz."""
+    with zipfile.ZipFile(caminho, 'w') as arquivo:
+        arquivo.writestr('xl/workbook.xml', (
+            '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+            'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+            '<sheet name="Carga" sheetId="1" r:id="rId7"/><sheet name="Outra" sheetId="2" r:id="rId3"/>'
+            '</sheets></workbook>'))
+        arquivo.writestr('xl/_rels/workbook.xml.rels', (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId3" Target="worksheets/sheet2.xml"/>'
+            '<Relationship Id="rId7" Target="worksheets/sheet10.xml"/></Relationships>'))
+        arquivo.writestr('xl/worksheets/sheet10.xml', _planilha_xml(linhas))
+        arquivo.writestr('xl/worksheets/sheet2.xml', _planilha_xml([['outra'], [1]]))
+
+
+class TabelasCargaTests(SimpleTestCase):
+    def test_importacao_csv_e_xlsx(self):
+        cabecalho = ['lanca_m', 'raio_m', 'contrapeso_t', 'capacidade_t']
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho_csv = os.path.join(pasta, 'tabela.csv')
+            with open(caminho_csv, 'w', encoding='utf-8') as f:
+                f.write(';'.join(cabecalho) + '\n')
+                f.writelines(';'.join(str(v).replace('.', ',') for v in ponto) + '\n' for ponto in PONTOS_TABELA)
+            caminho_xlsx = os.path.join(pasta, 'tabela.xlsx')
+            _escrever_xlsx(caminho_xlsx, [cabecalho] + [list(ponto) for ponto in PONTOS_TABELA])
+            tabelas = [TabelaCarga.de_arquivo(caminho_csv), TabelaCarga.de_arquivo(caminho_xlsx)]
+        for tabela in tabelas:
+            np.testing.assert_array_equal(tabela.lancas, [20, 30])
+            np.testing.assert_array_equal(tabela.raios, [5, 10])
+            np.testing.assert_array_equal(tabela.contrapesos, [10, 20])
+            self.assertEqual(tabela.capacidades[1, 1, 0], 48)
+
+    def test_interpolacao(self):
+        tabela = TabelaCarga(*np.array(PONTOS_TABELA, dtype=np.float64).T)
+        # nos pontos tabelados, bilinear no centro da célula e menor canto no modo conservador
+        np.testing.assert_allclose(tabela.capacidade([20, 30], [5, 10], 10), [50, 20])
+        self.assertAlmostEqual(float(tabela.capacidade(25, 7.5, 10)), 35.0)
+        self.assertAlmostEqual(float(tabela.capacidade(25, 7.5, 10, modo=CONSERVADOR)), 20.0)
+        # contrapeso intermediário usa o maior tabelado que não excede o real
+        self.assertAlmostEqual(float(tabela.capacidade(20, 5, 15)), 50.0)
+        self.assertTrue(np.isnan(tabela.capacidade(20, 5, 5)))
+        self.assertTrue(np.all(np.isnan(tabela.capacidade([19, 20], [5, 11], 10))))
+        # arredondamento para baixo no passo de 0,1 t
+        self.assertAlmostEqual(float(tabela.capacidade(21, 5, 10)), 49.0)
+        self.assertAlmostEqual(float(tabela.capacidade(20, 5.3, 10, modo=BILINEAR)), 48.8)
+
+
+ESTOQUE_MATS = (
+    {'nome': 'A', 'l_real': 4.0, 'b': 1.2, 'd': 0.3, 'quantidade': 3,
+     'material': {'densidade': 700, 'fb': 24, 'fv': 4, 'e_gpa': 11}},
+    {'nome': 'B', 'l_real': 6.0, 'b': 1.0, 'd': 0.25, 'quantidade': 2,
+     'material': {'densidade': 500, 'fb': 18, 'fv': 3, 'e_gpa': 9}},
+)
+
+
+class ArranjosMatsTests(SimpleTestCase):
+    def test_enumeracao(self):
+        arranjos = arranjos_mats.enumerar_arranjos(ESTOQUE_MATS)
+        # camada única: A 3 + 3 (girado), B 2 + 2; cruzados: A/A 3, A/B 6, B/A 6, B/B 1
+        self.assertEqual(len(arranjos['peso_kg']), 26)
+        self.assertTrue(np.all(np.diff(arranjos['peso_kg']) >= 0))
+        self.assertEqual(int(arranjos['inf_presente'].sum()), 16)
+        i = list(arranjos['descricao']).index('3× A (longitudinal)')
+        self.assertEqual((arranjos['sup_l_real'][i], arranjos['sup_b'][i]), (4.0, 3 * 1.2))
+        i = list(arranjos['descricao']).index('2× B sobre 1× A (cruzado)')
+        self.assertEqual(arranjos['sup_l_real'][i], 1.2)   # vão limitado à largura da camada inferior
+        self.assertEqual(arranjos['inf_c'][i], 2.0)
+
+    def test_arranjo_mais_leve_aprovado(self):
+        patolas = [{'c': 0.6, 'p_tf': p, 'qa': 1.5} for p in (10, 40, 60, 80, 100, 2000)]
+        escolhidos = arranjos_mats.melhor_arranjo(ESTOQUE_MATS, patolas, tamanho_bloco=3)
+        arranjos = arranjos_mats.enumerar_arranjos(ESTOQUE_MATS)
+        aprovado = arranjos_mats.avaliar_arranjos(arranjos, patolas)['aprovado']
+        for j, escolhido in enumerate(escolhidos):
+            if not aprovado[:, j].any():
+                self.assertIsNone(escolhido)
+                continue
+            primeiro = int(np.argmax(aprovado[:, j]))
+            self.assertEqual(escolhido['descricao'], arranjos['descricao'][primeiro])
+            self.assertEqual(escolhido['peso_kg'], arranjos['peso_kg'][primeiro])
+        self.assertIsNone(escolhidos[-1])
+        self.assertIsNotNone(escolhidos[0])
+
+    def test_camada_equivale_a_partilha_igual(self):
+        # A partilha de MultiMat só é igual (1/n) com mats iguais sob sapata rígida que cobre todos
+        multimat = MultiMat([{'length': 4.0, 'width': 1.2, 'thickness': 0.3, 'young_gpa': 11}] * 3, 20_000, nodes=201)
+        np.testing.assert_allclose(multimat.load_share(0.6, 3 * 1.2)[0], 1 / 3, rtol=1e-9)
+        self.assertAlmostEqual(multimat.load_share(0.6, 1.2, pad_y=1.2)[0][-1], 1.0)
+        # e nesse caso a camada equivalente (largura 3·B, carga P) é cada mat com P/3
+        fixos = {'c': 0.6, 'qa': 1.5, 'l_real': 4.0, 'd': 0.3, 'densidade': 700, 'fb': 24, 'fv': 4, 'e_gpa': 11}
+        camada = cenarios.especializar(**fixos, b=3 * 1.2)(p_tf=np.array([30.0, 90.0]))
+        individual = cenarios.especializar(**fixos, b=1.2)(p_tf=np.array([10.0, 30.0]))
+        for nome in ('leff_minimo_calculado', 'perc_capacidade_solo', 'aprovado'):
+            np.testing.assert_allclose(camada[nome], individual[nome], rtol=1e-12)
+
+
+def _winkler_denso(force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width, nodes):
+    """Solução de referência com a matriz densa e np.linalg.solve (formulação original)."""
+    ks = ks_kn_m3 * 1000
+    ei = young_gpa * 1e9 * inertia_rectangular(width, thickness)
+    dx = length / (nodes - 1)
+    x = np.linspace(0.0, length, nodes)
+    q = np.zeros(nodes)
+    if patch_width is None:
+        q[nodes // 2] = force_ton * TON_TO_N / dx
+    else:
+        mask = np.abs(x - length / 2) <= patch_width / 2
+        q[mask] = force_ton * TON_TO_N / (mask.sum() * dx)
+    mat = np.zeros((nodes, nodes))
+    i = np.arange(2, nodes - 2)
+    for k, coef in enumerate((1.0, -4.0, 6.0 + ks * dx**4 / ei, -4.0, 1.0)):
+        mat[i, i + k - 2] = coef
+    mat[0, 0] = mat[-1, -1] = 1.0
+    mat[1, 0], mat[1, 1] = -1.0 / dx, 1.0 / dx
+    mat[-2, -2], mat[-2, -1] = -1.0 / dx, 1.0 / dx
+    rhs = q * dx**4 / ei
+    rhs[[0, 1, -2, -1]] = 0.0
+    p = ks * np.linalg.solve(mat, rhs)
+    i0 = int(np.argmax(p))
+    i1, i2 = i0, i0
+    while i1 > 0 and p[i1] >= p_lim_abs_pa:
+        i1 -= 1
+    while i2 < len(p) and p[i2] >= p_lim_abs_pa:
+        i2 += 1
+    return {'leff_total': (i2 - i1 - 1) * dx, 'p_max': float(p.max())}
+
+
+def _densa(bands):
+    """Matriz densa A[i, i + k - 2] = bands[k, i]."""
+    n = bands.shape[-1]
+    mat = np.zeros((n, n))
+    for k in range(5):
+        i = np.arange(max(0, 2 - k), min(n, n + 2 - k))
+        mat[i, i + k - 2] = bands[k, i]
+    return mat
+
+
+CASOS_WINKLER = (
+    (160, 2.4, 1.8, 0.30, 22, 50_000, 0.3 * KGFCM2_TO_PA, None),
+    (30, 6.0, 1.0, 0.30, 10, 20_000, 0.5 * KGFCM2_TO_PA, 0.6),
+    (80, 4.0, 1.2, 0.25, 12, 80_000, 1.5 * KGFCM2_TO_PA, 1.0),
+)
+
+
+def _conjunto_ativo_denso(model, q, tensionless, p_cap_pa):
+    """Conjunto ativo por força bruta: matriz densa montada e resolvida a cada iteração."""
+    escala = model.dx**4 / model.ei
+    interior = np.zeros(model.nodes, dtype=bool)
+    interior[2:-2] = True
+    estado = np.full(model.nodes, ELASTIC)
+    for _ in range(100):
+        molas = (estado == ELASTIC) & interior
+        rhs = q * escala - np.where(estado == CAPPED, (p_cap_pa or 0.0) * escala, 0.0)
+        rhs[boundary_rows(model.nodes)] = 0.0
+        w = np.linalg.solve(_densa(model.bands(springs=molas)), rhs)
+        p = model.ks * w
+        novo = np.full(model.nodes, ELASTIC)
+        if tensionless:
+            novo[p < 0] = LIFTED
+        if p_cap_pa is not None:
+            novo[p > p_cap_pa] = CAPPED
+        novo[~interior] = ELASTIC
+        if np.array_equal(novo, estado):
+            return w, estado
+        estado = novo
+    raise AssertionError("conjunto ativo denso não convergiu")
+
+
+class NaoLinearTests(SimpleTestCase):
+    def test_conjunto_ativo_igual_ao_denso(self):
+        model = WinklerModel(10.0, 1.0, 0.3, 10, 80_000, 201)
+        q = load_vector(model.x, model.length, 30 * TON_TO_N, model.dx)
+        p_linear = model.soil_pressure(model.solve(q)).max()
+        for tensionless, p_cap in ((True, None), (False, 0.6 * p_linear), (True, 0.6 * p_linear)):
+            w_ref, estado_ref = _conjunto_ativo_denso(model, q, tensionless, p_cap)
+            # max_changes alto exercita só Woodbury; 0 força refatorar a cada mudança
+            for max_changes in (model.nodes, 0):
+                resultado = NonlinearWinkler(model, tensionless, p_cap, max_changes=max_changes).solve(q)
+                self.assertTrue(resultado['converged'])
+                np.testing.assert_array_equal(resultado['states'], estado_ref)
+                np.testing.assert_allclose(resultado['w'], w_ref, rtol=0, atol=1e-10 * np.abs(w_ref).max())
+                if tensionless:
+                    self.assertGreater(np.count_nonzero(resultado['states'] == LIFTED), 0)
+                    self.assertGreaterEqual(resultado['p'].min(), 0.0)
+                if p_cap is not None:
+                    self.assertGreater(np.count_nonzero(resultado['states'] == CAPPED), 0)
+                    self.assertLessEqual(resultado['p'].max(), p_cap)
+                if max_changes == 0:
+                    self.assertGreater(resultado['factorizations'], 0)
+
+    def test_engaste_nao_descola(self):
+        model = WinklerModel(10.0, 1.0, 0.3, 10, 80_000, 201)
+        q = load_vector(model.x, model.length, 30 * TON_TO_N, model.dx)
+        resultado = NonlinearWinkler(model).solve(q)
+        np.testing.assert_array_equal(resultado['states'][boundary_rows(model.nodes)], ELASTIC)
+        self.assertEqual(resultado['w'][0], 0.0)
+        self.assertEqual(resultado['w'][-1], 0.0)
+
+
+class ZonasContatoTests(SimpleTestCase):
+    X = np.linspace(0.0, 10.0, 101)
+    DX = 0.1
+
+    def test_cruzamento_linear_exato(self):
+        # p linear por partes com o bico num nó: a interpolação linear é exata
+        p = np.maximum(0.0, 1 - np.abs(self.X - 5) / 2)
+        self.assertAlmostEqual(float(effective_length(p, 0.37, self.DX, LINEAR)), 4 * 0.63, places=12)
+        zonas = contact_zones(p, 0.37, self.DX)
+        self.assertAlmostEqual(float(zonas['start']), 5 - 2 * 0.63, places=12)
+        self.assertAlmostEqual(float(zonas['end']), 5 + 2 * 0.63, places=12)
+        self.assertAlmostEqual(float(effective_length(p, 0.37, self.DX, NODE)), 2.5, places=12)
+
+    def test_cruzamento_cubico_exato_para_parabola(self):
+        # o Hermite com inclinações centradas reproduz parábolas; o linear erra por O(dx²)
+        p = 1 - ((self.X - 5) / 3) ** 2
+        exato = 6 * np.sqrt(0.63)
+        self.assertAlmostEqual(float(effective_length(p, 0.37, self.DX, CUBIC)), exato, places=10)
+        linear = float(effective_length(p, 0.37, self.DX, LINEAR))
+        self.assertNotAlmostEqual(linear, exato, places=6)
+        self.assertLess(abs(linear - exato), 1e-3)
+
+    def test_varias_zonas(self):
+        p = np.maximum(np.maximum(0.0, 1 - np.abs(self.X - 3) / 1.5), 0.8 * (1 - np.abs(self.X - 7) / 1.5))
+        zonas = contact_zones(p, 0.5, self.DX)
+        self.assertEqual(int(zonas['zones']), 2)
+        self.assertAlmostEqual(float(zonas['leff_total']), 1.5, places=12)
+        self.assertAlmostEqual(float(zonas['start']), 2.25, places=12)
+        self.assertAlmostEqual(float(zonas['contact_total']), 1.5 + 1.125, places=12)
+
+    def test_sem_contato_e_lote(self):
+        p = np.maximum(0.0, 1 - np.abs(self.X - 5) / 2)
+        zonas = contact_zones(p, np.array([0.37, 1.5]), self.DX)
+        self.assertAlmostEqual(zonas['leff_total'][0], 2.52, places=12)
+        self.assertEqual(zonas['leff_total'][1], 0.0)
+        self.assertTrue(np.isnan(zonas['start'][1]))
+        self.assertEqual(zonas['zones'].tolist(), [1, 0])
+        for method in (LINEAR, CUBIC):
+            self.assertEqual(float(effective_length(p, 1.5, self.DX, method)), 0.0)
+        # o critério NODE mantém o resultado legado (-dx) sem contato
+        self.assertAlmostEqual(float(effective_length(p, 1.5, self.DX, NODE)), -self.DX)
+        with self.assertRaises(ValueError):
+            effective_length(p, 0.5, self.DX, 'spline')
+
+
+class WinklerTests(SimpleTestCase):
+    def test_banda_equivale_ao_solver_denso(self):
+        for caso in CASOS_WINKLER:
+            referencia = _winkler_denso(*caso, nodes=201)
+            resultado = winkler_leff(*caso, 201)
+            self.assertAlmostEqual(resultado['leff_total'], referencia['leff_total'], places=12)
+            self.assertLess(abs(resultado['p_max'] / referencia['p_max'] - 1), 1e-7)
+
+    def test_adaptativo_respeita_max_nodes(self):
+        caso = CASOS_WINKLER[1]
+        resultado = winkler_leff_adaptive(*caso, nodes=101, max_nodes=150)
+        self.assertEqual([n for n, _ in resultado['levels']], [101])
+        self.assertFalse(resultado['converged'])
+        resultado = winkler_leff_adaptive(*caso, tol=0.0, nodes=101, max_nodes=401)
+        self.assertLessEqual(max(n for n, _ in resultado['levels']), 401)
+        with self.assertRaises(ValueError):
+            winkler_leff_adaptive(*caso, nodes=501, max_nodes=401)
+
+    def test_linhas_de_influencia_com_perfil_assimetrico(self):
+        perfis = (
+            {'thickness': 0.3, 'ks_kn_m3': 20_000},
+            {'thickness': piecewise(0.3, (0.0, 1.0, 0.1)), 'ks_kn_m3': 20_000},
+            {'thickness': 0.3, 'ks_kn_m3': piecewise(20_000, (3.5, 5.0, 2_000))},
+        )
+        for perfil in perfis:
+            model = WinklerModel(6.0, 1.0, perfil['thickness'], 10, perfil['ks_kn_m3'], 61)
+            rhs = np.eye(model.nodes) * (model.dx**3 / model.ei)
+            rhs[[0, 1, -2, -1]] = 0.0
+            esperado = np.linalg.solve(_densa(model.bands()), rhs)
+            linhas = InfluenceLines(model)
+            np.testing.assert_allclose(linhas.deflection, esperado, rtol=1e-9, atol=1e-12 * np.abs(esperado).max())
+
+    def test_varredura_vazia(self):
+        resultado = winkler_sweep.winkler_sweep({
+            'force_ton': np.empty((0, 3)), 'length': 6.0, 'width': 1.0, 'thickness': 0.3, 'young_gpa': 10,
+            'ks_kn_m3': 20_000, 'p_lim_abs_pa': KGFCM2_TO_PA,
+        }, processos=1)
+        self.assertEqual(resultado['groups'], 0)
+        for coluna in ('leff', 'leff_total', 'p_max'):
+            self.assertEqual(resultado[coluna].shape, (0, 3))
+
+    def test_varredura_parte_grupos_grandes(self):
+        casos = winkler_sweep.sweep_grid(force_ton=np.linspace(5, 80, 7), length=(4.0, 6.0), width=1.0,
+                                         thickness=0.3, young_gpa=10, ks_kn_m3=20_000,
+                                         p_lim_abs_pa=np.array([0.5, 1.0]) * KGFCM2_TO_PA)
+        chaves = winkler_sweep._chaves({**casos, 'patch_width': np.full(len(casos['force_ton']), np.nan)})
+        cortes = winkler_sweep._trechos(chaves[np.lexsort(chaves.T[::-1])], 2)
+        self.assertGreater(len(cortes), 3)
+        with mock.patch.object(winkler_sweep, 'CASOS_POR_LOTE', 3):
+            resultado = winkler_sweep.winkler_sweep(casos, nodes=101, processos=1)
+        self.assertEqual(resultado['groups'], 2)
+        for i in range(len(casos['force_ton'])):
+            esperado = winkler_leff(casos['force_ton'][i], casos['length'][i], 1.0, 0.3, 10, 20_000,
+                                    casos['p_lim_abs_pa'][i], None, 101)
+            self.assertAlmostEqual(resultado['leff_total'][i], esperado['leff_total'])
+            self.assertAlmostEqual(resultado['p_max'][i] / esperado['p_max'], 1.0)
+
+    def test_lote_equivale_a_cada_caso(self):
+        colunas = [np.array(valores, dtype=np.float64) for valores in zip(*CASOS_WINKLER)]
+        colunas[-1] = np.array([np.nan if v is None else v for v in colunas[-1]])
+        for method in (NODE, LINEAR):
+            lote = winkler_leff_batch(*colunas, nodes=101, method=method, block=2, profiles=True)
+            for i, caso in enumerate(CASOS_WINKLER):
+                esperado = winkler_leff(*caso, 101, method=method, profiles=True)
+                self.assertAlmostEqual(lote['leff_total'][i], esperado['leff_total'])
+                self.assertAlmostEqual(lote['p_max'][i] / esperado['p_max'], 1.0)
+                for nome in ('w', 'p', 'moment', 'shear'):
+                    y = esperado['profiles'][nome]['y']
+                    np.testing.assert_allclose(lote['profiles'][nome]['y'][i], y, rtol=1e-9,
+                                               atol=1e-9 * np.abs(y).max())
+
+    def test_campo_aleatorio_sem_contato_tem_leff_nulo(self):
+        argumentos = (5, 6.0, 1.0, 0.3, 10, 20_000, 5 * KGFCM2_TO_PA)
+        resultado = winkler_random_field.winkler_random_field(*argumentos, realizations=20, nodes=101, seed=1)
+        self.assertTrue(np.all(resultado['leff_total'] == 0.0))
+        self.assertEqual(resultado['stats']['leff']['mean'], 0.0)
+        self.assertEqual(resultado['deterministic']['leff'], 0.0)
+        with self.assertRaises(ValueError):
+            winkler_random_field.winkler_random_field(*argumentos, realizations=1, nodes=101)
+
+    def test_reducao_minmax(self):
+        x = np.linspace(0.0, 1.0, 101)
+        y = np.sin(7 * x)
+        y[37] = 5.0
+        for pontos in (2, 5, 10):
+            xr, yr = downsample_minmax(x, y, pontos)
+            self.assertLessEqual(len(yr), pontos)
+            self.assertEqual(yr.max(), 5.0)
+            self.assertEqual(yr.min(), y.min())
+            self.assertTrue(np.all(np.diff(xr) > 0))
+        with self.assertRaises(ValueError):
+            downsample_minmax(x, y, 1)
+
+    def test_multimat_partilha_e_equilibrio(self):
+        mats = [
+            {'length': 6.0, 'width': 1.0, 'thickness': 0.3, 'young_gpa': 10},
+            {'length': 6.0, 'width': 1.2, 'thickness': 0.25, 'young_gpa': 10, 'ks_kn_m3': 40_000},
+            {'length': 5.0, 'width': 0.8, 'thickness': 0.3, 'young_gpa': 10},
+        ]
+        multimat = MultiMat(mats, 20_000, gap=0.1, nodes=201)
+        pesos = np.broadcast_to(multimat.dx[:, np.newaxis], multimat.x.shape).copy()
+        pesos[:, [0, -1]] /= 2
+        for pad_ei in (None, 0.0, 1e6, 1e9, 1e13):
+            resultado = multimat.analyze(50, 2.0, 3.0, pad_y=0.3, pad_ei=pad_ei)
+            self.assertAlmostEqual(resultado['share'].sum(), 1.0, places=12)
+            reacao = (resultado['pressure'] * multimat.width[:, np.newaxis] * pesos).sum(axis=-1)
+            np.testing.assert_allclose(reacao, resultado['force_n'], rtol=1e-7)
+        rigida = multimat.load_share(2.0, 3.0, pad_y=0.3)[0]
+        np.testing.assert_allclose(multimat.load_share(2.0, 3.0, pad_y=0.3, pad_ei=1e13)[0], rigida, atol=1e-6)
+
+        simetrico = MultiMat([mats[0], mats[1], mats[0]], 20_000, gap=0.1, nodes=201)
+        for pad_ei in (None, 0.0, 1e8):
+            parcela = simetrico.load_share(2.0, 3.0, pad_ei=pad_ei)[0]
+            np.testing.assert_allclose(parcela, parcela[::-1], rtol=1e-7)
+
+
+def _cruzados(nodes=21):
+    return CrossedMats({'count': 3, 'length': 4.0, 'width': 1.2, 'thickness': 0.3, 'young_gpa': 11, 'nodes': nodes},
+                       {'count': 4, 'length': 5.0, 'width': 1.0, 'thickness': 0.25, 'young_gpa': 9, 'gap': 0.1,
+                        'nodes': nodes + 4}, 20_000)
+
+
+def _rigidez_cruzada_densa(modelo):
+    """K = blocos (densos) + kc·Σ g·gᵀ, com g os pesos de cada cruzamento."""
+    k = _densa(modelo.bandas)
+    g = np.zeros((len(modelo.cruzamentos), modelo.tamanho))
+    np.add.at(g, (modelo.c_contato, modelo.i_contato), modelo.p_contato)
+    return k + modelo.kc * g.T @ g
+
+
+class CruzadosTests(SimpleTestCase):
+    def test_rigidez_simetrica_e_igual_a_densa(self):
+        modelo = _cruzados()
+        densa = _rigidez_cruzada_densa(modelo)
+        np.testing.assert_allclose(densa, densa.T, rtol=0, atol=1e-9 * np.abs(densa).max())
+        self.assertGreater(np.linalg.eigvalsh(densa).min(), 0.0)
+        colunas = np.stack([modelo.matvec(e) for e in np.eye(modelo.tamanho)], axis=1)
+        np.testing.assert_allclose(colunas, densa, rtol=0, atol=1e-12 * np.abs(densa).max())
+
+        forcas = modelo.pad_load(60, 0.8, pad_x=0.3, pad_y=0.4)
+        w_sup, w_inf, _, convergiu = modelo.solve(forcas)
+        self.assertTrue(convergiu)
+        b = np.zeros(modelo.tamanho)
+        b[:modelo.inicio_inf] = forcas.ravel()
+        esperado = np.linalg.solve(densa, b)
+        np.testing.assert_allclose(np.concatenate([w_sup.ravel(), w_inf.ravel()]), esperado, rtol=0,
+                                   atol=1e-8 * np.abs(esperado).max())
+
+    def test_equilibrio_e_simetria(self):
+        modelo = _cruzados()
+        resultado = modelo.analyze(60, 0.8)
+        forca = 60 * TON_TO_N
+        pesos = modelo.camadas['bottom']['pesos']
+        reacao = (resultado['pressure_bottom'] * modelo.bottom['width'] * pesos).sum()
+        self.assertAlmostEqual(reacao / forca, 1.0, places=8)
+        self.assertAlmostEqual(resultado['crossing_forces'].sum() / forca, 1.0, places=8)
+        # sapata centrada em arranjo simétrico: resposta simétrica nas duas direções
+        np.testing.assert_allclose(resultado['w_bottom'], resultado['w_bottom'][::-1, ::-1], rtol=1e-7)
+        np.testing.assert_allclose(resultado['crossing_forces'], resultado['crossing_forces'][::-1, ::-1], rtol=1e-7)
+
+
+def _placa_densa(placa):
+    """Rigidez densa da placa (uma componente) aplicando matvec a cada célula."""
+    n = placa.nx * placa.ny
+    return np.stack([placa.matvec(e.reshape(1, placa.ny, placa.nx)).ravel() for e in np.eye(n)], axis=1)
+
+
+class PlacaTests(SimpleTestCase):
+    def test_rigidez_simetrica_positiva_e_igual_a_solucao_densa(self):
+        # isotrópica com Pasternak e ortotrópica forte (Ex/Ey = 30 > 1/ν²)
+        for opcoes in ({'pasternak_kn_m': 500.0}, {'young_transverse_gpa': 10 / 30}):
+            placa = WinklerPlate(3.0, 1.2, 0.3, 10, 20_000, nx=4, ny=12, **opcoes)
+            densa = _placa_densa(placa)
+            np.testing.assert_allclose(densa, densa.T, rtol=0, atol=1e-12 * np.abs(densa).max())
+            self.assertGreater(np.linalg.eigvalsh(densa).min(), 0.0)
+
+            q = placa.pad_load(30, 0.8, center=(0.4, 0.2))
+            w, _, convergiu = placa.solve(q)
+            self.assertTrue(convergiu)
+            esperado = np.linalg.solve(densa, q.ravel())
+            np.testing.assert_allclose(w.ravel(), esperado, rtol=0, atol=1e-7 * np.abs(esperado).max())
+
+    def test_equilibrio_da_pressao(self):
+        forca = 30 * TON_TO_N
+        for opcoes in ({}, {'pasternak_kn_m': 500.0}, {'shear_deformation': True}, {'young_transverse_gpa': 2.0}):
+            placa = WinklerPlate(3.0, 1.2, 0.3, 10, 20_000, nx=30, ny=12, **opcoes)
+            resultado = placa.analyze(30, 0.8, center=(0.5, 0.1))
+            self.assertTrue(resultado['converged'])
+            reacao = resultado['pressure'].sum() * placa.hx * placa.hy
+            self.assertAlmostEqual(reacao / forca, 1.0, places=6)
+
+    def test_rejeita_ortotropia_indefinida(self):
+        # ν²·Ey > Ex: D1² > Dx·Dy
+        with self.assertRaisesRegex(ValueError, 'ortotrópico'):
+            WinklerPlate(3.0, 1.2, 0.3, 1, 20_000, nx=10, ny=4, young_transverse_gpa=12)
+
+
+class TimoshenkoTests(SimpleTestCase):
+    def test_perfis_nodais_iguais_aos_escalares(self):
+        nodes = 201
+        escalar = winkler_leff_timoshenko(30, 4, 1, 0.3, 10, 20_000, 3e4, 0.6, nodes=nodes, shear_modulus_gpa=0.625)
+        nodal = winkler_leff_timoshenko(30, 4, 1, np.full(nodes, 0.3), np.full(nodes, 10.0), np.full(nodes, 20_000.0),
+                                        3e4, 0.6, nodes=nodes, shear_modulus_gpa=np.full(nodes, 0.625))
+        self.assertEqual(nodal, escalar)
+
+    def test_perfil_nodal_linear_igual_a_funcao(self):
+        # para ks linear em x, a média dos nós é o valor no meio do elemento
+        x = np.linspace(0.0, 4.0, 201)
+
+        def ks(x):
+            return 15_000 + 2_500 * x
+
+        nodal = TimoshenkoWinkler(4, 1, 0.3, 10, ks(x)).pressure(30, 0.6)
+        funcao = TimoshenkoWinkler(4, 1, 0.3, 10, ks).pressure(30, 0.6)
+        np.testing.assert_allclose(nodal, funcao, rtol=1e-12)
+
+    def test_limite_de_euler_bernoulli(self):
+        # G muito grande: φ → 0 e a viga recai na de Euler-Bernoulli
+        timoshenko = winkler_leff_timoshenko(30, 4, 1, 0.3, 10, 20_000, 3e4, 0.6, nodes=801, shear_modulus_gpa=1e6)
+        euler = winkler_leff(30, 4, 1, 0.3, 10, 20_000, 3e4, 0.6, nodes=801)
+        self.assertAlmostEqual(timoshenko['p_max'] / euler['p_max'], 1.0, delta=5e-3)
+        self.assertAlmostEqual(timoshenko['leff'], euler['leff'], delta=0.01)
+
+
+def _livre_livre(force_ton, length, width, thickness, young_gpa, ks_kn_m3, nodes=401, load_x=None, patch_width=None):
+    """Viga livre-livre por diferenças finitas, molas ks·B pela regra dos trapézios."""
+    dx = length / (nodes - 1)
+    x = np.linspace(0.0, length, nodes)
+    pesos = np.full(nodes, dx)
+    pesos[[0, -1]] /= 2
+    bandas = assemble_free_bands(nodes, dx, young_gpa * 1e9 * inertia_rectangular(width, thickness),
+                                 ks_kn_m3 * 1000 * pesos)
+    centro = length / 2 if load_x is None else load_x
+    forca = force_ton * TON_TO_N
+    if patch_width is None:
+        f = np.zeros(nodes)
+        f[np.abs(x - centro).argmin()] = forca
+    else:
+        # fração da faixa na área de influência de cada nó
+        cobertura = (np.minimum(np.minimum(x + dx / 2, length), centro + patch_width / 2)
+                     - np.maximum(np.maximum(x - dx / 2, 0.0), centro - patch_width / 2))
+        f = forca * np.clip(cobertura, 0.0, None) / patch_width
+    w = solve_pentadiagonal(factor_pentadiagonal(bandas), f)
+    return x, ks_kn_m3 * 1000 * w
+
+
+class HetenyiTests(SimpleTestCase):
+    def test_igual_ao_modelo_livre_livre(self):
+        mat = (30, 4, 1, 0.3, 10, 20_000)
+        # inclui cargas perto da ponta, onde o pico é a própria extremidade livre
+        for carga in ({}, {'load_x': 1.2}, {'load_x': 0.1}, {'patch_width': 0.6}, {'patch_width': 0.6, 'load_x': 0.9}):
+            x, esperado = _livre_livre(*mat, **carga)
+            p = hetenyi_response(x, *mat, **carga)['p']
+            np.testing.assert_allclose(p, esperado, rtol=0, atol=1e-4 * esperado.max())
+            resultado = hetenyi_leff(*mat, 5e4, **carga)
+            self.assertAlmostEqual(float(resultado['p_max']) / esperado.max(), 1.0, delta=1e-4)
+
+    def test_mat_curto_e_macio(self):
+        # λ·L ≈ 0,33: mat quase rígido, p ≈ F/L. Com ks·dx também nos nós das
+        # pontas o modelo numérico teria L + dx de solo e p_max ~2,5% menor
+        mat = (10, 1, 1, 0.3, 10, 1_000)
+        x, esperado = _livre_livre(*mat, nodes=41)
+        p_max = float(hetenyi_leff(*mat, 5e4)['p_max'])
+        self.assertAlmostEqual(p_max / esperado.max(), 1.0, delta=1e-4)
+        self.assertAlmostEqual(p_max / (10 * TON_TO_N / 1.0), 1.0, delta=1e-3)
+        np.testing.assert_allclose(hetenyi_response(x, *mat)['p'], esperado, rtol=1e-4)
@@ -0,0 +1,78 @@
+# engine/versao.py
+
+"""
+Identificação da versão do engine e dos dados de material usados em um resultado.
+
+A versão do engine é um hash do conteúdo dos arquivos de cálculo; a versão do
+material é um hash das propriedades numéricas da madeira. Ambas são inteiros
+de 64 bits, para caberem como colunas nos arquivos golden.
+"""
+
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from engine.dominio import converter_decimal
+
+RAIZ_PROJETO = Path(__file__).resolve().parent.parent
+
+# Arquivos cujo conteúdo define os números produzidos por uma análise
+ARQUIVOS_ENGINE = (
+    RAIZ_PROJETO / 'engine' / 'pressio_engine.py',
+    RAIZ_PROJETO / 'engine' / 'dominio.py',
+    RAIZ_PROJETO / 'analysis_processor.py',
+)
+
+# Propriedades do material que entram no cálculo
+COLUNAS_MATERIAL = ('fb', 'fv', 'e_gpa', 'densidade')
+
+_SEMENTE_MATERIAL = np.uint64(0x6d61746572696169)
+
+
+def _splitmix64(x):
+    x = x + np.uint64(0x9e3779b97f4a7c15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return x ^ (x >> np.uint64(31))
+
+
+def hash_colunas(colunas, nomes, semente):
+    """Hash vetorizado de 64 bits por linha sobre as colunas `nomes`."""
+    n = len(colunas[nomes[0]])
+    h = np.full(n, semente, dtype=np.uint64)
+    for posicao, nome in enumerate(nomes):
+        # '+ 0.0' normaliza -0.0 para 0.0 antes de olhar os bits
+        valores = np.round(np.asarray(colunas[nome], dtype=np.float64), 9) + 0.0
+        h = _splitmix64(h ^ _splitmix64(valores.view(np.uint64) + np.uint64(posicao)))
+    return h
+
+
+@lru_cache(maxsize=1)
+def versao_engine():
+    """Hash (uint64) do código do engine. Calculado uma vez por processo."""
+    digest = hashlib.blake2b(digest_size=8)
+    for arquivo in ARQUIVOS_ENGINE:
+        digest.update(arquivo.name.encode('utf-8'))
+        digest.update(arquivo.read_bytes())
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def versao_engine_hex():
+    return f"{versao_engine():016x}"
+
+
+def versao_material(colunas):
+    """
+    Hash por linha das propriedades do material. Aceita colunas numéricas
+    (arrays) ou um único dicionário do catálogo, com valores em texto.
+    """
+    if all(isinstance(colunas[nome], str) for nome in COLUNAS_MATERIAL):
+        colunas = {nome: [converter_decimal(colunas[nome])] for nome in COLUNAS_MATERIAL}
+    return hash_colunas(colunas, COLUNAS_MATERIAL, _SEMENTE_MATERIAL)
+
+
+def versoes_catalogo(catalogo):
+    """Dicionário nome da madeira -> hash atual de suas propriedades."""
+    return {madeira['nome']: int(versao_material(madeira)[0]) for madeira in catalogo}
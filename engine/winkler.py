@@ -0,0 +1,805 @@
+# engine/winkler.py
+
+"""
+Viga sobre base elástica de Winkler (diferenças finitas) com solver em banda.
+
+O sistema de `winkler_leff` é pentadiagonal: o estêncil interior da quarta
+derivada [1, -4, 6 + a, -4, 1] e as linhas de contorno (w = 0 e dw/dx = 0 nas
+extremidades). Em vez da matriz densa nodes × nodes e de `np.linalg.solve`
+(O(n³) em tempo e O(n²) em memória), a matriz é montada de forma vetorizada
+diretamente no armazenamento em banda e fatorada por LU sem pivotamento em
+O(n).
+
+Armazenamento em banda (por linha): bands[..., k, i] = A[i, i + k - 2], com
+k = 0..4 para os deslocamentos -2..+2. O fator LU usa o mesmo formato,
+lu[..., :, i] = (l2, l1, u0, u1, u2), e dimensões iniciais extras são
+tratadas como lote de sistemas independentes. `factor_banded` estende o
+mesmo formato a uma meia largura p qualquer (2p + 1 bandas).
+
+A matriz só depende de comprimento, nós, E·I e ks: `WinklerModel` busca o
+fator em um cache LRU com essa chave e resolve vários carregamentos de uma
+vez. Como a resposta é linear na força, varreduras de carga e de p_lim viram
+pós-processamento de uma única solução. Geometrias diferentes com o mesmo
+número de nós são resolvidas juntas por `winkler_leff_batch`. Com
+`profiles`, ambos devolvem também os perfis de w, p, M e V e seus picos,
+opcionalmente reduzidos por `downsample_minmax` para armazenamento e gráficos.
+
+ks, E e a espessura podem variar ao longo do mat (solo com pontos moles,
+trechos danificados ou emendados): cada um aceita escalar, array nodal,
+função de x ou `piecewise`. Com EI(x) o estêncil interior vem da forma
+conservativa (EI·w'')'' e é escalado pelo EI de referência (o máximo).
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+TON_TO_N = 9806.65
+KGFCM2_TO_PA = 98066.5
+
+NODES = 801
+FACTOR_CACHE_SIZE = 64
+BATCH_BLOCK = 1024
+
+# Refinamento adaptativo: malhas aninhadas nodes -> 2·nodes - 1. Acima de
+# ~6 400 nós o número de condição (~nodes⁴) do biharmônico esgota a precisão
+# dupla e o Leff volta a piorar, por isso o limite padrão.
+ADAPTIVE_START_NODES = 101
+ADAPTIVE_MAX_NODES = 6401
+ADAPTIVE_TOL_M = 1e-3
+ADAPTIVE_DEFAULT_ORDER = 1.0   # as linhas de contorno (dw/dx = 0) são de 1ª ordem
+
+# Extração do comprimento carregado
+NODE = 'node'        # critério original, quantizado em dx
+LINEAR = 'linear'    # cruzamentos por interpolação linear entre nós
+CUBIC = 'cubic'      # cruzamentos por Hermite cúbico (Newton)
+
+STENCIL = np.array([1.0, -4.0, 6.0, -4.0, 1.0])
+
+
+def inertia_rectangular(b: float, h: float) -> float:
+    return b * h**3 / 12.0
+
+
+# --- PROPRIEDADES AO LONGO DO MAT ---
+def piecewise(base, *segments):
+    """
+    Definição por trechos: `base` em todo o mat e `valor` em cada trecho
+    (x_inicio, x_fim, valor), aplicados em ordem.
+    """
+    def valores(x):
+        v = np.full(np.shape(x), float(base))
+        for inicio, fim, valor in segments:
+            v[(x >= inicio) & (x <= fim)] = valor
+        return v
+    return valores
+
+
+def profile(x, spec):
+    """
+    Valores nodais de uma propriedade: escalar (devolvido como float), array
+    com um valor por nó (última dimensão), função de x ou `piecewise`.
+    """
+    valores = np.asarray(spec(x) if callable(spec) else spec, dtype=np.float64)
+    if valores.ndim == 0:
+        return float(valores)
+    if valores.shape[-1] != len(x):
+        raise ValueError(f"Perfil com {valores.shape[-1]} valores para {len(x)} nós.")
+    return valores
+
+
+def _cache_key(valor):
+    return float(valor) if np.ndim(valor) == 0 else np.ascontiguousarray(valor, dtype=np.float64).tobytes()
+
+
+def _from_cache_key(chave):
+    return np.frombuffer(chave, dtype=np.float64) if isinstance(chave, bytes) else chave
+
+
+def _nodal(valor, ndim):
+    """Propriedade nodal pronta para broadcast com arrays (nodes, …)."""
+    return valor if np.ndim(valor) == 0 else np.reshape(valor, np.shape(valor) + (1,) * (ndim - 1))
+
+
+# --- MONTAGEM EM BANDA ---
+def assemble_bands(nodes: int, dx, a=0.0, ei_ratio=None) -> np.ndarray:
+    """
+    Bandas (…, 5, nodes) do sistema de `winkler_leff`: estêncil interior com
+    a = ks·dx⁴/EI somado à diagonal e extremidades engastadas (w = 0, dw/dx = 0).
+    `a` é escalar ou broadcastável para (…, nodes); `dx` escalar ou (…).
+
+    Com `ei_ratio` (EI/EI_ref por nó, broadcastável para (…, nodes)), a linha
+    i usa os coeficientes de (EI·w'')'' com momentos nodais:
+    [EI₋, -2EI₋ - 2EI, EI₋ + 4EI + EI₊, -2EI - 2EI₊, EI₊], que se reduzem a
+    [1, -4, 6, -4, 1] com EI constante.
+    """
+    a = np.asarray(a, dtype=np.float64)
+    dx = np.asarray(dx, dtype=np.float64)
+    formas = [dx.shape]
+    if a.ndim:
+        formas.append(a.shape[:-1])
+    if ei_ratio is not None:
+        ei_ratio = np.asarray(ei_ratio, dtype=np.float64)
+        formas.append(ei_ratio.shape[:-1])
+    lote = np.broadcast_shapes(*formas)
+    bands = np.zeros(lote + (5, nodes))
+    if ei_ratio is None:
+        bands[..., :, 2:-2] = STENCIL[:, np.newaxis]
+    else:
+        r = np.broadcast_to(ei_ratio, lote + (nodes,))
+        anterior, atual, seguinte = r[..., 1:-3], r[..., 2:-2], r[..., 3:-1]
+        bands[..., 0, 2:-2] = anterior
+        bands[..., 1, 2:-2] = -2 * anterior - 2 * atual
+        bands[..., 2, 2:-2] = anterior + 4 * atual + seguinte
+        bands[..., 3, 2:-2] = -2 * atual - 2 * seguinte
+        bands[..., 4, 2:-2] = seguinte
+    bands[..., 2, 2:-2] += np.broadcast_to(a, lote + (nodes,))[..., 2:-2]
+
+    bands[..., 2, 0] = 1.0
+    bands[..., 1, 1] = -1.0 / dx
+    bands[..., 2, 1] = 1.0 / dx
+    bands[..., 2, -1] = 1.0
+    bands[..., 2, -2] = -1.0 / dx
+    bands[..., 3, -2] = 1.0 / dx
+    return bands
+
+
+def assemble_free_bands(nodes: int, dx, ei, springs=0.0) -> np.ndarray:
+    """
+    Bandas (…, 5, nodes) da rigidez variacional de uma viga livre-livre,
+    K = Dᵀ·diag(EI/dx³)·D + diag(springs), com D as segundas diferenças
+    [1, -2, 1] e `springs` a rigidez nodal concentrada (N/m). Simétrica;
+    EI é escalar ou por linha de curvatura (…, nodes - 2).
+    """
+    dx = np.asarray(dx, dtype=np.float64)
+    c = np.asarray(ei, dtype=np.float64) / dx[..., np.newaxis] ** 3
+    springs = np.asarray(springs, dtype=np.float64)
+    lote = np.broadcast_shapes(c.shape[:-1], springs.shape[:-1] if springs.ndim else ())
+    c = np.broadcast_to(c, lote + (nodes - 2,))
+    bands = np.zeros(lote + (5, nodes))
+    bands[..., 0, 2:] += c
+    bands[..., 1, 1:-1] -= 2 * c
+    bands[..., 1, 2:] -= 2 * c
+    bands[..., 2, :-2] += c
+    bands[..., 2, 1:-1] += 4 * c
+    bands[..., 2, 2:] += c
+    bands[..., 3, :-2] -= 2 * c
+    bands[..., 3, 1:-1] -= 2 * c
+    bands[..., 4, :-2] += c
+    bands[..., 2, :] += springs
+    return bands
+
+
+def banded_matvec(bands, x) -> np.ndarray:
+    """Produto A·x para A em bandas (…, 5, n) e x (…, n)."""
+    y = bands[..., 2, :] * x
+    y[..., 1:] += bands[..., 1, 1:] * x[..., :-1]
+    y[..., 2:] += bands[..., 0, 2:] * x[..., :-2]
+    y[..., :-1] += bands[..., 3, :-1] * x[..., 1:]
+    y[..., :-2] += bands[..., 4, :-2] * x[..., 2:]
+    return y
+
+
+def boundary_rows(nodes: int) -> np.ndarray:
+    """Índices das quatro linhas de contorno (lado direito nulo)."""
+    return np.array([0, 1, nodes - 2, nodes - 1])
+
+
+# --- LU PENTADIAGONAL ---
+def _por_no(valores, eixo, expandir=False):
+    """Lista com um item por nó: floats para 1-D, arrays do lote caso contrário."""
+    if valores.ndim == 1:
+        return valores.tolist()
+    por_no = np.moveaxis(valores, eixo, 0)
+    return list(por_no[..., np.newaxis] if expandir else por_no)
+
+
+def factor_pentadiagonal(bands) -> np.ndarray:
+    """
+    Fatoração LU (Doolittle, sem pivotamento) de bandas (…, 5, n). O laço é
+    sequencial nos nós, mas cada passo opera no lote inteiro; para um único
+    sistema o laço roda sobre listas de floats.
+    """
+    bands = np.asarray(bands, dtype=np.float64)
+    e, c, d, f, g = (_por_no(bands[..., k, :], -1) for k in range(5))
+    n = bands.shape[-1]
+    # u0, u1 e u2 começam com dois nós fictícios para evitar desvios no laço
+    l2, l1 = [], []
+    u0, u1, u2 = [1.0, 1.0], [0.0, 0.0], [0.0, 0.0]
+    for i in range(n):
+        a2 = e[i] / u0[i]
+        a1 = (c[i] - a2 * u1[i]) / u0[i + 1]
+        u0.append(d[i] - a2 * u2[i] - a1 * u1[i + 1])
+        u1.append(f[i] - a1 * u2[i + 1])
+        u2.append(g[i])
+        l2.append(a2)
+        l1.append(a1)
+
+    colunas = (l2, l1, u0[2:], u1[2:], u2[2:])
+    if bands.ndim == 2:
+        lu = np.array(colunas)
+    else:
+        lu = np.stack([np.stack(coluna, axis=-1) for coluna in colunas], axis=-2)
+    pivos = lu[..., 2, :]
+    if not np.all(np.isfinite(pivos)) or np.any(pivos == 0):
+        raise np.linalg.LinAlgError("Matriz singular na fatoração pentadiagonal.")
+    return lu
+
+
+def solve_pentadiagonal(lu, rhs) -> np.ndarray:
+    """
+    Resolve A·x = rhs com o fator de `factor_pentadiagonal`. `rhs` tem forma
+    (…, n) ou (…, n, k) para vários lados direitos de uma vez.
+    """
+    lu = np.asarray(lu, dtype=np.float64)
+    rhs = np.asarray(rhs, dtype=np.float64)
+    multi = rhs.ndim == lu.ndim
+    eixo = -2 if multi else -1
+    n = lu.shape[-1]
+    l2, l1, u0, u1, u2 = (
+        lu[k].tolist() if lu.ndim == 2 else _por_no(lu[..., k, :], -1, expandir=multi) for k in range(5)
+    )
+    b = _por_no(rhs, eixo)
+
+    y = [0.0, 0.0]
+    for i in range(n):
+        y.append(b[i] - l1[i] * y[i + 1] - l2[i] * y[i])
+    x = [0.0, 0.0]
+    for i in range(n - 1, -1, -1):
+        x.append((y[i + 2] - u1[i] * x[-1] - u2[i] * x[-2]) / u0[i])
+    x = x[:1:-1]
+
+    if rhs.ndim == 1:
+        return np.array(x)
+    return np.moveaxis(np.stack(x), 0, eixo)
+
+
+# --- LU EM BANDA GERAL ---
+def factor_banded(bands) -> np.ndarray:
+    """
+    Fatoração LU sem pivotamento de bandas (…, 2p + 1, n) com meia largura p
+    qualquer (bands[..., k, i] = A[i, i + k - p]); os multiplicadores ficam
+    nas bandas inferiores, como em `factor_pentadiagonal`.
+    """
+    lu = np.array(bands, dtype=np.float64)
+    p = (lu.shape[-2] - 1) // 2
+    n = lu.shape[-1]
+    if lu.ndim == 2:
+        # linhas[i][k] = A[i, i + k - p] como listas de floats
+        linhas = lu.T.tolist()
+        for i in range(n - 1):
+            pivo, superior = linhas[i][p], linhas[i][p + 1:]
+            if pivo == 0:
+                break
+            for d in range(1, min(p, n - 1 - i) + 1):
+                linha = linhas[i + d]
+                fator = linha[p - d] = linha[p - d] / pivo
+                for k in range(p):
+                    linha[p - d + 1 + k] -= fator * superior[k]
+        lu = np.array(linhas).T
+    else:
+        # linhas[i, ..., k] = A[i, i + k - p] (vista): cada passo opera no lote inteiro
+        linhas = np.moveaxis(lu, (-1, -2), (0, -1))
+        for i in range(n - 1):
+            pivo = linhas[i, ..., p]
+            if np.any(pivo == 0):
+                break
+            for d in range(1, min(p, n - 1 - i) + 1):
+                fator = linhas[i + d, ..., p - d] / pivo
+                linhas[i + d, ..., p - d] = fator
+                linhas[i + d, ..., p - d + 1:2 * p - d + 1] -= fator[..., np.newaxis] * linhas[i, ..., p + 1:]
+    pivos = lu[..., p, :]
+    if not np.all(np.isfinite(pivos)) or np.any(pivos == 0):
+        raise np.linalg.LinAlgError("Matriz singular na fatoração em banda.")
+    return lu
+
+
+def solve_banded(lu, rhs) -> np.ndarray:
+    """Resolve A·x = rhs com o fator de `factor_banded`; rhs (…, n) ou (…, n, k)."""
+    lu = np.asarray(lu, dtype=np.float64)
+    rhs = np.asarray(rhs, dtype=np.float64)
+    multi = rhs.ndim == lu.ndim
+    eixo = -2 if multi else -1
+    p = (lu.shape[-2] - 1) // 2
+    n = lu.shape[-1]
+    if lu.ndim == 2 and rhs.ndim == 1:
+        linhas = lu.T.tolist()
+        x = rhs.tolist()
+        for i in range(1, n):
+            linha, valor = linhas[i], x[i]
+            for d in range(1, min(p, i) + 1):
+                valor -= linha[p - d] * x[i - d]
+            x[i] = valor
+        for i in range(n - 1, -1, -1):
+            linha, valor = linhas[i], x[i]
+            for d in range(1, min(p, n - 1 - i) + 1):
+                valor -= linha[p + d] * x[i + d]
+            x[i] = valor / linha[p]
+        return np.array(x)
+    coeficientes = np.moveaxis(lu, (-1, -2), (0, 1))  # coeficientes[i, k, ...] = A[i, i + k - p]
+    if multi:
+        coeficientes = coeficientes[..., np.newaxis]
+    x = np.moveaxis(rhs, eixo, 0).copy()
+    for i in range(1, n):
+        d = min(p, i)
+        x[i] -= np.sum(coeficientes[i, p - d:p] * x[i - d:i], axis=0)
+    for i in range(n - 1, -1, -1):
+        d = min(p, n - 1 - i)
+        if d:
+            x[i] -= np.sum(coeficientes[i, p + 1:p + 1 + d] * x[i + 1:i + 1 + d], axis=0)
+        x[i] /= coeficientes[i, p]
+    return np.moveaxis(x, 0, eixo)
+
+
+# --- CARGA E COMPRIMENTO EFETIVO ---
+def load_vector(x, length, force, dx, patch_width=None):
+    """Carga distribuída q (N/m): pontual no nó central ou faixa centrada."""
+    nodes = len(x)
+    q = np.zeros_like(x)
+    if patch_width is None:
+        q[nodes // 2] = force / dx
+    else:
+        half = patch_width / 2.0
+        mask = (x >= length / 2 - half) & (x <= length / 2 + half)
+        q[mask] = force / (mask.sum() * dx)
+    return q
+
+
+def _broadcast_nodes(p, p_lim):
+    """Alinha p (nós no eixo 0) com p_lim broadcastável às demais dimensões."""
+    p = np.asarray(p, dtype=np.float64)
+    p_lim = np.asarray(p_lim, dtype=np.float64)
+    nodes = p.shape[0]
+    forma = np.broadcast_shapes(p.shape[1:], p_lim.shape)
+    p = np.broadcast_to(p.reshape((nodes,) + (1,) * (len(forma) - p.ndim + 1) + p.shape[1:]), (nodes,) + forma)
+    return p, p_lim, forma
+
+
+def contact_length_nodes(p, p_lim, dx):
+    """
+    Comprimento carregado total a partir do pico, pelo critério original de
+    `winkler_leff` (caminhar nó a nó até p < p_lim), vetorizado. O eixo 0 de
+    `p` são os nós; `p_lim` é broadcastável com as demais dimensões.
+    """
+    p, p_lim, forma = _broadcast_nodes(p, p_lim)
+    nodes = p.shape[0]
+    indices = np.arange(nodes).reshape((nodes,) + (1,) * len(forma))
+    i0 = np.argmax(p, axis=0)
+    abaixo = p < p_lim
+    # último nó abaixo do limite à esquerda do pico (ou 0) e primeiro à direita (ou nodes)
+    i1 = np.max(np.where(abaixo & (indices <= i0), indices, 0), axis=0)
+    i2 = np.min(np.where(abaixo & (indices >= i0), indices, nodes), axis=0)
+    return (i2 - i1 - 1) * dx
+
+
+def _crossing_fraction(s, method):
+    """
+    Fração t ∈ [0, 1] do cruzamento de s = p - p_lim em cada intervalo entre
+    nós: linear, ou raiz do Hermite cúbico (inclinações por diferenças
+    centradas) refinada por Newton a partir da estimativa linear.
+    """
+    s0, s1 = s[:-1], s[1:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.clip(np.where(s0 != s1, s0 / (s0 - s1), 0.5), 0.0, 1.0)
+        if method == CUBIC:
+            m = np.gradient(s, axis=0, edge_order=2)
+            m0, m1 = m[:-1], m[1:]
+            for _ in range(4):
+                t2, t3 = t * t, t * t * t
+                f = (2 * t3 - 3 * t2 + 1) * s0 + (t3 - 2 * t2 + t) * m0 + (3 * t2 - 2 * t3) * s1 + (t3 - t2) * m1
+                df = (6 * t2 - 6 * t) * s0 + (3 * t2 - 4 * t + 1) * m0 + (6 * t - 6 * t2) * s1 + (3 * t2 - 2 * t) * m1
+                t = np.clip(t - np.where(df != 0, f / df, 0.0), 0.0, 1.0)
+    return t
+
+
+def contact_zones(p, p_lim, dx, method=LINEAR):
+    """
+    Zonas de contato onde p >= p_lim, com os cruzamentos interpolados entre
+    nós (vetorizado; p_lim broadcastável como em `contact_length_nodes`).
+
+    Devolve o comprimento da zona que contém o pico (`leff_total`), seus
+    limites (`start`, `end`, em m a partir da extremidade), a soma de todas
+    as zonas disjuntas (`contact_total`) e o número de zonas (`zones`).
+    """
+    p, p_lim, forma = _broadcast_nodes(p, p_lim)
+    nodes = p.shape[0]
+    s = p - p_lim
+    acima = s >= 0
+    t = _crossing_fraction(s, method)
+    sobe = ~acima[:-1] & acima[1:]
+    desce = acima[:-1] & ~acima[1:]
+
+    contact_total = dx * ((acima[:-1] & acima[1:]).sum(axis=0)
+                          + np.where(sobe, 1 - t, 0.0).sum(axis=0)
+                          + np.where(desce, t, 0.0).sum(axis=0))
+    zones = sobe.sum(axis=0) + acima[0]
+
+    intervalos = np.arange(nodes - 1).reshape((nodes - 1,) + (1,) * len(forma))
+    i0 = np.argmax(p, axis=0)
+    esquerda = np.max(np.where(sobe & (intervalos < i0), intervalos, -1), axis=0)
+    direita = np.min(np.where(desce & (intervalos >= i0), intervalos, nodes - 1), axis=0)
+    t_esquerda = np.take_along_axis(t, np.maximum(esquerda, 0)[np.newaxis], axis=0)[0]
+    t_direita = np.take_along_axis(t, np.minimum(direita, nodes - 2)[np.newaxis], axis=0)[0]
+    start = np.where(esquerda >= 0, (esquerda + t_esquerda) * dx, 0.0)
+    end = np.where(direita < nodes - 1, (direita + t_direita) * dx, (nodes - 1) * dx)
+
+    tem_contato = np.take_along_axis(acima, i0[np.newaxis], axis=0)[0]
+    return {
+        'leff_total': np.where(tem_contato, end - start, 0.0),
+        'start': np.where(tem_contato, start, np.nan),
+        'end': np.where(tem_contato, end, np.nan),
+        'contact_total': contact_total,
+        'zones': zones,
+    }
+
+
+def effective_length(p, p_lim, dx, method=NODE):
+    """Comprimento carregado total pelo método indicado (NODE, LINEAR ou CUBIC)."""
+    if method == NODE:
+        return contact_length_nodes(p, p_lim, dx)
+    if method in (LINEAR, CUBIC):
+        return contact_zones(p, p_lim, dx, method)['leff_total']
+    raise ValueError(f"Método de extração desconhecido: {method}")
+
+
+def bending_response(w, dx, ei):
+    """
+    Momento M = -EI·w'' e cortante V = dM/dx por diferenças finitas (w
+    positivo para baixo, eixo 0 = nós; EI escalar ou nodal). Diferenças
+    centradas no interior e unilaterais de segunda ordem nas extremidades.
+    """
+    w = np.asarray(w, dtype=np.float64)
+    ei = _nodal(ei, w.ndim)
+    curvatura = np.empty_like(w)
+    curvatura[1:-1] = (w[:-2] - 2 * w[1:-1] + w[2:]) / dx**2
+    curvatura[0] = (2 * w[0] - 5 * w[1] + 4 * w[2] - w[3]) / dx**2
+    curvatura[-1] = (2 * w[-1] - 5 * w[-2] + 4 * w[-3] - w[-4]) / dx**2
+    moment = -ei * curvatura
+    shear = np.gradient(moment, dx, axis=0, edge_order=2)
+    return moment, shear
+
+
+# --- PERFIS DE RESPOSTA ---
+def downsample_minmax(x, y, points):
+    """
+    Reduz a curva y(x) (nós na última dimensão, lote nas iniciais) a no máximo
+    `points` pontos: o eixo é dividido em points/2 baldes e de cada balde
+    ficam o mínimo e o máximo, em ordem de x. Picos e vales não se perdem,
+    ao contrário de amostrar um ponto a cada k. Exige `points` >= 2.
+    """
+    if int(points) < 2:
+        raise ValueError(f"downsample_minmax precisa de ao menos 2 pontos (recebeu {points}).")
+    y = np.asarray(y, dtype=np.float64)
+    x = np.broadcast_to(x, y.shape)
+    n = y.shape[-1]
+    baldes = int(points) // 2
+    if n <= 2 * baldes:
+        return x.copy(), y.copy()
+    tamanho = -(-n // baldes)
+    baldes = -(-n // tamanho)
+    # Preenche o último balde repetindo o último valor (argmin/argmax pegam a 1ª ocorrência)
+    preenchido = np.pad(y, [(0, 0)] * (y.ndim - 1) + [(0, baldes * tamanho - n)], mode='edge')
+    preenchido = preenchido.reshape(y.shape[:-1] + (baldes, tamanho))
+    inicio = np.arange(baldes) * tamanho
+    i_min, i_max = preenchido.argmin(axis=-1) + inicio, preenchido.argmax(axis=-1) + inicio
+    indices = np.stack([np.minimum(i_min, i_max), np.maximum(i_min, i_max)], axis=-1)
+    indices = indices.reshape(y.shape[:-1] + (2 * baldes,))
+    return np.take_along_axis(x, indices, axis=-1), np.take_along_axis(y, indices, axis=-1)
+
+
+def peak_locations(x, series) -> dict:
+    """Posição e valor do maior |y| de cada série (nós na última dimensão)."""
+    picos = {}
+    for nome, y in series.items():
+        indice = np.abs(y).argmax(axis=-1)[..., np.newaxis]
+        picos[nome] = {
+            'x': np.take_along_axis(np.broadcast_to(x, np.shape(y)), indice, axis=-1)[..., 0],
+            'value': np.take_along_axis(y, indice, axis=-1)[..., 0],
+        }
+    return picos
+
+
+def response_profiles(x, series, points=None) -> dict:
+    """
+    Perfis {'x', 'y'} de cada série (w, p, M, V…) e os picos, estes sempre na
+    malha completa. Com `points`, as curvas passam por `downsample_minmax`.
+    """
+    perfis = {'peaks': peak_locations(x, series)}
+    for nome, y in series.items():
+        xs, ys = (np.broadcast_to(x, np.shape(y)), y) if points is None else downsample_minmax(x, y, points)
+        perfis[nome] = {'x': xs, 'y': ys}
+    return perfis
+
+
+# --- MODELO COM FATOR EM CACHE ---
+@lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def cached_factor(length, nodes, ei, ks):
+    """
+    Fator LU (somente leitura) para uma configuração de rigidez. `ei` e `ks`
+    são floats, ou os bytes dos perfis nodais (ver `WinklerModel`).
+    """
+    ei, ks = _from_cache_key(ei), _from_cache_key(ks)
+    dx = length / (nodes - 1)
+    ei_ref = float(np.max(ei))
+    ei_ratio = None if np.ndim(ei) == 0 else ei / ei_ref
+    lu = factor_pentadiagonal(assemble_bands(nodes, dx, ks * dx**4 / ei_ref, ei_ratio))
+    lu.setflags(write=False)
+    return lu
+
+
+def factor_cache_info():
+    return cached_factor.cache_info()
+
+
+class WinklerModel:
+    """
+    Viga de Winkler com fatoração reaproveitada. Cargas entram só pelo lado
+    direito e p_lim só no pós-processamento, então um mesmo modelo atende
+    qualquer varredura de carga e de resistência do solo.
+
+    `thickness`, `young_gpa` e `ks_kn_m3` aceitam perfis (ver `profile`);
+    `ei` é o EI de referência e `ei_x` o EI nodal (ou o mesmo float).
+    """
+
+    def __init__(self, length, width, thickness, young_gpa, ks_kn_m3, nodes=NODES):
+        self.length = float(length)
+        self.nodes = int(nodes)
+        self.dx = self.length / (self.nodes - 1)
+        self.x = np.linspace(0.0, self.length, self.nodes)
+        self.ei_x = profile(self.x, young_gpa) * 1e9 * inertia_rectangular(width, profile(self.x, thickness))
+        self.ks = profile(self.x, ks_kn_m3) * 1000
+        self.ei = float(np.max(self.ei_x))
+        self.ei_ratio = None if np.ndim(self.ei_x) == 0 else self.ei_x / self.ei
+
+    @property
+    def lu(self):
+        return cached_factor(self.length, self.nodes, _cache_key(self.ei_x), _cache_key(self.ks))
+
+    def bands(self, springs=None):
+        """Bandas do sistema; `springs` (máscara nodal) desliga molas do solo."""
+        a = self.ks * self.dx**4 / self.ei
+        if springs is not None:
+            a = a * springs
+        return assemble_bands(self.nodes, self.dx, a, self.ei_ratio)
+
+    def solve(self, q):
+        """Deflexão w para cargas distribuídas q (N/m) de forma (nodes,) ou (nodes, k)."""
+        rhs = np.array(q, dtype=np.float64) * (self.dx**4 / self.ei)
+        rhs[boundary_rows(self.nodes)] = 0.0
+        return solve_pentadiagonal(self.lu, rhs)
+
+    def soil_pressure(self, w):
+        """p = ks·w para w de forma (nodes, …)."""
+        return _nodal(self.ks, np.ndim(w)) * w
+
+    def bending(self, w):
+        """Momento e cortante para w de forma (nodes, …)."""
+        return bending_response(w, self.dx, self.ei_x)
+
+    def solve_ks_scenarios(self, ks_kn_m3, q):
+        """
+        Avalia vários cenários de ks(x) contra a mesma geometria e carga em
+        uma única fatoração em lote. `ks_kn_m3` é um array (m, nodes), (m,) ou
+        uma lista de perfis; devolve w e p com forma (m, nodes).
+        """
+        if isinstance(ks_kn_m3, (list, tuple)):
+            ks_kn_m3 = np.stack([np.broadcast_to(profile(self.x, spec), self.x.shape) for spec in ks_kn_m3])
+        ks = np.asarray(ks_kn_m3, dtype=np.float64) * 1000
+        if ks.ndim == 1:
+            ks = ks[:, np.newaxis]
+        ks = np.broadcast_to(ks, ks.shape[:-1] + (self.nodes,))
+        lu = factor_pentadiagonal(assemble_bands(self.nodes, self.dx, ks * self.dx**4 / self.ei, self.ei_ratio))
+        rhs = np.array(q, dtype=np.float64) * (self.dx**4 / self.ei)
+        rhs[boundary_rows(self.nodes)] = 0.0
+        w = solve_pentadiagonal(lu, np.broadcast_to(rhs, ks.shape))
+        return {'w': w, 'p': ks * w}
+
+    def unit_deflection(self, patch_width=None):
+        """Deflexão para 1 N na carga pontual central ou na faixa centrada."""
+        return self.solve(load_vector(self.x, self.length, 1.0, self.dx, patch_width))
+
+    def pressure(self, force_ton, patch_width=None):
+        """Pressão no solo (Pa), forma (nodes,) + forma de `force_ton`."""
+        forca = np.asarray(force_ton, dtype=np.float64) * TON_TO_N
+        unitaria = self.soil_pressure(self.unit_deflection(patch_width))
+        return unitaria.reshape((self.nodes,) + (1,) * forca.ndim) * forca
+
+    def leff(self, force_ton, p_lim_abs_pa, patch_width=None, method=NODE):
+        """
+        Leff, Leff total e p_max para todas as combinações (broadcast) de
+        força e p_lim, com uma única solução do sistema. Com `method` LINEAR
+        ou CUBIC, inclui também as zonas de contato (`contact_zones`).
+        """
+        p = self.pressure(force_ton, patch_width)
+        zonas = None
+        if method == NODE:
+            leff_total = contact_length_nodes(p, p_lim_abs_pa, self.dx)
+        else:
+            zonas = contact_zones(p, p_lim_abs_pa, self.dx, method)
+            leff_total = zonas.pop('leff_total')
+        p_max = np.broadcast_to(p.max(axis=0), leff_total.shape)
+        resultado = {
+            "leff": leff_total / 2,
+            "leff_total": leff_total,
+            "p_max": p_max,
+            "p_lim": np.broadcast_to(p_lim_abs_pa, leff_total.shape),
+        }
+        if zonas is not None:
+            resultado.update(zonas)
+        return resultado
+
+
+# --- SOLVER ---
+def winkler_leff(
+    force_ton, length, width, thickness, young_gpa,
+    ks_kn_m3, p_lim_abs_pa, patch_width, nodes, method=NODE, profiles=False, profile_points=None,
+) -> dict[str, float]:
+    model = WinklerModel(length, width, thickness, young_gpa, ks_kn_m3, nodes)
+    w = model.solve(load_vector(model.x, length, force_ton * TON_TO_N, model.dx, patch_width))
+    p = model.soil_pressure(w)
+    leff_total = float(effective_length(p, p_lim_abs_pa, model.dx, method))
+    resultado = {
+        "leff": leff_total / 2,
+        "leff_total": leff_total,
+        "p_max": float(p.max()),
+        "p_lim": p_lim_abs_pa,
+    }
+    if profiles:
+        moment, shear = model.bending(w)
+        resultado["profiles"] = response_profiles(
+            model.x, {'w': w, 'p': p, 'moment': moment, 'shear': shear}, profile_points)
+    return resultado
+
+
+def _concatenate_profiles(blocos, forma):
+    """Junta os perfis dos blocos e devolve a forma do broadcast aos casos."""
+    if isinstance(blocos[0], dict):
+        return {chave: _concatenate_profiles([bloco[chave] for bloco in blocos], forma) for chave in blocos[0]}
+    valores = np.concatenate(blocos)
+    return valores.reshape(forma + valores.shape[1:])
+
+
+def winkler_leff_batch(
+    force_ton, length, width, thickness, young_gpa,
+    ks_kn_m3, p_lim_abs_pa, patch_width=None, nodes=NODES, method=NODE, block=BATCH_BLOCK,
+    profiles=False, profile_points=None,
+) -> dict:
+    """
+    `winkler_leff` para muitas geometrias de uma vez: as entradas são
+    broadcast para m casos (`patch_width` NaN ou None = carga pontual) e os
+    m sistemas pentadiagonais, com o mesmo número de nós, são montados,
+    fatorados e resolvidos juntos, com o lote na primeira dimensão (em
+    blocos de `block` casos). Devolve arrays com a forma do broadcast; com
+    `profiles`, os perfis de `response_profiles` ganham a última dimensão
+    (nós ou os pontos de `profile_points`).
+    """
+    entradas = np.broadcast_arrays(*(
+        np.asarray(np.nan if v is None else v, dtype=np.float64)
+        for v in (force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width)
+    ))
+    forma = entradas[0].shape
+    planos = [v.ravel() for v in entradas]
+    m = planos[0].size
+    leff_total, p_max = np.empty(m), np.empty(m)
+    perfis = []
+    for inicio in range(0, m, block):
+        fatia = slice(inicio, inicio + block)
+        forca, comprimento, largura, espessura, young, ks, p_lim, faixa = (v[fatia] for v in planos)
+        dx = comprimento / (nodes - 1)
+        x = np.linspace(0.0, comprimento, nodes, axis=-1)
+        ei = young * 1e9 * inertia_rectangular(largura, espessura)
+        ks = ks * 1000
+
+        # Cargas: pontual no nó central ou faixa centrada (como `load_vector`)
+        meia = (faixa / 2)[:, np.newaxis]
+        centro = (comprimento / 2)[:, np.newaxis]
+        mascara = (x >= centro - meia) & (x <= centro + meia)
+        q = forca[:, np.newaxis] * TON_TO_N * mascara / (np.maximum(mascara.sum(axis=-1, keepdims=True), 1) * dx[:, np.newaxis])
+        pontual = np.isnan(faixa)
+        q[pontual] = 0.0
+        q[pontual, nodes // 2] = forca[pontual] * TON_TO_N / dx[pontual]
+
+        escala = (dx**4 / ei)[:, np.newaxis]
+        rhs = q * escala
+        rhs[:, boundary_rows(nodes)] = 0.0
+        w = solve_pentadiagonal(factor_pentadiagonal(assemble_bands(nodes, dx, ks[:, np.newaxis] * escala)), rhs)
+        p = ks[:, np.newaxis] * w
+        leff_total[fatia] = effective_length(p.T, p_lim, dx, method)
+        p_max[fatia] = p.max(axis=-1)
+        if profiles:
+            # Diferenças com espaçamento unitário, reescaladas pelo dx de cada caso
+            momento, cortante = bending_response(w.T, 1.0, 1.0)
+            series = {'w': w, 'p': p, 'moment': (ei / dx**2)[:, np.newaxis] * momento.T,
+                      'shear': (ei / dx**3)[:, np.newaxis] * cortante.T}
+            perfis.append(response_profiles(x, series, profile_points))
+    leff_total, p_max = leff_total.reshape(forma), p_max.reshape(forma)
+    resultado = {
+        "leff": leff_total / 2,
+        "leff_total": leff_total,
+        "p_max": p_max,
+        "p_lim": entradas[6],
+    }
+    if profiles:
+        resultado["profiles"] = _concatenate_profiles(perfis, forma)
+    return resultado
+
+
+def winkler_leff_adaptive(
+    force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width=None,
+    tol=ADAPTIVE_TOL_M, nodes=ADAPTIVE_START_NODES, max_nodes=ADAPTIVE_MAX_NODES, method=LINEAR,
+):
+    """
+    Leff com controle automático de malha: resolve em malhas aninhadas
+    (nodes, 2·nodes - 1, ...) e extrapola por Richardson com a ordem
+    observada nos três últimos níveis (1ª ordem com só dois). O erro estimado
+    é a variação entre extrapolações sucessivas (ou a própria correção, no
+    segundo nível); o refinamento para quando ele fica abaixo de `tol` (Leff
+    de um lado, em m), quando a malha passaria de `max_nodes` ou quando as
+    diferenças entre níveis voltam a crescer (arredondamento dominando).
+    `p_lim_abs_pa` pode ser um array; todos os valores precisam convergir.
+
+    Devolve o Leff extrapolado, o número de nós usado, o erro estimado, a
+    ordem observada e o histórico de níveis. Os níveis anteriores entram na
+    extrapolação sem ser recalculados, e os fatores ficam no cache.
+    """
+    if nodes % 2 == 0:
+        nodes += 1  # mantém o nó central em todas as malhas
+    if nodes > max_nodes:
+        raise ValueError(f"A malha inicial ({nodes} nós) excede max_nodes ({max_nodes}).")
+    niveis = []        # (nós, Leff total, p_max)
+    extrapolados = []  # (Leff total extrapolado, erro estimado, ordem)
+    while True:
+        model = WinklerModel(length, width, thickness, young_gpa, ks_kn_m3, nodes)
+        resultado = model.leff(force_ton, p_lim_abs_pa, patch_width, method)
+        niveis.append((nodes, resultado['leff_total'], resultado['p_max']))
+        proximo = 2 * nodes - 1
+
+        if len(niveis) >= 2:
+            l1, l2 = niveis[-2][1], niveis[-1][1]
+            ordem = ADAPTIVE_DEFAULT_ORDER
+            divergiu = False
+            if len(niveis) >= 3:
+                l0 = niveis[-3][1]
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    razao = np.abs((l1 - l0) / (l2 - l1))
+                divergiu = bool(np.any(razao[np.isfinite(razao)] < 1))
+                razao = razao[np.isfinite(razao) & (razao > 1)]
+                if razao.size:
+                    ordem = float(np.clip(np.log2(np.median(razao)), 0.5, 4.0))
+            if divergiu:
+                # o último nível já está contaminado: fica com a extrapolação anterior
+                niveis.pop()
+                leff_total, erro, ordem = extrapolados[-1]
+                nodes = niveis[-1][0]
+                p_max = niveis[-1][2]
+                convergiu = False
+                break
+
+            leff_total = l2 + (l2 - l1) / (2.0**ordem - 1.0)
+            variacao = leff_total - extrapolados[-1][0] if extrapolados else leff_total - l2
+            erro = float(np.max(np.abs(variacao))) / 2
+            extrapolados.append((leff_total, erro, ordem))
+            p_max = resultado['p_max']
+            convergiu = erro <= tol
+            if convergiu:
+                break
+        if proximo > max_nodes:
+            if len(niveis) == 1:
+                # sem malha para refinar: só o primeiro nível, sem estimativa de erro
+                leff_total, p_max = resultado['leff_total'], resultado['p_max']
+                erro, ordem, convergiu = float('inf'), ADAPTIVE_DEFAULT_ORDER, False
+            break
+        nodes = proximo
+
+    escalar = np.ndim(leff_total) == 0
+    return {
+        "leff": float(leff_total / 2) if escalar else leff_total / 2,
+        "leff_total": float(leff_total) if escalar else leff_total,
+        "p_max": float(p_max) if escalar else p_max,
+        "p_lim": p_lim_abs_pa,
+        "nodes": nodes,
+        "error_estimate": erro,
+        "order": ordem,
+        "converged": convergiu,
+        "levels": [(n, leff / 2) for n, leff, _ in niveis],
+    }
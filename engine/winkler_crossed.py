@@ -0,0 +1,233 @@
+# engine/winkler_crossed.py
+
+"""
+Duas camadas cruzadas de mats sobre base de Winkler.
+
+A camada superior tem n_s mats paralelos ao eixo x, lado a lado em y; a
+inferior tem n_i mats paralelos a y, lado a lado em x, apoiados no solo.
+Cada mat é uma viga livre-livre (rigidez variacional Dᵀ·diag(EI/dx³)·D) e
+cada cruzamento é uma mola de contato entre o deslocamento médio do mat
+superior sobre a largura do inferior e o do inferior sob a largura do
+superior (posto 1 por cruzamento). Os mats inferiores têm molas de solo
+ks·B por unidade de comprimento, de modo que p = ks·w é a pressão (Pa).
+
+O sistema é bloco-banda (um bloco pentadiagonal por mat, acoplados pelos
+cruzamentos) e simétrico positivo definido. É resolvido por gradientes
+conjugados em NumPy puro, com precondicionador bloco-banda: cada mat com
+sua rigidez, o solo e a parte diagonal (concentrada) dos contatos. Como as
+bandas fora de cada bloco são nulas, os blocos formam um único sistema
+pentadiagonal, fatorado uma vez com o LU do engine/winkler.py.
+
+Sem informação da rigidez de contato, adota-se E90 = E/30 (compressão
+normal às fibras) sobre a área de cruzamento e a meia espessura de cada mat.
+"""
+
+import numpy as np
+
+from engine.winkler import (
+    LINEAR, TON_TO_N, assemble_free_bands, banded_matvec, contact_zones, factor_pentadiagonal, inertia_rectangular,
+    solve_pentadiagonal,
+)
+
+NODES = 201
+RAZAO_E90 = 30.0
+TOL_PCG = 1e-10
+MAX_ITER_PCG = 5000
+
+
+def _posicoes(quantidade, largura, folga):
+    return (np.arange(quantidade) - (quantidade - 1) / 2) * (largura + folga)
+
+
+def _trecho(coordenadas, centro, largura):
+    """Nós dentro de [centro - largura/2, centro + largura/2] (ao menos o mais próximo)."""
+    dentro = np.flatnonzero(np.abs(coordenadas - centro) <= largura / 2 + 1e-12)
+    if dentro.size == 0:
+        dentro = np.array([np.argmin(np.abs(coordenadas - centro))])
+    return dentro
+
+
+class CrossedMats:
+    """
+    Modelo de duas camadas cruzadas. `top` e `bottom` são dicionários com
+    count, length, width, thickness, young_gpa e, opcionalmente, gap (folga
+    entre mats, m) e nodes.
+    """
+
+    def __init__(self, top, bottom, ks_kn_m3, contact_stiffness_n_m=None):
+        self.top = dict(top)
+        self.bottom = dict(bottom)
+        self.ks = ks_kn_m3 * 1000
+        camadas = {}
+        for nome, mat in (('top', self.top), ('bottom', self.bottom)):
+            nodes = int(mat.get('nodes', NODES))
+            coordenadas = np.linspace(-mat['length'] / 2, mat['length'] / 2, nodes)
+            dx = coordenadas[1] - coordenadas[0]
+            ei = mat['young_gpa'] * 1e9 * inertia_rectangular(mat['width'], mat['thickness'])
+            pesos = np.full(nodes, dx)
+            pesos[[0, -1]] = dx / 2
+            camadas[nome] = {
+                'coordenadas': coordenadas,
+                'dx': dx,
+                'ei': ei,
+                'pesos': pesos,
+                'posicoes': _posicoes(mat['count'], mat['width'], mat.get('gap', 0.0)),
+                'modulo': mat['width'] * mat['thickness'] ** 2 / 6,
+                'area': mat['width'] * mat['thickness'],
+            }
+        self.camadas = camadas
+        sup, inf = camadas['top'], camadas['bottom']
+        n_sup, n_inf = self.top['count'], self.bottom['count']
+
+        if contact_stiffness_n_m is None:
+            e90 = min(self.top['young_gpa'], self.bottom['young_gpa']) * 1e9 / RAZAO_E90
+            altura = (self.top['thickness'] + self.bottom['thickness']) / 2
+            contact_stiffness_n_m = e90 * self.top['width'] * self.bottom['width'] / altura
+        self.kc = contact_stiffness_n_m
+
+        # Vetor global: mats superiores e depois inferiores, concatenados
+        forma_sup = (n_sup, len(sup['coordenadas']))
+        forma_inf = (n_inf, len(inf['coordenadas']))
+        self.forma = (forma_sup, forma_inf)
+        self.inicio_inf = n_sup * forma_sup[1]
+        self.tamanho = self.inicio_inf + n_inf * forma_inf[1]
+
+        # Cruzamentos: (mat superior i, mat inferior j) quando se sobrepõem
+        cruzamentos, entradas = [], []
+        for i, y in enumerate(sup['posicoes']):
+            for j, x in enumerate(inf['posicoes']):
+                if abs(x) > self.top['length'] / 2 or abs(y) > self.bottom['length'] / 2:
+                    continue
+                c = len(cruzamentos)
+                cruzamentos.append((i, j))
+                nos = _trecho(sup['coordenadas'], x, self.bottom['width'])
+                entradas += [(c, i * forma_sup[1] + k, 1.0 / nos.size) for k in nos]
+                nos = _trecho(inf['coordenadas'], y, self.top['width'])
+                entradas += [(c, self.inicio_inf + j * forma_inf[1] + k, -1.0 / nos.size) for k in nos]
+        self.cruzamentos = np.array(cruzamentos, dtype=np.intp).reshape(-1, 2)
+        if np.any(np.bincount(self.cruzamentos[:, 0], minlength=n_sup) < 2):
+            raise ValueError("Cada mat superior precisa cruzar ao menos dois mats inferiores.")
+        # folga do cruzamento c = Σ peso·w (pesos positivos em cima, negativos embaixo)
+        self.c_contato = np.array([e[0] for e in entradas], dtype=np.intp)
+        self.i_contato = np.array([e[1] for e in entradas], dtype=np.intp)
+        self.p_contato = np.array([e[2] for e in entradas])
+
+        # Blocos pentadiagonais de cada mat (solo nos inferiores); como as
+        # bandas fora de cada bloco são nulas, os blocos se concatenam num
+        # único sistema pentadiagonal bloco-diagonal
+        solo = self.ks * self.bottom['width'] * inf['pesos']
+        bandas_sup = assemble_free_bands(forma_sup[1], sup['dx'], np.full((n_sup, 1), sup['ei']))
+        bandas_inf = assemble_free_bands(forma_inf[1], inf['dx'], np.full((n_inf, 1), inf['ei']),
+                                         np.broadcast_to(solo, forma_inf))
+        self.bandas = np.concatenate([np.moveaxis(bandas_sup, 1, 0).reshape(5, -1),
+                                      np.moveaxis(bandas_inf, 1, 0).reshape(5, -1)], axis=1)
+        # precondicionador: parte diagonal (concentrada) dos contatos somada aos blocos
+        precond = self.bandas.copy()
+        precond[2] += np.bincount(self.i_contato, weights=self.kc * np.abs(self.p_contato), minlength=self.tamanho)
+        self.lu = factor_pentadiagonal(precond)
+
+    # --- OPERADORES ---
+    def _folga_contato(self, w):
+        """Deslocamento relativo (superior - inferior) em cada cruzamento."""
+        return np.bincount(self.c_contato, weights=self.p_contato * w[self.i_contato],
+                           minlength=len(self.cruzamentos))
+
+    def matvec(self, w):
+        forca = self.kc * self._folga_contato(w)
+        return banded_matvec(self.bandas, w) + np.bincount(
+            self.i_contato, weights=self.p_contato * forca[self.c_contato], minlength=self.tamanho)
+
+    def precondition(self, r):
+        return solve_pentadiagonal(self.lu, r)
+
+    def _separar(self, w):
+        (n_sup, nos_sup), (n_inf, nos_inf) = self.forma
+        return w[:self.inicio_inf].reshape(n_sup, nos_sup), w[self.inicio_inf:].reshape(n_inf, nos_inf)
+
+    def pad_load(self, force_ton, pad_width, pad_x=0.0, pad_y=0.0):
+        """Forças nodais (N) nos mats superiores para uma sapata quadrada C × C."""
+        sup = self.camadas['top']
+        meia_c, meia_b = pad_width / 2, self.top['width'] / 2
+        sobreposicao = np.clip(np.minimum(sup['posicoes'] + meia_b, pad_y + meia_c)
+                               - np.maximum(sup['posicoes'] - meia_b, pad_y - meia_c), 0.0, None)
+        if sobreposicao.sum() <= 0:
+            raise ValueError("A sapata não está sobre nenhum mat superior.")
+        nos = _trecho(sup['coordenadas'], pad_x, pad_width)
+        forcas = np.zeros(self.forma[0])
+        forcas[:, nos] = (force_ton * TON_TO_N * sobreposicao / sobreposicao.sum())[:, np.newaxis] / nos.size
+        return forcas
+
+    # --- SOLUÇÃO ---
+    def solve(self, forces_top, tol=TOL_PCG, max_iter=MAX_ITER_PCG):
+        """
+        Gradientes conjugados precondicionados para forças nodais (N) nos mats
+        superiores; devolve as deflexões superiores, inferiores, o número de
+        iterações e se convergiu.
+        """
+        b = np.zeros(self.tamanho)
+        b[:self.inicio_inf] = np.ravel(forces_top)
+        x = np.zeros(self.tamanho)
+        r = b.copy()
+        z = self.precondition(r)
+        d = z.copy()
+        rz = r @ z
+        norma_b = np.linalg.norm(b)
+        convergiu = False
+        for iteracao in range(1, max_iter + 1):
+            ad = self.matvec(d)
+            alfa = rz / (d @ ad)
+            x += alfa * d
+            r -= alfa * ad
+            if np.linalg.norm(r) <= tol * norma_b:
+                convergiu = True
+                break
+            z = self.precondition(r)
+            rz_novo = r @ z
+            d = z + (rz_novo / rz) * d
+            rz = rz_novo
+        w_sup, w_inf = self._separar(x)
+        return w_sup, w_inf, iteracao, convergiu
+
+    def _tensoes(self, w, nome):
+        camada = self.camadas[nome]
+        curvatura = np.zeros_like(w)
+        curvatura[:, 1:-1] = (w[:, :-2] - 2 * w[:, 1:-1] + w[:, 2:]) / camada['dx'] ** 2
+        momento = -camada['ei'] * curvatura
+        cortante = np.gradient(momento, camada['dx'], axis=1)
+        return momento, np.abs(momento) / camada['modulo'], 1.5 * np.abs(cortante) / camada['area']
+
+    def analyze(self, force_ton, pad_width, pad_x=0.0, pad_y=0.0, p_lim_abs_pa=None):
+        """
+        Resposta completa a uma sapata: pressão sob cada mat inferior,
+        tensões de flexão e cisalhamento máximas em cada mat, forças nos
+        cruzamentos e, com `p_lim_abs_pa`, o Leff total sob cada mat inferior.
+        """
+        w_sup, w_inf, iteracoes, convergiu = self.solve(self.pad_load(force_ton, pad_width, pad_x, pad_y))
+        pressao = self.ks * w_inf
+        m_sup, sigma_sup, tau_sup = self._tensoes(w_sup, 'top')
+        m_inf, sigma_inf, tau_inf = self._tensoes(w_inf, 'bottom')
+        forcas = np.zeros((self.top['count'], self.bottom['count']))
+        forcas[self.cruzamentos[:, 0], self.cruzamentos[:, 1]] = self.kc * self._folga_contato(
+            np.concatenate([w_sup.ravel(), w_inf.ravel()]))
+        resultado = {
+            'x_top': self.camadas['top']['coordenadas'],
+            'y_bottom': self.camadas['bottom']['coordenadas'],
+            'w_top': w_sup,
+            'w_bottom': w_inf,
+            'pressure_bottom': pressao,
+            'p_max': float(pressao.max()),
+            'p_max_per_mat': pressao.max(axis=1),
+            'moment_top': m_sup,
+            'moment_bottom': m_inf,
+            'sigma_top': sigma_sup.max(axis=1),
+            'tau_top': tau_sup.max(axis=1),
+            'sigma_bottom': sigma_inf.max(axis=1),
+            'tau_bottom': tau_inf.max(axis=1),
+            'crossing_forces': forcas,
+            'iterations': iteracoes,
+            'converged': convergiu,
+        }
+        if p_lim_abs_pa is not None:
+            resultado['leff_total_per_mat'] = contact_zones(pressao.T, p_lim_abs_pa, self.camadas['bottom']['dx'],
+                                                            LINEAR)['leff_total']
+        return resultado
@@ -0,0 +1,110 @@
+# engine/winkler_influence.py
+
+"""
+Linhas de influência da viga de Winkler para cargas móveis.
+
+`winkler_leff` só aplica a carga no nó central (ou numa faixa centrada). Aqui
+a resposta a uma força unitária em cada nó é obtida de uma vez, com um único
+fator em cache e uma solução multi-RHS. Quando ks(x) e EI(x) são simétricos
+em relação ao centro do mat, o sistema tem simetria especular
+(G[i, j] = G[n-1-i, n-1-j]) e só metade das colunas é resolvida; com perfis
+assimétricos todas as colunas são resolvidas.
+
+Com as matrizes de influência de deflexão, pressão, momento e cortante,
+qualquer posição de sapata e qualquer combinação de várias sapatas é avaliada
+por superposição, com produtos matriz-vetor.
+"""
+
+import numpy as np
+
+from engine.winkler import NODE, TON_TO_N, WinklerModel, effective_length
+
+
+def _simetrico(valor):
+    """Escalar ou perfil nodal igual ao seu reflexo (a menos de arredondamento)."""
+    return np.ndim(valor) == 0 or np.allclose(valor, valor[::-1], rtol=1e-12, atol=0.0)
+
+
+class InfluenceLines:
+    """
+    Matrizes (nodes × nodes) de resposta: a coluna j é a resposta a 1 N
+    aplicado no nó j. Os nós de contorno (engastados) têm coluna nula.
+    """
+
+    def __init__(self, model: WinklerModel):
+        self.model = model
+        n, dx = model.nodes, model.dx
+        espelhar = _simetrico(model.ks) and _simetrico(model.ei_x)
+        colunas = (n + 1) // 2 if espelhar else n
+        q = np.zeros((n, colunas))
+        q[np.arange(colunas), np.arange(colunas)] = 1.0 / dx
+        deflection = model.solve(q)
+
+        if espelhar:
+            # colunas da segunda metade pela simetria especular
+            espelhadas = n - 1 - np.arange(colunas, n)
+            deflection = np.concatenate([deflection, deflection[::-1, espelhadas]], axis=1)
+
+        self.deflection = deflection
+        self.pressure = model.soil_pressure(deflection)
+        self.moment, self.shear = model.bending(deflection)
+
+    @classmethod
+    def for_beam(cls, length, width, thickness, young_gpa, ks_kn_m3, nodes):
+        return cls(WinklerModel(length, width, thickness, young_gpa, ks_kn_m3, nodes))
+
+    def nodal_forces(self, centers, force_ton, patch_width=None):
+        """
+        Forças nodais (N), forma (nodes, k), para k sapatas centradas em
+        `centers` (m). Cargas pontuais fora dos nós são divididas linearmente
+        entre os dois nós vizinhos; faixas distribuem a força igualmente pelos
+        nós cobertos, como em `winkler_leff`.
+        """
+        model = self.model
+        centers = np.atleast_1d(np.asarray(centers, dtype=np.float64))
+        forca = np.broadcast_to(np.asarray(force_ton, dtype=np.float64) * TON_TO_N, centers.shape)
+        colunas = np.arange(centers.size)
+        forces = np.zeros((model.nodes, centers.size))
+        if patch_width is None:
+            posicao = np.clip(centers / model.dx, 0, model.nodes - 1)
+            esquerda = np.minimum(np.floor(posicao).astype(np.intp), model.nodes - 2)
+            fracao = posicao - esquerda
+            np.add.at(forces, (esquerda, colunas), forca * (1 - fracao))
+            np.add.at(forces, (esquerda + 1, colunas), forca * fracao)
+        else:
+            half = patch_width / 2.0
+            mask = (model.x[:, np.newaxis] >= centers - half) & (model.x[:, np.newaxis] <= centers + half)
+            cobertos = mask.sum(axis=0)
+            forces = np.where(mask, forca / np.maximum(cobertos, 1), 0.0)
+        return forces
+
+    def evaluate(self, forces, p_lim_abs_pa=None, method=NODE):
+        """
+        Resposta por superposição a forças nodais (nodes,) ou (nodes, k);
+        cada coluna pode ser uma combinação de várias sapatas (soma das
+        colunas de `nodal_forces`). Com `p_lim_abs_pa`, inclui o Leff total
+        extraído por `method`.
+        """
+        resposta = {
+            'deflection': self.deflection @ forces,
+            'pressure': self.pressure @ forces,
+            'moment': self.moment @ forces,
+            'shear': self.shear @ forces,
+        }
+        if p_lim_abs_pa is not None:
+            resposta['leff_total'] = effective_length(resposta['pressure'], p_lim_abs_pa, self.model.dx, method)
+        return resposta
+
+    def envelope(self, force_ton, patch_width=None, centers=None):
+        """
+        Envoltória (mínimo e máximo em cada nó) de pressão, momento e
+        cortante para uma sapata percorrendo `centers` (por padrão, todos os nós).
+        """
+        if centers is None:
+            centers = self.model.x
+        resposta = self.evaluate(self.nodal_forces(centers, force_ton, patch_width))
+        return {
+            nome: {'min': valores.min(axis=1), 'max': valores.max(axis=1)}
+            for nome, valores in resposta.items()
+            if nome != 'deflection'
+        }
@@ -0,0 +1,193 @@
+# engine/winkler_multimat.py
+
+"""
+Mats paralelos lado a lado sob uma mesma sapata, sobre base de Winkler.
+
+Quando a sapata cobre vários mats, a parcela de carga de cada um depende da
+sua rigidez e do apoio do solo. Cada mat é uma viga livre-livre (rigidez
+variacional Dᵀ·diag(EI/dx³)·D, como em engine/winkler_crossed.py) com molas
+de solo ks·B por unidade de comprimento, de modo que p = ks·w é a pressão
+(Pa). A sapata (C_x ao longo dos mats, C_y na transversal) transmite a cada
+mat uma carga uniforme nos nós sob ela.
+
+O acoplamento é resolvido por complemento de Schur: os graus de liberdade
+de cada mat são condensados na flexibilidade g_j = deflexão média sob a
+sapata para 1 N, obtida com uma única solução pentadiagonal em lote para
+todos os mats. Sobram só as incógnitas da sapata (sistema de borda):
+
+- sapata rígida: translação w0 e giro θ em torno do eixo x, com equilíbrio
+  de força e de momento (F_j = (w0 + θ·y_j)/g_j, y_j no centro da faixa de
+  contato);
+- sapata flexível: viga livre-livre na direção y com EI dado, apoiada nos
+  mats; com EI = 0 a carga se divide pela área de contato.
+
+Nos dois casos a mola 1/g_j de cada mat se distribui pela largura de
+contato, de modo que a sapata rígida é o limite da flexível com EI → ∞.
+Acima de EI/(k·C_y³) = RAZAO_SAPATA_RIGIDA (k a soma das molas) a viga da
+sapata fica mal condicionada e difere da rígida em menos de 1e-4, então a
+partilha rígida é usada no lugar dela.
+
+Mats que levantariam a sapata (F_j < 0) saem do contato e o sistema é
+resolvido de novo. O custo cresce linearmente com o número de mats.
+"""
+
+import numpy as np
+
+from engine.winkler import (
+    LINEAR, NODES, TON_TO_N, assemble_free_bands, bending_response, effective_length, factor_pentadiagonal,
+    inertia_rectangular, solve_pentadiagonal,
+)
+
+PAD_NODES = 201
+RAZAO_SAPATA_RIGIDA = 10.0
+
+
+class MultiMat:
+    """
+    Mats paralelos ao eixo x, centrados em x = 0. `mats` é uma sequência de
+    dicionários com length, width, thickness, young_gpa e, opcionalmente,
+    ks_kn_m3 (padrão: o ks comum) e y (centro do mat; sem y, os mats ficam
+    lado a lado com folga `gap`, centrados em y = 0).
+    """
+
+    def __init__(self, mats, ks_kn_m3, gap=0.0, nodes=NODES):
+        self.mats = [dict(mat) for mat in mats]
+        if not self.mats:
+            raise ValueError("Informe ao menos um mat.")
+        self.nodes = int(nodes)
+        coluna = lambda chave, padrao=None: np.array([mat.get(chave, padrao) for mat in self.mats], dtype=np.float64)
+        self.length = coluna('length')
+        self.width = coluna('width')
+        self.thickness = coluna('thickness')
+        self.ks = coluna('ks_kn_m3', ks_kn_m3) * 1000
+        self.ei = coluna('young_gpa') * 1e9 * inertia_rectangular(self.width, self.thickness)
+        self.modulo = self.width * self.thickness**2 / 6
+        self.area = self.width * self.thickness
+
+        if all('y' in mat for mat in self.mats):
+            self.y = coluna('y')
+        else:
+            bordas = np.concatenate([[0.0], np.cumsum(self.width + gap)])
+            self.y = bordas[:-1] + self.width / 2 - (bordas[-1] - gap) / 2
+
+        self.x = np.linspace(-self.length / 2, self.length / 2, self.nodes, axis=-1)
+        self.dx = self.length / (self.nodes - 1)
+        pesos = np.broadcast_to(self.dx[:, np.newaxis], self.x.shape).copy()
+        pesos[:, [0, -1]] /= 2
+        solo = (self.ks * self.width)[:, np.newaxis] * pesos
+        self.lu = factor_pentadiagonal(assemble_free_bands(self.nodes, self.dx, self.ei[:, np.newaxis], solo))
+
+    def unit_response(self, pad_length, pad_x=0.0):
+        """
+        Deflexão (mats, nós) para 1 N distribuído nos nós sob a sapata (ao
+        menos o mais próximo) e a flexibilidade g_j (média sob a sapata).
+        """
+        sob = np.abs(self.x - pad_x) <= pad_length / 2 + 1e-12
+        vazio = ~sob.any(axis=-1)
+        sob[vazio, np.abs(self.x[vazio] - pad_x).argmin(axis=-1)] = True
+        carga = sob / sob.sum(axis=-1, keepdims=True)
+        u = solve_pentadiagonal(self.lu, carga)
+        return u, (carga * u).sum(axis=-1)
+
+    def _faixas(self, pad_width, pad_y):
+        """Largura e centro da faixa de contato de cada mat com a sapata em y."""
+        inicio = np.maximum(self.y - self.width / 2, pad_y - pad_width / 2)
+        fim = np.minimum(self.y + self.width / 2, pad_y + pad_width / 2)
+        return np.clip(fim - inicio, 0.0, None), (inicio + fim) / 2
+
+    # --- PARTILHA DA CARGA ---
+    @staticmethod
+    def _rigid_share(rigidez, y, contato):
+        """
+        Parcelas para força unitária com sapata rígida (translação e giro). A
+        mola de cada mat se distribui pela faixa de contato, que também
+        resiste ao giro (rigidez·c²/12).
+        """
+        s0, s1, s2 = rigidez.sum(), rigidez @ y, rigidez @ (y**2 + contato**2 / 12)
+        det = s0 * s2 - s1**2
+        if det <= 1e-12 * s0 * s2:
+            return rigidez / s0
+        w0, theta = s2 / det, -s1 / det
+        return rigidez * (w0 + theta * y)
+
+    def _flexible_share(self, rigidez, contato, centro, pad_width, pad_y, pad_ei):
+        """Parcelas para força unitária com a sapata como viga em y sobre os mats."""
+        if pad_ei == 0:
+            return contato * (rigidez > 0) / (contato * (rigidez > 0)).sum()
+        if pad_ei >= RAZAO_SAPATA_RIGIDA * rigidez.sum() * pad_width**3:
+            return self._rigid_share(rigidez, np.where(rigidez > 0, centro - pad_y, 0.0), contato)
+        y = np.linspace(pad_y - pad_width / 2, pad_y + pad_width / 2, PAD_NODES)
+        dy = y[1] - y[0]
+        pesos = np.full(PAD_NODES, dy)
+        pesos[[0, -1]] = dy / 2
+        # mola distribuída de cada mat ativo, pela sobreposição da faixa de
+        # contato com o trecho de influência de cada nó da sapata
+        inicio, fim = (centro - contato / 2)[:, np.newaxis], (centro + contato / 2)[:, np.newaxis]
+        trecho_inicio, trecho_fim = np.maximum(y - dy / 2, y[0]), np.minimum(y + dy / 2, y[-1])
+        molas = np.clip(np.minimum(trecho_fim, fim) - np.maximum(trecho_inicio, inicio), 0.0, None)
+        molas *= (rigidez / np.maximum(molas.sum(axis=-1), 1e-300))[:, np.newaxis]
+        lu = factor_pentadiagonal(assemble_free_bands(PAD_NODES, dy, pad_ei, molas.sum(axis=0)))
+        w = solve_pentadiagonal(lu, pesos / pad_width)
+        parcela = molas @ w
+        return parcela / parcela.sum()
+
+    def load_share(self, pad_length, pad_width, pad_x=0.0, pad_y=0.0, pad_ei=None):
+        """
+        Fração da carga em cada mat (soma 1) e a deflexão unitária dos mats.
+        `pad_ei` (N·m², direção y): None = sapata rígida, 0 = flexível.
+        """
+        u, g = self.unit_response(pad_length, pad_x)
+        contato, centro = self._faixas(pad_width, pad_y)
+        ativos = contato > 0
+        if not ativos.any():
+            raise ValueError("A sapata não está sobre nenhum mat.")
+        for _ in range(len(self.mats)):
+            rigidez = np.where(ativos, 1.0 / g, 0.0)
+            if pad_ei is None:
+                parcela = self._rigid_share(rigidez, np.where(ativos, centro - pad_y, 0.0), contato)
+            else:
+                parcela = self._flexible_share(rigidez, contato, centro, pad_width, pad_y, pad_ei)
+            if not np.any(parcela[ativos] < 0):
+                break
+            ativos &= parcela >= 0
+        return np.where(ativos, parcela, 0.0), u
+
+    # --- RESPOSTA ---
+    def analyze(self, force_ton, pad_length, pad_width, pad_x=0.0, pad_y=0.0, pad_ei=None,
+                p_lim_abs_pa=None, method=LINEAR):
+        """
+        Parcela de carga, deflexão, pressão no solo, tensões máximas de
+        flexão e cisalhamento e, com `p_lim_abs_pa`, o Leff de cada mat.
+        """
+        parcela, u = self.load_share(pad_length, pad_width, pad_x, pad_y, pad_ei)
+        forcas = force_ton * TON_TO_N * parcela
+        w = forcas[:, np.newaxis] * u
+        pressao = self.ks[:, np.newaxis] * w
+        # Diferenças com espaçamento unitário, reescaladas pelo dx de cada mat
+        momento, cortante = bending_response(w.T, 1.0, 1.0)
+        momento = (self.ei / self.dx**2)[:, np.newaxis] * momento.T
+        cortante = (self.ei / self.dx**3)[:, np.newaxis] * cortante.T
+        resultado = {
+            'x': self.x,
+            'y': self.y,
+            'share': parcela,
+            'force_n': forcas,
+            'w': w,
+            'pressure': pressao,
+            'moment': momento,
+            'p_max': pressao.max(axis=-1),
+            'sigma': np.abs(momento).max(axis=-1) / self.modulo,
+            'tau': 1.5 * np.abs(cortante).max(axis=-1) / self.area,
+        }
+        if p_lim_abs_pa is not None:
+            leff_total = effective_length(pressao.T, p_lim_abs_pa, self.dx, method)
+            resultado['leff_total'] = leff_total
+            resultado['leff'] = leff_total / 2
+        return resultado
+
+
+def multimat_load_share(mats, ks_kn_m3, force_ton, pad_length, pad_width, p_lim_abs_pa=None, pad_x=0.0,
+                        pad_y=0.0, pad_ei=None, gap=0.0, nodes=NODES, method=LINEAR) -> dict:
+    """Atalho: monta `MultiMat` e devolve `analyze` para uma sapata."""
+    return MultiMat(mats, ks_kn_m3, gap, nodes).analyze(force_ton, pad_length, pad_width, pad_x, pad_y, pad_ei,
+                                                        p_lim_abs_pa, method)
@@ -0,0 +1,168 @@
+# engine/winkler_nonlinear.py
+
+"""
+Bases não lineares para a viga de Winkler: contato sem tração e pressão
+limitada.
+
+No modelo linear de `winkler_leff` o solo puxa o mat para baixo nas pontas
+(pressão negativa) e a pressão cresce sem limite além de qa. Aqui cada mola
+do solo fica em um de três estados:
+
+- LIFTED:  descolada (w < 0 com contato sem tração), p = 0;
+- ELASTIC: p = ks·w;
+- CAPPED:  plastificada (ks·w > p_cap), p = p_cap constante.
+
+O conjunto ativo é resolvido por iteração (Newton semi-suave), partindo da
+solução linear. As matrizes de iterações sucessivas só diferem do fator de
+referência (em cache) na diagonal dos nós que mudaram de estado, então cada
+iteração é resolvida pela identidade de Woodbury, com as colunas A⁻¹·e_i
+guardadas entre iterações. Quando muitos nós mudam, a matriz é refatorada
+com o estado atual como nova referência.
+
+As extremidades mantêm o engaste de `winkler_leff` (w = 0 e dw/dx = 0 nos
+dois primeiros e nos dois últimos nós). Esses nós não têm mola e nunca
+descolam: mesmo com `tensionless` o engaste pode segurar a ponta do mat
+com uma reação de tração. Para pontas livres, use a viga livre-livre de
+engine/hetenyi.py.
+"""
+
+import numpy as np
+
+from engine.winkler import (
+    NODE, TON_TO_N, WinklerModel, boundary_rows, effective_length, factor_pentadiagonal, load_vector,
+    solve_pentadiagonal,
+)
+
+LIFTED = 0
+ELASTIC = 1
+CAPPED = 2
+
+MAX_ITERATIONS = 50
+
+
+class NonlinearWinkler:
+    """
+    Solver de conjunto ativo sobre um `WinklerModel`. `tensionless` ativa o
+    descolamento; `p_cap_pa` limita a pressão (mesma convenção p = ks·w do
+    modelo linear). `max_changes` é o número de nós alterados a partir do
+    qual a atualização de baixo posto dá lugar a uma nova fatoração.
+    """
+
+    def __init__(self, model: WinklerModel, tensionless=True, p_cap_pa=None, max_changes=None,
+                 max_iterations=MAX_ITERATIONS):
+        self.model = model
+        self.tensionless = tensionless
+        self.p_cap_pa = p_cap_pa
+        self.max_changes = max_changes if max_changes is not None else max(16, model.nodes // 20)
+        self.max_iterations = max_iterations
+        self.scale = model.dx**4 / model.ei
+        self.a = np.broadcast_to(model.ks * self.scale, (model.nodes,))
+        self.interior = np.zeros(model.nodes, dtype=bool)
+        self.interior[2:-2] = True
+
+    def states(self, w):
+        """Estado de cada mola para a deflexão w (os nós de contorno, engastados, ficam ELASTIC)."""
+        p = self.model.soil_pressure(w)
+        estado = np.full(w.shape, ELASTIC)
+        if self.tensionless:
+            estado[p < 0] = LIFTED
+        if self.p_cap_pa is not None:
+            estado[p > self.p_cap_pa] = CAPPED
+        estado[~self.interior] = ELASTIC
+        return estado
+
+    def solve(self, q):
+        """
+        Deflexão e pressão para a carga distribuída q (N/m). Devolve também os
+        estados, o número de iterações, de soluções lineares e de fatorações.
+        """
+        model = self.model
+        rhs_carga = np.array(q, dtype=np.float64) * self.scale
+        rhs_carga[boundary_rows(model.nodes)] = 0.0
+
+        # Referência inicial: fator linear (todas as molas) do cache
+        lu = model.lu
+        molas_ref = self.interior.copy()
+        colunas = {}
+        solucoes = 1
+        fatoracoes = 0
+
+        w = solve_pentadiagonal(lu, rhs_carga)
+        estado = self.states(w)
+        convergiu = False
+        for iteracao in range(1, self.max_iterations + 1):
+            molas = (estado == ELASTIC) & self.interior
+            rhs = rhs_carga
+            if self.p_cap_pa is not None:
+                rhs = rhs - np.where(estado == CAPPED, self.p_cap_pa * self.scale, 0.0)
+
+            alterados = np.flatnonzero(molas != molas_ref)
+            if alterados.size > self.max_changes:
+                lu = factor_pentadiagonal(model.bands(springs=molas))
+                molas_ref = molas
+                colunas = {}
+                fatoracoes += 1
+                alterados = alterados[:0]
+
+            x0 = solve_pentadiagonal(lu, rhs)
+            solucoes += 1
+            if alterados.size:
+                faltantes = [i for i in alterados.tolist() if i not in colunas]
+                if faltantes:
+                    unitarios = np.zeros((model.nodes, len(faltantes)))
+                    unitarios[faltantes, np.arange(len(faltantes))] = 1.0
+                    for i, coluna in zip(faltantes, solve_pentadiagonal(lu, unitarios).T):
+                        colunas[i] = coluna
+                    solucoes += 1
+                # A = A_ref + U·diag(c)·Uᵀ, com c = +a (mola ligada) ou -a (desligada)
+                z = np.stack([colunas[i] for i in alterados.tolist()], axis=1)
+                c = np.where(molas[alterados], self.a[alterados], -self.a[alterados])
+                capacitancia = np.diag(1.0 / c) + z[alterados, :]
+                x0 = x0 - z @ np.linalg.solve(capacitancia, x0[alterados])
+            w = x0
+
+            novo = self.states(w)
+            if np.array_equal(novo, estado):
+                convergiu = True
+                break
+            estado = novo
+
+        p = np.where(estado == ELASTIC, model.soil_pressure(w), 0.0)
+        if self.p_cap_pa is not None:
+            p = np.where(estado == CAPPED, self.p_cap_pa, p)
+        return {
+            'w': w,
+            'p': p,
+            'states': estado,
+            'iterations': iteracao,
+            'linear_solves': solucoes,
+            'factorizations': fatoracoes,
+            'converged': convergiu,
+        }
+
+
+def winkler_leff_nonlinear(
+    force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width, nodes,
+    tensionless=True, p_cap_pa=None, method=NODE,
+) -> dict:
+    """
+    Mesmas entradas e saídas de `winkler_leff`, com base sem tração e/ou
+    pressão limitada a `p_cap_pa`; inclui os comprimentos descolado e
+    plastificado e as estatísticas do solver.
+    """
+    model = WinklerModel(length, width, thickness, young_gpa, ks_kn_m3, nodes)
+    solver = NonlinearWinkler(model, tensionless=tensionless, p_cap_pa=p_cap_pa)
+    resultado = solver.solve(load_vector(model.x, length, force_ton * TON_TO_N, model.dx, patch_width))
+    p = resultado['p']
+    leff_total = float(effective_length(p, p_lim_abs_pa, model.dx, method))
+    return {
+        "leff": leff_total / 2,
+        "leff_total": leff_total,
+        "p_max": float(p.max()),
+        "p_lim": p_lim_abs_pa,
+        "lifted_length": float(np.count_nonzero(resultado['states'] == LIFTED) * model.dx),
+        "capped_length": float(np.count_nonzero(resultado['states'] == CAPPED) * model.dx),
+        "iterations": resultado['iterations'],
+        "linear_solves": resultado['linear_solves'],
+        "converged": resultado['converged'],
+    }
@@ -0,0 +1,311 @@
+# engine/winkler_plate.py
+
+"""
+Placa sobre base elástica (Winkler, opcionalmente Pasternak) em malha
+estruturada.
+
+O Leff de Duerr e o `winkler_leff` 1-D ignoram o espalhamento da carga na
+largura B do mat, que é justamente o que importa para sapatas quadradas em
+mats largos. Aqui o mat é uma placa livre nas quatro bordas, discretizada em
+células (centros em x ao longo do comprimento e em y ao longo da largura).
+
+A rigidez vem da energia discreta da placa (ortotrópica, Kirchhoff):
+
+    Dx·κxx² + Dy·κyy² + 2·D1·κxx·κyy + 4·Dxy·κxy²
+
+com curvaturas por diferenças centrais (κxx e κyy nos pontos onde existem,
+κxy nos cantos das células), mais k·w (Winkler) e Gp·|∇w|² (Pasternak). O
+operador é aplicado sem montar matriz (estêncil vetorizado) e o sistema,
+simétrico positivo definido, é resolvido por gradientes conjugados. O
+precondicionador é a mesma placa com o k médio e contorno de Neumann, que é
+diagonal na base de cossenos (DCT-II) das células: cada aplicação custa
+quatro produtos de matrizes pequenas (nx × nx e ny × ny).
+
+Com `shear_deformation`, a deflexão é separada em flexão e cisalhamento
+(w = w_b + w_s, com energia κ·G·h·|∇w_s|² para w_s), que reproduz a equação
+de Mindlin da placa espessa; o precondicionador vira um bloco 2 × 2 por modo.
+
+Diferente da viga 1-D (onde ks·w é tratado como carga por metro), aqui
+p = k·w - Gp·∇²w já é a pressão de contato em Pa.
+"""
+
+import numpy as np
+
+from engine.winkler import TON_TO_N
+
+NODES_X = 200
+POISSON = 0.3
+SHEAR_CORRECTION = 5.0 / 6.0
+TOL_PCG = 1e-8
+MAX_ITER_PCG = 2000
+
+
+# --- DIFERENÇAS FINITAS ---
+def _fatia(eixo, inicio, fim):
+    return (Ellipsis, slice(inicio, fim)) if eixo == -1 else (Ellipsis, slice(inicio, fim), slice(None))
+
+
+def _d1(w, eixo, h):
+    return (w[_fatia(eixo, 1, None)] - w[_fatia(eixo, None, -1)]) / h
+
+
+def _d1_t(c, eixo, h):
+    forma = list(c.shape)
+    forma[eixo] += 1
+    r = np.zeros(forma)
+    r[_fatia(eixo, 1, None)] += c
+    r[_fatia(eixo, None, -1)] -= c
+    return r / h
+
+
+def _d2(w, eixo, h):
+    return (w[_fatia(eixo, None, -2)] - 2 * w[_fatia(eixo, 1, -1)] + w[_fatia(eixo, 2, None)]) / h**2
+
+
+def _d2_t(c, eixo, h):
+    forma = list(c.shape)
+    forma[eixo] += 2
+    r = np.zeros(forma)
+    r[_fatia(eixo, None, -2)] += c
+    r[_fatia(eixo, 1, -1)] -= 2 * c
+    r[_fatia(eixo, 2, None)] += c
+    return r / h**2
+
+
+def _interior(c, eixo):
+    """Restringe ao interior ao longo do outro eixo (onde κxx e κyy coexistem)."""
+    return c[_fatia(eixo, 1, -1)]
+
+
+def _interior_t(c, eixo):
+    forma = list(c.shape)
+    forma[eixo] += 2
+    r = np.zeros(forma)
+    r[_fatia(eixo, 1, -1)] = c
+    return r
+
+
+def cosine_basis(n, h):
+    """
+    Autovetores ortonormais (DCT-II, colunas) e autovalores do laplaciano de
+    Neumann em n células de tamanho h.
+    """
+    modos = np.arange(n)
+    base = np.cos(np.pi * np.outer(np.arange(n) + 0.5, modos) / n) * np.sqrt(2.0 / n)
+    base[:, 0] = np.sqrt(1.0 / n)
+    return base, (2.0 - 2.0 * np.cos(np.pi * modos / n)) / h**2
+
+
+def _overlap(centros, h, centro, largura):
+    """Fração de cada célula coberta pelo intervalo [centro ± largura/2]."""
+    return np.clip(np.minimum(centros + h / 2, centro + largura / 2)
+                   - np.maximum(centros - h / 2, centro - largura / 2), 0.0, h) / h
+
+
+# --- PLACA ---
+class WinklerPlate:
+    """
+    Placa retangular livre sobre base elástica. Propriedades em SI, exceto
+    E (GPa) e ks (kN/m³). `ks_kn_m3` aceita escalar ou mapa (ny, nx) por
+    célula; `young_transverse_gpa` e `shear_modulus_gpa` tornam a placa
+    ortotrópica (por padrão, isotrópica com G = E/2(1+ν)); `pasternak_kn_m`
+    é a rigidez da camada de cisalhamento Gp (kN/m).
+
+    A preparação (rigidezes, base de cossenos e símbolo do precondicionador)
+    é feita uma vez e reaproveitada por todos os carregamentos.
+    """
+
+    def __init__(self, length, width, thickness, young_gpa, ks_kn_m3, nx=NODES_X, ny=None, poisson=POISSON,
+                 young_transverse_gpa=None, shear_modulus_gpa=None, pasternak_kn_m=0.0, shear_deformation=False):
+        if ny is None:
+            ny = max(3, int(round(nx * width / length)))
+        if nx < 3 or ny < 3:
+            raise ValueError("A malha da placa precisa de ao menos 3 células em cada direção.")
+        self.length, self.width, self.thickness = length, width, thickness
+        self.nx, self.ny = int(nx), int(ny)
+        self.hx, self.hy = length / self.nx, width / self.ny
+        self.x = (np.arange(self.nx) + 0.5) * self.hx - length / 2
+        self.y = (np.arange(self.ny) + 0.5) * self.hy - width / 2
+
+        ex = young_gpa * 1e9
+        ey = ex if young_transverse_gpa is None else young_transverse_gpa * 1e9
+        g = ex / (2 * (1 + poisson)) if shear_modulus_gpa is None else shear_modulus_gpa * 1e9
+        nu_yx = poisson * ey / ex
+        fator = thickness**3 / (12 * (1 - poisson * nu_yx))
+        self.rigidity_x = ex * fator
+        self.rigidity_y = ey * fator
+        self.rigidity_xy_coupling = poisson * ey * fator
+        self.rigidity_twist = g * thickness**3 / 12
+        self.shear_stiffness = SHEAR_CORRECTION * g * thickness if shear_deformation else None
+        self.pasternak = pasternak_kn_m * 1000
+        self.k = np.broadcast_to(np.asarray(ks_kn_m3, dtype=np.float64) * 1000, (self.ny, self.nx))
+        k_medio = float(self.k.mean())
+        if k_medio <= 0:
+            raise ValueError("A placa livre precisa de rigidez de base (ks) positiva.")
+        self.componentes = 2 if shear_deformation else 1
+
+        # D1·κxx·κyy só existe onde as duas curvaturas existem: a parcela
+        # acoplada é escrita como D1·(√r·κxx + κyy/√r)², r = √(Dx/Dy), e as
+        # sobras Dx - D1·r e Dy - D1/r só são ≥ 0 juntas se D1² ≤ Dx·Dy
+        if self.rigidity_xy_coupling**2 > self.rigidity_x * self.rigidity_y:
+            raise ValueError("Material ortotrópico inválido: ν²·Ey > Ex deixa a rigidez da placa indefinida.")
+        self.razao = np.sqrt(self.rigidity_x / self.rigidity_y)
+
+        # Precondicionador: símbolo da placa com k médio na base de cossenos
+        self.base_x, lx = cosine_basis(self.nx, self.hx)
+        self.base_y, ly = cosine_basis(self.ny, self.hy)
+        lx, ly = lx[np.newaxis, :], ly[:, np.newaxis]
+        flexao = (self.rigidity_x * lx**2 + self.rigidity_y * ly**2
+                  + 2 * (self.rigidity_xy_coupling + 2 * self.rigidity_twist) * lx * ly)
+        fundacao = k_medio + self.pasternak * (lx + ly)
+        if self.shear_stiffness is None:
+            self._inversa = (1.0 / (flexao + fundacao),)
+        else:
+            # bloco [[b + f, f], [f, s + f]] por modo; no modo constante w_s = 0
+            cisalhamento = self.shear_stiffness * (lx + ly)
+            det = flexao * cisalhamento + fundacao * (flexao + cisalhamento)
+            det[0, 0] = 1.0
+            inv_bb, inv_bs, inv_ss = (cisalhamento + fundacao) / det, -fundacao / det, (flexao + fundacao) / det
+            inv_bb[0, 0], inv_bs[0, 0], inv_ss[0, 0] = 1.0 / fundacao[0, 0], 0.0, 0.0
+            self._inversa = (inv_bb, inv_bs, inv_ss)
+
+    # --- OPERADORES ---
+    def _bending(self, w):
+        kxx, kyy = _d2(w, -1, self.hx), _d2(w, -2, self.hy)
+        acoplado = (np.sqrt(self.razao) * _interior(kxx, -2) + _interior(kyy, -1) / np.sqrt(self.razao))
+        acoplado = self.rigidity_xy_coupling * acoplado
+        r = _d2_t((self.rigidity_x - self.rigidity_xy_coupling * self.razao) * kxx
+                  + np.sqrt(self.razao) * _interior_t(acoplado, -2), -1, self.hx)
+        r += _d2_t((self.rigidity_y - self.rigidity_xy_coupling / self.razao) * kyy
+                   + _interior_t(acoplado, -1) / np.sqrt(self.razao), -2, self.hy)
+        kxy = _d1(_d1(w, -1, self.hx), -2, self.hy)
+        r += 4 * self.rigidity_twist * _d1_t(_d1_t(kxy, -2, self.hy), -1, self.hx)
+        return r
+
+    def _laplacian(self, w):
+        """-∇²w discreto (Neumann), simétrico e positivo semidefinido."""
+        return _d1_t(_d1(w, -1, self.hx), -1, self.hx) + _d1_t(_d1(w, -2, self.hy), -2, self.hy)
+
+    def _foundation(self, w):
+        r = self.k * w
+        if self.pasternak:
+            r = r + self.pasternak * self._laplacian(w)
+        return r
+
+    def matvec(self, u):
+        """Aplica a rigidez (por unidade de área) a u com forma (..., componentes, ny, nx)."""
+        if self.componentes == 2:
+            # w_s é definido a menos de uma constante (absorvida por w_b)
+            u = u.copy()
+            u[..., 1, :, :] -= u[..., 1, :, :].mean(axis=(-2, -1), keepdims=True)
+        fundacao = self._foundation(u.sum(axis=-3))
+        r = np.empty_like(u)
+        r[..., 0, :, :] = self._bending(u[..., 0, :, :]) + fundacao
+        if self.componentes == 2:
+            s = self.shear_stiffness * self._laplacian(u[..., 1, :, :]) + fundacao
+            r[..., 1, :, :] = s - s.mean(axis=(-2, -1), keepdims=True)
+        return r
+
+    def precondition(self, r):
+        espectro = self.base_y.T @ r @ self.base_x
+        if self.componentes == 1:
+            z = espectro * self._inversa[0]
+        else:
+            inv_bb, inv_bs, inv_ss = self._inversa
+            rb, rs = espectro[..., 0, :, :], espectro[..., 1, :, :]
+            z = np.stack([inv_bb * rb + inv_bs * rs, inv_bs * rb + inv_ss * rs], axis=-3)
+        return self.base_y @ z @ self.base_x.T
+
+    # --- CARGAS E SOLUÇÃO ---
+    def pad_load(self, force_ton, pad_length, pad_width=None, center=(0.0, 0.0)):
+        """
+        Pressão (Pa) por célula de uma sapata retangular (quadrada sem
+        `pad_width`) centrada em `center` = (x, y); a força total é mantida
+        mesmo quando a sapata excede a borda do mat.
+        """
+        pad_width = pad_length if pad_width is None else pad_width
+        cobertura = (_overlap(self.y, self.hy, center[1], pad_width)[:, np.newaxis]
+                     * _overlap(self.x, self.hx, center[0], pad_length)[np.newaxis, :])
+        area = cobertura.sum() * self.hx * self.hy
+        if area <= 0:
+            raise ValueError("A sapata não está sobre o mat.")
+        return force_ton * TON_TO_N * cobertura / area
+
+    def solve(self, q, tol=TOL_PCG, max_iter=MAX_ITER_PCG):
+        """
+        Gradientes conjugados precondicionados para a pressão aplicada q (Pa),
+        com forma (ny, nx) ou (..., ny, nx) para vários carregamentos de uma
+        vez. Devolve a deflexão total, as iterações e se cada caso convergiu.
+        """
+        q = np.asarray(q, dtype=np.float64)
+        b = np.repeat(q[..., np.newaxis, :, :], self.componentes, axis=-3)
+        if self.componentes == 2:
+            b[..., 1, :, :] -= q.mean(axis=(-2, -1), keepdims=True)
+        eixos = (-3, -2, -1)
+
+        def produto(a, c):
+            return np.sum(a * c, axis=eixos, keepdims=True)
+
+        x = np.zeros_like(b)
+        r = b.copy()
+        z = self.precondition(r)
+        d = z.copy()
+        rz = produto(r, z)
+        limite = tol * np.sqrt(produto(b, b))
+        ativo = np.sqrt(produto(r, r)) > limite
+        iteracao = 0
+        while np.any(ativo) and iteracao < max_iter:
+            iteracao += 1
+            ad = self.matvec(d)
+            dad = produto(d, ad)
+            alfa = np.divide(rz, dad, out=np.zeros_like(rz), where=ativo & (dad > 0))
+            x += alfa * d
+            r -= alfa * ad
+            ativo &= np.sqrt(produto(r, r)) > limite
+            z = self.precondition(r)
+            rz_novo = produto(r, z)
+            beta = np.divide(rz_novo, rz, out=np.zeros_like(rz), where=ativo & (rz != 0))
+            d = np.where(ativo, z + beta * d, d)
+            rz = rz_novo
+        return x.sum(axis=-3), iteracao, ~ativo.reshape(ativo.shape[:-3])
+
+    def pressure(self, w):
+        """Pressão de contato (Pa): k·w mais a parcela da camada de Pasternak."""
+        return self._foundation(w)
+
+    def analyze(self, force_ton, pad_length, pad_width=None, center=(0.0, 0.0), p_lim_abs_pa=None):
+        """
+        Mapa de pressão sob uma sapata e áreas de apoio: `contact_area`
+        (p > 0), `equivalent_area` (F / p_max) e, com `p_lim_abs_pa`,
+        `effective_area` (células com p ≥ p_lim).
+        """
+        forca = force_ton * TON_TO_N
+        w, iteracoes, convergiu = self.solve(self.pad_load(force_ton, pad_length, pad_width, center))
+        p = self.pressure(w)
+        area_celula = self.hx * self.hy
+        p_max = float(p.max())
+        resultado = {
+            'x': self.x,
+            'y': self.y,
+            'w': w,
+            'pressure': p,
+            'p_max': p_max,
+            'p_min': float(p.min()),
+            'contact_area': float(np.count_nonzero(p > 0) * area_celula),
+            'equivalent_area': forca / p_max,
+            'iterations': iteracoes,
+            'converged': bool(convergiu),
+        }
+        if p_lim_abs_pa is not None:
+            resultado['p_lim'] = p_lim_abs_pa
+            resultado['effective_area'] = float(np.count_nonzero(p >= p_lim_abs_pa) * area_celula)
+        return resultado
+
+
+def plate_effective_area(force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, pad_width,
+                         nx=NODES_X, ny=None, **plate_options) -> dict:
+    """Área de apoio efetiva sob uma sapata quadrada C × C no centro do mat."""
+    placa = WinklerPlate(length, width, thickness, young_gpa, ks_kn_m3, nx=nx, ny=ny, **plate_options)
+    resultado = placa.analyze(force_ton, pad_width, p_lim_abs_pa=p_lim_abs_pa)
+    return {chave: resultado[chave] for chave in
+            ('effective_area', 'equivalent_area', 'contact_area', 'p_max', 'p_lim', 'iterations', 'converged')}
@@ -0,0 +1,137 @@
+# engine/winkler_random_field.py
+
+"""
+Monte Carlo do modelo de Winkler com ks(x) aleatório e correlacionado.
+
+Um único KS_KN_M3 esconde a variabilidade do solo ao longo do mat. Aqui
+ks(x) é um campo lognormal: ln ks = μ(x) + σ·G(x), com G gaussiano de média
+nula, variância unitária e correlação exponencial exp(-|Δx|/θ) ou gaussiana
+exp(-(Δx/θ)²). A média de ks(x) é o ks informado (escalar ou perfil) e σ
+vem do coeficiente de variação, σ² = ln(1 + cov²).
+
+G é gerado pela expansão de Karhunen-Loève discreta: autovetores da matriz
+de correlação nodal, truncados na fração de variância pedida e reescalados
+para manter a variância unitária em cada nó. A base depende só de
+comprimento, nós, θ e do tipo de correlação e fica em um cache LRU; cada
+realização custa um produto (termos × nós).
+
+As realizações são resolvidas em blocos por `WinklerModel.solve_ks_scenarios`
+(fatoração pentadiagonal em lote) e o Leff sai de `effective_length` para o
+bloco inteiro.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from engine.winkler import (
+    BATCH_BLOCK, NODE, NODES, TON_TO_N, WinklerModel, effective_length, load_vector, profile,
+)
+
+EXPONENTIAL = 'exponential'
+GAUSSIAN = 'gaussian'
+
+REALIZATIONS = 2000
+VARIANCE_FRACTION = 0.99
+BASIS_CACHE_SIZE = 16
+PERCENTIS = (5, 50, 95)
+
+
+# --- BASE DE KARHUNEN-LOÈVE ---
+def correlation_matrix(x, correlation_length, correlation=EXPONENTIAL) -> np.ndarray:
+    """Correlação ρ(|xi - xj|) entre os nós."""
+    distancia = np.abs(x[:, np.newaxis] - x[np.newaxis, :]) / correlation_length
+    if correlation == EXPONENTIAL:
+        return np.exp(-distancia)
+    if correlation == GAUSSIAN:
+        return np.exp(-distancia**2)
+    raise ValueError(f"Correlação desconhecida: {correlation}")
+
+
+@lru_cache(maxsize=BASIS_CACHE_SIZE)
+def kl_basis(length, nodes, correlation_length, correlation=EXPONENTIAL, variance_fraction=VARIANCE_FRACTION):
+    """
+    Base (termos, nós), somente leitura, tal que ξ @ base, com ξ ~ N(0, 1),
+    é uma realização de G nos nós.
+    """
+    x = np.linspace(0.0, length, nodes)
+    autovalores, autovetores = np.linalg.eigh(correlation_matrix(x, correlation_length, correlation))
+    autovalores, autovetores = np.clip(autovalores[::-1], 0.0, None), autovetores[:, ::-1]
+    acumulada = np.cumsum(autovalores) / autovalores.sum()
+    termos = int(np.searchsorted(acumulada, variance_fraction)) + 1
+    base = (autovetores[:, :termos] * np.sqrt(autovalores[:termos])).T
+    base /= np.sqrt((base**2).sum(axis=0))   # variância unitária em cada nó após o truncamento
+    base.setflags(write=False)
+    return base
+
+
+def basis_cache_info():
+    return kl_basis.cache_info()
+
+
+def lognormal_ks(mean_ks, cov, gaussian):
+    """ks lognormal com média `mean_ks` (nodal) e coeficiente de variação `cov`."""
+    sigma = np.sqrt(np.log1p(cov**2))
+    return mean_ks * np.exp(sigma * gaussian - sigma**2 / 2)
+
+
+# --- ESTATÍSTICAS ---
+def summarize(amostras) -> dict:
+    resumo = {'mean': float(np.mean(amostras)), 'std': float(np.std(amostras, ddof=1))}
+    resumo.update({f'p{q}': float(v) for q, v in zip(PERCENTIS, np.percentile(amostras, PERCENTIS))})
+    return resumo
+
+
+def exceedance_probability(amostras, limites):
+    """P(X > limite) empírica para cada limite (escalar ou array)."""
+    ordenadas = np.sort(np.asarray(amostras, dtype=np.float64))
+    acima = ordenadas.size - np.searchsorted(ordenadas, limites, side='right')
+    return acima / ordenadas.size
+
+
+# --- MONTE CARLO ---
+def winkler_random_field(
+    force_ton, length, width, thickness, young_gpa, ks_kn_m3, p_lim_abs_pa, patch_width=None,
+    cov=0.3, correlation_length=2.0, realizations=REALIZATIONS, nodes=NODES, method=NODE,
+    correlation=EXPONENTIAL, variance_fraction=VARIANCE_FRACTION, seed=None, block=BATCH_BLOCK,
+) -> dict:
+    """
+    Leff e p_max de `winkler_leff` para `realizations` campos ks(x) com média
+    `ks_kn_m3`, coeficiente de variação `cov` e comprimento de correlação
+    `correlation_length` (m). Devolve as amostras, os resumos (média, desvio
+    e percentis), a probabilidade de p_max exceder p_lim e o resultado
+    determinístico com o ks médio. Realizações sem contato (p_max < p_lim,
+    em que o critério NODE devolve -dx) entram com Leff nulo.
+    """
+    if cov < 0 or correlation_length <= 0:
+        raise ValueError("cov deve ser não negativo e correlation_length positivo.")
+    if realizations < 2:
+        raise ValueError("São necessárias ao menos 2 realizações.")
+    model = WinklerModel(length, width, thickness, young_gpa, ks_kn_m3, nodes)
+    media = np.broadcast_to(profile(model.x, ks_kn_m3), model.x.shape)
+    base = kl_basis(model.length, model.nodes, float(correlation_length), correlation, float(variance_fraction))
+    q = load_vector(model.x, model.length, force_ton * TON_TO_N, model.dx, patch_width)
+    rng = np.random.default_rng(seed)
+
+    leff_total, p_max = np.empty(realizations), np.empty(realizations)
+    for inicio in range(0, realizations, block):
+        fatia = slice(inicio, min(inicio + block, realizations))
+        ks = lognormal_ks(media, cov, rng.standard_normal((fatia.stop - inicio, base.shape[0])) @ base)
+        p = model.solve_ks_scenarios(ks, q)['p']
+        leff_total[fatia] = np.maximum(effective_length(p.T, p_lim_abs_pa, model.dx, method), 0.0)
+        p_max[fatia] = p.max(axis=-1)
+
+    leff = leff_total / 2
+    deterministico = model.leff(force_ton, p_lim_abs_pa, patch_width, method)
+    deterministico['leff_total'] = np.maximum(deterministico['leff_total'], 0.0)
+    deterministico['leff'] = deterministico['leff_total'] / 2
+    return {
+        "leff": leff,
+        "leff_total": leff_total,
+        "p_max": p_max,
+        "p_lim": p_lim_abs_pa,
+        "stats": {"leff": summarize(leff), "p_max": summarize(p_max)},
+        "prob_exceed": float(exceedance_probability(p_max, p_lim_abs_pa)),
+        "terms": base.shape[0],
+        "deterministic": {k: float(deterministico[k]) for k in ("leff", "leff_total", "p_max")},
+    }
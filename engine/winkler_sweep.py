@@ -0,0 +1,167 @@
+# engine/winkler_sweep.py
+
+"""
+Varreduras grandes do modelo de Winkler em vários processos, com entradas e
+resultados em memória compartilhada.
+
+Uma grade comprimento × espessura × E × ks × carga chega fácil a 10⁵
+soluções. Os casos são ordenados pela chave de rigidez (comprimento,
+largura, espessura, E, ks e largura da faixa): dentro de um grupo só mudam
+a força e o p_lim, então cada grupo custa uma fatoração e uma solução
+unitária, e o Leff de todos os seus casos sai do pós-processamento da
+pressão unitária escalada pela força, em lotes de até CASOS_POR_LOTE casos
+para limitar a memória (nós × casos) do lote.
+
+Os grupos são repartidos em trechos contíguos da ordenação entre os
+processos; um grupo maior que um trecho é partido entre vários, e cada
+trecho refaz apenas a fatoração e a solução unitária do seu pedaço. As
+colunas de entrada, a ordenação e as colunas de saída ficam em
+`multiprocessing.shared_memory`: cada processo recebe só os nomes dos
+blocos e os limites do seu trecho e grava os resultados no lugar, sem
+serializar arrays.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from engine.winkler import NODE, NODES, TON_TO_N, WinklerModel, effective_length
+
+COLUNAS_ENTRADA = ('force_ton', 'length', 'width', 'thickness', 'young_gpa', 'ks_kn_m3', 'p_lim_abs_pa',
+                   'patch_width')
+COLUNAS_RIGIDEZ = ('length', 'width', 'thickness', 'young_gpa', 'ks_kn_m3', 'patch_width')
+COLUNAS_SAIDA = ('leff_total', 'p_max')
+
+TRECHOS_POR_PROCESSO = 4
+CASOS_POR_LOTE = 4096
+
+
+# --- MEMÓRIA COMPARTILHADA ---
+def _criar_bloco(valores):
+    bloco = shared_memory.SharedMemory(create=True, size=max(valores.nbytes, 1))
+    np.ndarray(valores.shape, dtype=valores.dtype, buffer=bloco.buf)[...] = valores
+    return bloco
+
+
+def _abrir(nomes, n):
+    """Anexa os blocos pelo nome; devolve os blocos e as vistas (arrays)."""
+    blocos, arrays = [], {}
+    for coluna, (nome, dtype) in nomes.items():
+        bloco = shared_memory.SharedMemory(name=nome)
+        blocos.append(bloco)
+        arrays[coluna] = np.ndarray((n,), dtype=dtype, buffer=bloco.buf)
+    return blocos, arrays
+
+
+# --- GRUPOS DE RIGIDEZ ---
+def _chaves(colunas, indices=slice(None)):
+    """Chave de rigidez por caso (a carga pontual, faixa NaN, vira -1)."""
+    return np.stack([np.nan_to_num(colunas[c][indices], nan=-1.0) for c in COLUNAS_RIGIDEZ], axis=1)
+
+
+def _inicios_grupo(chaves_ordenadas):
+    novo = np.ones(len(chaves_ordenadas), dtype=bool)
+    novo[1:] = np.any(chaves_ordenadas[1:] != chaves_ordenadas[:-1], axis=1)
+    return np.flatnonzero(novo)
+
+
+# --- TRABALHO DE CADA PROCESSO ---
+def _processar_trecho(nomes, n, inicio, fim, nodes, method):
+    """Resolve os grupos de rigidez em ordem[inicio:fim] e grava as saídas."""
+    blocos, arrays = _abrir(nomes, n)
+    try:
+        ordem = arrays['ordem'][inicio:fim].copy()
+        chaves = _chaves(arrays, ordem)
+        limites = np.append(_inicios_grupo(chaves), len(ordem))
+        for a, b in zip(limites[:-1], limites[1:]):
+            length, width, thickness, young_gpa, ks, patch = chaves[a]
+            model = WinklerModel(length, width, thickness, young_gpa, ks, nodes)
+            unitaria = model.soil_pressure(model.unit_deflection(None if patch < 0 else patch))
+            for lote in range(a, b, CASOS_POR_LOTE):
+                casos = ordem[lote:min(lote + CASOS_POR_LOTE, b)]
+                p = unitaria[:, np.newaxis] * (arrays['force_ton'][casos] * TON_TO_N)
+                arrays['leff_total'][casos] = effective_length(p, arrays['p_lim_abs_pa'][casos], model.dx, method)
+                arrays['p_max'][casos] = p.max(axis=0)
+        return fim - inicio
+    finally:
+        del arrays
+        for bloco in blocos:
+            bloco.close()
+
+
+def _trechos(chaves_ordenadas, processos):
+    """
+    Fronteiras (em casos) de trechos com ~o mesmo número de casos. Cada
+    corte avança até o início do grupo seguinte quando ele está a menos de
+    um trecho; senão o grupo é partido no próprio corte.
+    """
+    n = len(chaves_ordenadas)
+    inicios_grupo = np.append(_inicios_grupo(chaves_ordenadas), n)
+    tamanho = -(-n // (processos * TRECHOS_POR_PROCESSO))
+    alvo = np.arange(tamanho, n, tamanho)
+    seguinte = inicios_grupo[np.searchsorted(inicios_grupo, alvo)]
+    cortes = np.where(seguinte - alvo < tamanho, seguinte, alvo)
+    return np.unique(np.concatenate([[0], cortes, [n]]))
+
+
+# --- VARREDURA ---
+def sweep_grid(**eixos):
+    """Produto cartesiano dos eixos dados, como colunas planas (ver COLUNAS_ENTRADA)."""
+    nomes = list(eixos)
+    malhas = np.meshgrid(*(np.atleast_1d(np.asarray(eixos[nome], dtype=np.float64)) for nome in nomes), indexing='ij')
+    return {nome: malha.ravel() for nome, malha in zip(nomes, malhas)}
+
+
+def winkler_sweep(casos, nodes=NODES, method=NODE, processos=None) -> dict:
+    """
+    Leff total e p_max de `winkler_leff` para todos os casos. `casos` é um
+    dicionário com as colunas de COLUNAS_ENTRADA (escalares ou arrays,
+    broadcast entre si; `patch_width` ausente ou NaN = carga pontual).
+    `processos=1` roda no processo atual.
+    """
+    colunas = dict(casos)
+    colunas.setdefault('patch_width', np.nan)
+    faltantes = [coluna for coluna in COLUNAS_ENTRADA if coluna not in colunas]
+    if faltantes:
+        raise ValueError(f"Colunas ausentes na varredura: {', '.join(faltantes)}")
+    valores = np.broadcast_arrays(*(np.asarray(colunas[c], dtype=np.float64) for c in COLUNAS_ENTRADA))
+    forma = valores[0].shape
+    entradas = {c: np.ascontiguousarray(v.ravel()) for c, v in zip(COLUNAS_ENTRADA, valores)}
+    n = entradas['force_ton'].size
+    if n == 0:
+        resultado = {c: np.empty(forma) for c in COLUNAS_SAIDA}
+        resultado['leff'] = np.empty(forma)
+        resultado['groups'] = 0
+        return resultado
+
+    chaves = _chaves(entradas)
+    ordem = np.lexsort(chaves.T[::-1])
+    processos = processos or os.cpu_count() or 1
+    cortes = _trechos(chaves[ordem], processos)
+
+    dados = {**entradas, 'ordem': ordem.astype(np.int64)}
+    dados.update({c: np.full(n, np.nan) for c in COLUNAS_SAIDA})
+    blocos = {}
+    try:
+        for coluna, array in dados.items():
+            blocos[coluna] = _criar_bloco(array)
+        nomes = {coluna: (bloco.name, dados[coluna].dtype) for coluna, bloco in blocos.items()}
+        tarefas = [(nomes, n, int(a), int(b), nodes, method) for a, b in zip(cortes[:-1], cortes[1:])]
+        if processos == 1 or len(tarefas) <= 1:
+            for tarefa in tarefas:
+                _processar_trecho(*tarefa)
+        else:
+            with ProcessPoolExecutor(max_workers=processos) as executor:
+                list(executor.map(_processar_trecho, *zip(*tarefas)))
+        resultado = {
+            c: np.ndarray((n,), dtype=np.float64, buffer=blocos[c].buf).copy().reshape(forma) for c in COLUNAS_SAIDA
+        }
+    finally:
+        for bloco in blocos.values():
+            bloco.close()
+            bloco.unlink()
+    resultado['leff'] = resultado['leff_total'] / 2
+    resultado['groups'] = len(_inicios_grupo(chaves[ordem]))
+    return resultado
